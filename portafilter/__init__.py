@@ -1,3 +1,4 @@
 from .validator import Validator
+from .plan import ValidationPlan
 from .rules import Rule, Ruleset
 from .decorators import validate
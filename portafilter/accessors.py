@@ -0,0 +1,272 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import fields, is_dataclass
+from typing import Any, FrozenSet, Iterable, Optional, Tuple
+
+
+class Accessor(ABC):
+
+    @abstractmethod
+    def get(self, data: Any, key: str, index: Optional[int]) -> Tuple[Any, bool]:
+        """Get the child value details
+
+        Arguments:
+            data (Any) -- The container.
+            key (str) -- The key of the path step.
+            index (Optional[int]) -- The list index of the path step, None if the key is not numeric.
+
+        Returns:
+            Tuple[Any, bool] -- The value and the existed flag.
+        """
+        pass
+
+    def iterate(self, data: Any) -> Optional[Iterable[Any]]:
+        """Get the list items to expand the wildcards into
+
+        Arguments:
+            data (Any) -- The container.
+
+        Returns:
+            Optional[Iterable[Any]] -- The items, None if the container is not a list.
+        """
+        return None
+
+
+class MappingAccessor(Accessor):
+
+    def get(self, data: Any, key: str, index: Optional[int]) -> Tuple[Any, bool]:
+        """Get the child value details
+
+        Arguments:
+            data (Any) -- The mapping.
+            key (str) -- The key of the path step.
+            index (Optional[int]) -- The list index of the path step.
+
+        Returns:
+            Tuple[Any, bool]
+        """
+        if key in data:
+            return data[key], True
+
+        return None, False
+
+
+class SequenceAccessor(Accessor):
+
+    def get(self, data: Any, key: str, index: Optional[int]) -> Tuple[Any, bool]:
+        """Get the child value details
+
+        Arguments:
+            data (Any) -- The sequence.
+            key (str) -- The key of the path step.
+            index (Optional[int]) -- The list index of the path step.
+
+        Returns:
+            Tuple[Any, bool]
+        """
+        if index is not None and index < len(data):
+            return data[index], True
+
+        return None, False
+
+    def iterate(self, data: Any) -> Optional[Iterable[Any]]:
+        """Get the list items to expand the wildcards into
+
+        Arguments:
+            data (Any) -- The sequence.
+
+        Returns:
+            Optional[Iterable[Any]]
+        """
+        return data
+
+
+class TupleAccessor(SequenceAccessor):
+
+    def get(self, data: Any, key: str, index: Optional[int]) -> Tuple[Any, bool]:
+        """Get the child value details
+
+        The named tuples are also accessed by their field names.
+
+        Arguments:
+            data (Any) -- The tuple.
+            key (str) -- The key of the path step.
+            index (Optional[int]) -- The list index of the path step.
+
+        Returns:
+            Tuple[Any, bool]
+        """
+        if index is None and key in getattr(data, '_fields', ()):
+            return getattr(data, key), True
+
+        return super().get(data, key, index)
+
+
+class AttributeAccessor(Accessor):
+
+    def __init__(self, names: Optional[Iterable[str]] = None):
+        """The init method
+
+        Only the declared attributes are accessed, so the methods, the properties and the lazy loaded relations
+        of the objects are never called.
+
+        Keyword Arguments:
+            names {Optional[Iterable[str]]} -- The attribute names to access, the public dataclass fields and
+            __slots__ names of each type by default (default: {None})
+        """
+        self._names = frozenset(names) if names is not None else None
+        # The declared attribute names by the type.
+        self._type_names = {}
+
+    def get(self, data: Any, key: str, index: Optional[int]) -> Tuple[Any, bool]:
+        """Get the child value details
+
+        The attributes which are not declared and the callable values are missing.
+
+        Arguments:
+            data (Any) -- The object.
+            key (str) -- The key of the path step.
+            index (Optional[int]) -- The list index of the path step.
+
+        Returns:
+            Tuple[Any, bool]
+        """
+        names = self._names if self._names is not None else self._get_names(type(data))
+
+        if key not in names:
+            return None, False
+
+        try:
+            value = getattr(data, key)
+
+        except AttributeError as e:
+            return None, False
+
+        if callable(value):
+            return None, False
+
+        return value, True
+
+    def _get_names(self, data_type: type) -> FrozenSet[str]:
+        """Get the declared attribute names of the type
+
+        Arguments:
+            data_type (type)
+
+        Returns:
+            FrozenSet[str]
+        """
+        names = self._type_names.get(data_type)
+
+        if names is None:
+            names = self._type_names[data_type] = frozenset(
+                _name for _name in get_declared_names(data_type) if not _name.startswith('_')
+            )
+
+        return names
+
+
+def get_declared_names(data_type: type) -> Tuple[str, ...]:
+    """Get the dataclass fields and the __slots__ names of the type and its bases
+
+    Arguments:
+        data_type (type)
+
+    Returns:
+        Tuple[str, ...]
+    """
+    names = [_field.name for _field in fields(data_type)] if is_dataclass(data_type) else []
+
+    for _type in data_type.__mro__:
+        slots = _type.__dict__.get('__slots__', ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+
+    return tuple(_name for _name in names if _name not in ['__dict__', '__weakref__'])
+
+
+class AccessorRegistry:
+
+    # The accessors by the registered types, the later registered types take precedence.
+    _accessors = [
+        (Mapping, MappingAccessor()),
+        ((str, bytes, bytearray), None),
+        (tuple, TupleAccessor()),
+        (Sequence, SequenceAccessor()),
+    ]
+
+    # The scalar types which are never accessed into.
+    _scalar_types = (str, bytes, bytearray, bool, int, float, complex, type(None))
+
+    _attribute_accessor = AttributeAccessor()
+
+    # The resolved accessors by the data type.
+    _cache = {}
+
+    @classmethod
+    def register(cls, data_type: Any, accessor: Optional[Accessor]) -> None:
+        """Register an accessor
+
+        Arguments:
+            data_type (Any) -- The type or the tuple of the types.
+            accessor (Optional[Accessor]) -- The accessor, None to never access into the type.
+        """
+        cls._accessors = [(data_type, accessor)] + cls._accessors
+        cls._cache = {}
+
+    @classmethod
+    def unregister(cls, data_type: Any) -> None:
+        """Unregister the accessors of a type
+
+        Arguments:
+            data_type (Any) -- The type or the tuple of the types which is registered.
+        """
+        cls._accessors = [(_type, _accessor) for _type, _accessor in cls._accessors if _type != data_type]
+        cls._cache = {}
+
+    @classmethod
+    def get(cls, data: Any) -> Optional[Accessor]:
+        """Get the accessor of the data
+
+        The plain dictionaries and lists are accessed directly by the walkers, the accessors are the fallback for
+        the other containers. The dataclasses and the __slots__ objects are accessed by their declared attributes,
+        the other objects, e.g. the ORM rows, need a registered accessor, e.g. an AttributeAccessor of the names.
+
+        Arguments:
+            data (Any)
+
+        Returns:
+            Optional[Accessor] -- None if the data has no children.
+        """
+        data_type = type(data)
+
+        try:
+            return cls._cache[data_type]
+
+        except KeyError as e:
+            accessor = cls._resolve(data)
+            cls._cache[data_type] = accessor
+            return accessor
+
+    @classmethod
+    def _resolve(cls, data: Any) -> Optional[Accessor]:
+        """Resolve the accessor of the data type
+
+        Arguments:
+            data (Any)
+
+        Returns:
+            Optional[Accessor]
+        """
+        data_type = type(data)
+
+        for registered_type, accessor in cls._accessors:
+            if issubclass(data_type, registered_type):
+                return accessor
+
+        if issubclass(data_type, cls._scalar_types):
+            return None
+
+        if get_declared_names(data_type):
+            return cls._attribute_accessor
+
+        return None
@@ -0,0 +1,369 @@
+import gzip
+from hashlib import sha1
+from importlib import import_module
+from json import dumps, loads
+from random import Random
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from weakref import WeakKeyDictionary
+from portafilter.plan import ValidationPlan
+from portafilter.rule_registry import RuleRegistry
+
+
+class PayloadCapture:
+
+    def __init__(self, path: str, sample_rate: float = 0.01, max_bytes: int = 64 * 1024 * 1024,
+                 redact: Optional[Callable[[str, Any], Any]] = None, seed: Optional[int] = None):
+        """The init method
+
+        The sampled payloads and their schemas are appended to a gzip compressed JSON lines file, each schema
+        is written once and the payloads refer to it by its id.
+
+        Arguments:
+            path {str} -- The path of the corpus file.
+
+        Keyword Arguments:
+            sample_rate {float} -- The fraction of the validated payloads which are captured (default: {0.01})
+            max_bytes {int} -- The capture stops when the compressed corpus reaches it (default: {64 MiB})
+            redact {Optional[Callable[[str, Any], Any]]} -- Called with the dotted path and the value of each
+            field, its return value is written instead of the value (default: {None})
+            seed {Optional[int]} -- The seed of the sampling (default: {None})
+        """
+        self._path = path
+        self._sample_rate = sample_rate
+        self._max_bytes = max_bytes
+        self._redact = redact
+        self._random = Random(seed)
+        self._lock = Lock()
+        self._file = None
+        self._is_full = False
+        self._schema_ids = WeakKeyDictionary()
+        self._written_schema_ids = set()
+        self._captured = 0
+        self._skipped = 0
+
+    def capture(self, data: Any, plan: ValidationPlan, errors: dict) -> bool:
+        """Capture the payload by the sample rate
+
+        Arguments:
+            data {Any}
+            plan {ValidationPlan}
+            errors {dict} -- The validation errors of the payload.
+
+        Returns:
+            bool -- The payload is captured.
+        """
+        # The sampling decision takes no lock, only the captured payloads are serialized and written under it.
+        if self._is_full or self._random.random() >= self._sample_rate:
+            return False
+
+        try:
+            schema_id, schema_line = self._get_schema(plan)
+            payload_line = dumps({
+                'type': 'payload',
+                'schema': schema_id,
+                'data': self._redact_data(data) if self._redact else data,
+                'error_attributes': len(errors),
+                'error_messages': sum(len(_messages) for _messages in errors.values()),
+            }, separators=(',', ':'))
+
+        except (TypeError, ValueError) as e:
+            # The payloads which are not JSON serializable are not captured, e.g. the objects.
+            with self._lock:
+                self._skipped += 1
+
+            return False
+
+        with self._lock:
+            if self._is_full:
+                return False
+
+            lines = [schema_line, payload_line] if schema_id not in self._written_schema_ids else [payload_line]
+            self._write(lines)
+            self._written_schema_ids.add(schema_id)
+            self._captured += 1
+
+        return True
+
+    def _get_schema(self, plan: ValidationPlan) -> Tuple[str, str]:
+        """Get the id and the line of the schema
+
+        Arguments:
+            plan {ValidationPlan}
+
+        Returns:
+            Tuple[str, str]
+        """
+        schema = self._schema_ids.get(plan)
+
+        if schema is None:
+            rules = dumps(serialize_rules(plan), separators=(',', ':'), sort_keys=True)
+            schema_id = get_schema_id(rules)
+            schema = (schema_id, f'{{"type":"schema","id":"{schema_id}","rules":{rules}}}')
+
+            with self._lock:
+                self._schema_ids[plan] = schema
+
+        return schema
+
+    def _write(self, lines: list) -> None:
+        """Append the lines to the corpus
+
+        Arguments:
+            lines {list}
+        """
+        if self._file is None:
+            self._file = gzip.open(self._path, 'ab')
+
+        for line in lines:
+            self._file.write(line.encode() + b'\n')
+
+        # The compressed bytes which are flushed to the disk so far.
+        if self._file.fileobj.tell() >= self._max_bytes:
+            self._is_full = True
+            self._file.close()
+
+    def _redact_data(self, data: Any) -> Any:
+        """Copy the data with the redacted fields
+
+        Arguments:
+            data {Any}
+
+        Returns:
+            Any
+        """
+        holder = [None]
+        stack = [(holder, 0, '', data)]
+
+        while stack:
+            parent, slot, path, value = stack.pop()
+
+            if isinstance(value, dict):
+                parent[slot] = {}
+                stack.extend((parent[slot], _key, f'{path}.{_key}' if path else str(_key), _value)
+                             for _key, _value in value.items())
+
+            elif isinstance(value, list):
+                parent[slot] = [None] * len(value)
+                stack.extend((parent[slot], _index, f'{path}.{_index}' if path else str(_index), _value)
+                             for _index, _value in enumerate(value))
+
+            else:
+                parent[slot] = self._redact(path, value)
+
+        return holder[0]
+
+    def get_captured(self) -> int:
+        """Get the number of the captured payloads
+
+        Returns:
+            int
+        """
+        return self._captured
+
+    def get_skipped(self) -> int:
+        """Get the number of the sampled payloads which are not JSON serializable
+
+        Returns:
+            int
+        """
+        return self._skipped
+
+    def is_full(self) -> bool:
+        """Check the corpus reached the max bytes
+
+        Returns:
+            bool
+        """
+        return self._is_full
+
+    def close(self) -> None:
+        """Close the corpus file
+        """
+        with self._lock:
+            if self._file is not None and not self._is_full:
+                self._file.close()
+
+            self._file = None
+
+
+def serialize_rules(plan: ValidationPlan) -> Dict[str, list]:
+    """Serialize the parsed rules of the plan
+
+    The registered rules are written as the rule strings, the other rules by their import path and params.
+
+    Arguments:
+        plan {ValidationPlan}
+
+    Returns:
+        Dict[str, list]
+    """
+    serialized = {}
+
+    for attribute, ruleset in plan.get_rules():
+        rules = []
+
+        for rule_name, rule in ruleset.get_rules().items():
+            rule_class = type(rule)
+            params = rule.get_params()
+
+            if RuleRegistry.get(rule_name) is rule_class:
+                rules.append(f"{rule_name}:{','.join(params)}" if params else rule_name)
+
+            else:
+                rules.append({'class': f'{rule_class.__module__}:{rule_class.__qualname__}', 'params': params})
+
+        serialized[attribute] = rules
+
+    return serialized
+
+
+# The schema ids by the normalized rules which the plans are compiled from, e.g. the tuples of the attributes
+# and the rule strings, so the plans which are compiled from the equal rules share the id.
+_plan_schema_ids = {}
+_plan_schema_ids_lock = Lock()
+_plan_schema_ids_size = 1024
+
+
+def get_plan_schema_id(plan: ValidationPlan) -> str:
+    """Get the label of the schema of the plan, its name or the id of its rules
+
+    The validators which compile the equal rules on each validation, e.g. from an inline dictionary, share the
+    id, the rules are serialized once. The rules which are not JSON serializable, e.g. the custom rules with the
+    compiled patterns, get the id of their repr.
+
+    Arguments:
+        plan {ValidationPlan}
+
+    Returns:
+        str
+    """
+    schema_id = plan.get_name()
+
+    if schema_id is not None:
+        return schema_id
+
+    key = _get_rules_key(plan)
+    schema_id = _plan_schema_ids.get(key) if key is not None else None
+
+    if schema_id is not None:
+        return schema_id
+
+    serialized = serialize_rules(plan)
+
+    try:
+        schema_id = get_schema_id(dumps(serialized, separators=(',', ':'), sort_keys=True))
+
+    except (TypeError, ValueError) as e:
+        schema_id = get_schema_id(repr(serialized))
+
+    if key is not None:
+        with _plan_schema_ids_lock:
+            if len(_plan_schema_ids) >= _plan_schema_ids_size:
+                del _plan_schema_ids[next(iter(_plan_schema_ids))]
+
+            _plan_schema_ids[key] = schema_id
+
+    return schema_id
+
+
+def _get_rules_key(plan: ValidationPlan) -> Optional[tuple]:
+    """Get the cache key of the rules which the plan is compiled from
+
+    The rule strings are the keys themselves, the rule classes and instances are keyed by their identity and
+    the parsed rule lists by their shared rules.
+
+    Arguments:
+        plan {ValidationPlan}
+
+    Returns:
+        Optional[tuple] -- None if the rules are not hashable.
+    """
+    source_rules = plan.get_source_rules()
+
+    if isinstance(source_rules, dict):
+        key = tuple((_attribute, tuple(_rules) if isinstance(_rules, list) else _rules)
+                    for _attribute, _rules in source_rules.items())
+
+    else:
+        key = tuple((_attribute, tuple(_ruleset.get_rules().items())) for _attribute, _ruleset in plan.get_rules())
+
+    try:
+        hash(key)
+
+    except TypeError as e:
+        return None
+
+    return key
+
+
+def get_schema_id(rules: str) -> str:
+    """Get the id of the schema
+
+    Arguments:
+        rules {str} -- The JSON of the serialized rules with the sorted keys.
+
+    Returns:
+        str
+    """
+    return sha1(rules.encode()).hexdigest()[:16]
+
+
+def deserialize_rules(serialized: Dict[str, list]) -> Dict[str, list]:
+    """Get the validation rules from the serialized rules
+
+    Arguments:
+        serialized {Dict[str, list]}
+
+    Returns:
+        Dict[str, list]
+    """
+    rules = {}
+
+    for attribute, serialized_rules in serialized.items():
+        rules[attribute] = []
+
+        for rule in serialized_rules:
+            if isinstance(rule, dict):
+                module_name, qualname = rule['class'].split(':')
+                rule_class = import_module(module_name)
+
+                for name in qualname.split('.'):
+                    rule_class = getattr(rule_class, name)
+
+                rule = rule_class(*rule['params'])
+
+            rules[attribute].append(rule)
+
+    return rules
+
+
+def read_corpus(path: str) -> Iterator[Tuple[Dict[str, list], dict]]:
+    """Read the captured payloads with their schemas
+
+    Arguments:
+        path {str}
+
+    Returns:
+        Iterator[Tuple[Dict[str, list], dict]] -- The tuples of the serialized rules and the payload record.
+    """
+    schemas = {}
+
+    with gzip.open(path, 'rb') as corpus_file:
+        lines = iter(corpus_file)
+
+        while True:
+            try:
+                line = next(lines)
+
+            except (StopIteration, EOFError) as e:
+                # The last member is truncated if the process is stopped before the corpus is closed.
+                return
+
+            record = loads(line)
+
+            if record['type'] == 'schema':
+                schemas[record['id']] = record['rules']
+
+            else:
+                yield schemas[record['schema']], record
@@ -4,6 +4,9 @@ from .validator import Validator
 
 def validate(**rules):
 
+    # The rules are compiled once for all the calls of the decorated function.
+    plan = Validator.compile(rules)
+
     def args_validator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
@@ -17,7 +20,7 @@ def validate(**rules):
 
             validator = Validator(
                 data={**data, **kwargs},
-                rules=rules
+                rules=plan
             )
 
             # It raises the ValidationError
@@ -8,3 +8,9 @@ class ValueType(Enum):
     NUMERIC = 'numeric'
     DICT = 'dict'
     BOOLEAN = 'boolean'
+
+
+class PathStepType(Enum):
+    KEY = 'key'
+    INDEX = 'index'
+    WILDCARD = 'wildcard'
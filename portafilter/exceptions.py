@@ -9,6 +9,10 @@ class InvalidRuleParam(Exception):
     pass
 
 
+class ImmutableRule(Exception):
+    pass
+
+
 class ValidationError(Exception):
 
     def __init__(self, errors: Optional[dict] = None):
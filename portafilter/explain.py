@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, Tuple
+from portafilter.enums import PathStepType
+
+
+class PlanExplanation:
+
+    def __init__(self, steps: Tuple[tuple, ...], added_rules: Dict[str, List[str]], fan_out: int):
+        """The init method
+
+        The counts are the estimates for the payloads which have fan_out items in each list. The costs are
+        the visits multiplied by the relative costs of the rule classes, the rules which are skipped for the
+        missing values are counted too.
+
+        Arguments:
+            steps {Tuple[tuple, ...]} -- The steps of the plan, as the tuples of the attribute, the compiled
+            path, the ruleset and the dependencies.
+            added_rules {Dict[str, List[str]]} -- The names of the rules which the plan added by the attribute.
+            fan_out {int} -- The assumed number of the items of each list.
+        """
+        self._fan_out = fan_out
+        self._traversal = {}
+        self._attributes = []
+        self._rule_classes = {}
+
+        for attribute, path, ruleset, dependencies in steps:
+            prefix = []
+            wildcards = 0
+
+            # The prefixes which the paths share are walked once, like by the path trie.
+            for step_type, key, index in path.get_steps():
+                is_wildcard = step_type is PathStepType.WILDCARD
+                wildcards += is_wildcard
+                prefix.append('*' if is_wildcard else key)
+                prefix_path = '.'.join(prefix)
+
+                if prefix_path not in self._traversal:
+                    self._traversal[prefix_path] = {
+                        'path': prefix_path,
+                        'visits': fan_out ** wildcards,
+                        'wildcard': is_wildcard,
+                        'attributes': [],
+                    }
+
+                self._traversal[prefix_path]['attributes'].append(attribute)
+
+            visits = fan_out ** wildcards
+            rules = []
+
+            for rule_name, rule in ruleset.get_rules().items():
+                rule_class = type(rule).__name__
+                rules.append({
+                    'name': rule_name,
+                    'class': rule_class,
+                    'cost': rule.cost,
+                    'added': rule_name in added_rules.get(attribute, []),
+                })
+
+                entry = self._rule_classes.setdefault(rule_class, {'class': rule_class, 'cost': rule.cost, 'calls': 0})
+                entry['calls'] += visits
+
+            self._attributes.append({
+                'attribute': attribute,
+                'visits': visits,
+                'rules': rules,
+                'dependencies': [{'rule': _rule_name, 'attribute': _path.get_path()}
+                                 for _rule_name, _path, _ in dependencies],
+                'cost': visits * sum(_rule['cost'] for _rule in rules),
+            })
+
+        self._cost = sum(_attribute['cost'] for _attribute in self._attributes)
+
+    def get_report(self) -> Dict[str, Any]:
+        """Get the structured explanation
+
+        Returns:
+            Dict[str, Any] -- The assumed fan-out, the total cost, the traversed paths in the walk order,
+            the wildcards, the attributes with their rules in the evaluation order and the rule classes sorted
+            by the share of the cost.
+        """
+        rule_classes = []
+
+        for entry in self._rule_classes.values():
+            total = entry['calls'] * entry['cost']
+            rule_classes.append(dict(entry, total=total, share=total / self._cost if self._cost else 0))
+
+        return {
+            'fan_out': self._fan_out,
+            'cost': self._cost,
+            'traversal': list(self._traversal.values()),
+            'wildcards': [_entry for _entry in self._traversal.values() if _entry['wildcard']],
+            'attributes': self._attributes,
+            'rule_classes': sorted(rule_classes, key=lambda _entry: -_entry['total']),
+        }
+
+    def render(self) -> str:
+        """Render the explanation as the text tables
+
+        Returns:
+            str
+        """
+        report = self.get_report()
+        lines = [f"attributes: {len(report['attributes'])}, fan-out: {report['fan_out']}, cost: {report['cost']}"]
+
+        lines.append('')
+        lines.append(f"{'path':<48}{'visits':>10}")
+
+        for entry in report['traversal']:
+            lines.append(f"{entry['path']:<48}{entry['visits']:>10}{'  wildcard' if entry['wildcard'] else ''}")
+
+        lines.append('')
+        lines.append(f"{'attribute':<48}{'visits':>10}{'cost':>12}  rules")
+
+        for entry in report['attributes']:
+            rules = ' > '.join(f"{_rule['name']}{' (added)' if _rule['added'] else ''}" for _rule in entry['rules'])
+            lines.append(f"{entry['attribute']:<48}{entry['visits']:>10}{entry['cost']:>12}  {rules}")
+
+            for dependency in entry['dependencies']:
+                lines.append(f"{'':<72}{dependency['rule']} compares with {dependency['attribute']}")
+
+        lines.append('')
+        lines.append(f"{'rule class':<48}{'calls':>10}{'total':>12}{'%':>8}")
+
+        for entry in report['rule_classes']:
+            lines.append(f"{entry['class']:<48}{entry['calls']:>10}{entry['total']:>12}{entry['share'] * 100:>8.1f}")
+
+        return '\n'.join(lines)
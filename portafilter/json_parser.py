@@ -50,31 +50,20 @@ class JsonParser:
         """
         return self._walk_into_data(self._data, key) or default_value
 
-    def _walk_into_data(self, data: Any, key: str, walk_depth: int = 0) -> Any:
+    @staticmethod
+    def _walk_into_data(data: Any, key: str) -> Any:
         """Walk into the nested data
 
         Arguments:
             data (Any) -- The data source
             key (str) -- The nested key separated by dots
 
-        Keyword Arguments:
-            walk_depth (int) -- The current walking depth (default 0)
-
         Returns:
             Any
         """
-        if walk_depth >= 10:
-            raise Exception('The maximum walking depth is exceeded')
-
-        walk_depth += 1
-        splitted_key = key.split('.')
-        target_key = splitted_key.pop(0)
-        key_path = '.'.join(splitted_key)
-
-        target_data = data.get(target_key, {})
-
-        if splitted_key:
+        target_data = data
 
-            return self._walk_into_data(target_data, key_path, walk_depth)
+        for target_key in key.split('.'):
+            target_data = target_data.get(target_key, {})
 
         return target_data
@@ -0,0 +1,385 @@
+from functools import lru_cache
+from typing import Any, Tuple, List, Union, Optional, Iterator
+from portafilter.accessors import AccessorRegistry
+from portafilter.enums import PathStepType
+from portafilter.resolution_cache import ResolutionCache
+
+
+class JsonPath:
+
+    def __init__(self, path: str):
+        """The init method
+
+        Arguments:
+            path {str} -- The dotted path, e.g. products.*.prices.0.id
+        """
+        self._path = path
+        self._steps = self._compile(path)
+        # The flat keys by the step position, they are compiled on the first miss.
+        self._flat_keys = {}
+        # The dotted paths of the prefixes, they are compiled on the first cached lookup.
+        self._prefixes = None
+        self._wildcard_count = sum(1 for step_type, _, _ in self._steps if step_type is PathStepType.WILDCARD)
+        self._has_wildcard = self._wildcard_count > 0
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def compile(path: str) -> 'JsonPath':
+        """Get the compiled path
+
+        The compiled paths are immutable, so they are cached and shared by the dotted path.
+
+        Arguments:
+            path {str}
+
+        Returns:
+            JsonPath
+        """
+        return JsonPath(path)
+
+    @staticmethod
+    def _compile(path: str) -> Tuple[Tuple[PathStepType, str, Optional[int]], ...]:
+        """Compile the dotted path into the typed steps
+
+        Arguments:
+            path {str}
+
+        Returns:
+            Tuple[Tuple[PathStepType, str, Optional[int]], ...] -- The tuples of the step type, the key and
+            the list index.
+        """
+        steps = []
+
+        for segment in path.split('.'):
+
+            if segment == '*':
+                steps.append((PathStepType.WILDCARD, segment, None))
+
+            elif segment.isdigit():
+                steps.append((PathStepType.INDEX, segment, int(segment)))
+
+            else:
+                steps.append((PathStepType.KEY, segment, None))
+
+        return tuple(steps)
+
+    def _get_flat_keys(self, start: int) -> Tuple[Tuple[int, str], ...]:
+        """Get the flat keys which start from the specified step
+
+        A dictionary may contain a flat key which has dots in it, e.g. the errors dictionary of the validator.
+        They are only checked when the key of the step does not exist.
+
+        Arguments:
+            start {int} -- The step position.
+
+        Returns:
+            Tuple[Tuple[int, str], ...] -- The tuples of the next step position and the flat key.
+        """
+        flat_keys = self._flat_keys.get(start)
+
+        if flat_keys is None:
+            segments = [key for _, key, _ in self._steps]
+            flat_keys = tuple((end, '.'.join(segments[start:end])) for end in range(start + 2, len(segments) + 1))
+            self._flat_keys[start] = flat_keys
+
+        return flat_keys
+
+    def get_path(self) -> str:
+        """Get the dotted path
+
+        Returns:
+            str
+        """
+        return self._path
+
+    def get_steps(self) -> Tuple[Tuple[PathStepType, str, Optional[int]], ...]:
+        """Get the compiled steps
+
+        Returns:
+            Tuple[Tuple[PathStepType, str, Optional[int]], ...]
+        """
+        return self._steps
+
+    def has_wildcard(self) -> bool:
+        """The has wildcard check
+
+        Returns:
+            bool
+        """
+        return self._has_wildcard
+
+    def concrete(self, indices: Tuple[Optional[int], ...]) -> str:
+        """Get the concrete path of the list indices
+
+        Arguments:
+            indices {Tuple[Optional[int], ...]} -- The list index of each wildcard, None keeps the wildcard.
+
+        Returns:
+            str
+        """
+        if not indices:
+            return self._path
+
+        segments = []
+        wildcard_position = 0
+
+        for step_type, key, _ in self._steps:
+
+            if step_type is PathStepType.WILDCARD:
+                index = indices[wildcard_position] if wildcard_position < len(indices) else None
+                segments.append(key if index is None else str(index))
+                wildcard_position += 1
+
+            else:
+                segments.append(key)
+
+        return '.'.join(segments)
+
+    def iter_value_details(self, data: Any, default_value: Any = None) -> \
+            Iterator[Tuple[Tuple[Optional[int], ...], Any, bool]]:
+        """Iterate over the value details of each leaf of the path in the data
+
+        The wildcards are expanded lazily, and the concrete path of a leaf is only built by the concrete method
+        when it is needed.
+
+        Arguments:
+            data {Any}
+
+        Keyword Arguments:
+            default_value {Any}
+
+        Returns:
+            Iterator[Tuple[Tuple[Optional[int], ...], Any, bool]] -- The tuples of the list indices, the value and
+            the existed flag.
+        """
+        steps_count = len(self._steps)
+        wildcard_count = self._wildcard_count
+
+        # The stack of the next step position, the list indices and the iterator of the expanded lists.
+        stack = []
+        position, value, indices = 0, data, ()
+
+        while True:
+            position, value, value_exists, skipped_wildcards = self._walk_steps(value, position, default_value)
+
+            if skipped_wildcards:
+                indices += (None,) * skipped_wildcards
+
+            if position < steps_count:
+                stack.append((position + 1, indices, enumerate(value)))
+
+            elif value_exists:
+                yield indices, value, True
+
+            else:
+                yield indices + (None,) * (wildcard_count - len(indices)), value, False
+
+            while stack:
+                next_position, list_indices, list_items = stack[-1]
+                list_item = next(list_items, None)
+
+                if list_item is not None:
+                    position, indices = next_position, list_indices + (list_item[0],)
+                    value = list_item[1]
+                    break
+
+                stack.pop()
+
+            else:
+                return
+
+    def get_value_details(self, data: Any, default_value: Any = None, cache: Optional[ResolutionCache] = None) -> \
+            Union[Tuple[Any, bool], List[Tuple[int, Any]]]:
+        """Get the value details of the path in the data
+
+        Arguments:
+            data {Any}
+
+        Keyword Arguments:
+            default_value {Any}
+            cache {Optional[ResolutionCache]} -- The resolved prefixes of the same data (default: {None})
+
+        Returns:
+            Union[Tuple[Any, bool], List[Tuple[int, Any]]] -- The value and the existed flag or
+            the list of the index and the value details of each list item for the wildcard paths.
+        """
+        if cache is not None and not self._has_wildcard:
+            return self._resolve_cached(data, default_value, cache)
+
+        steps_count = len(self._steps)
+        position, value, value_exists, _ = self._walk_steps(data, 0, default_value)
+
+        if position == steps_count:
+            return value, value_exists
+
+        result = []
+
+        # The stack of the next step position, the iterator of the expanded list and its result list.
+        stack = [(position + 1, enumerate(value), result)]
+
+        while stack:
+            next_position, list_items, list_result = stack[-1]
+            list_item = next(list_items, None)
+
+            if list_item is None:
+                stack.pop()
+                continue
+
+            list_index, list_value = list_item
+            position, value, value_exists, _ = self._walk_steps(list_value, next_position, default_value)
+
+            if position == steps_count:
+                list_result.append((list_index, (value, value_exists)))
+
+            else:
+                nested_result = []
+                list_result.append((list_index, nested_result))
+                stack.append((position + 1, enumerate(value), nested_result))
+
+        return result
+
+    def _get_prefixes(self) -> Tuple[str, ...]:
+        """Get the dotted paths of the prefixes from the shortest to the longest
+
+        Returns:
+            Tuple[str, ...]
+        """
+        if self._prefixes is None:
+            prefixes = []
+
+            for _, key, _ in self._steps:
+                prefixes.append(f'{prefixes[-1]}.{key}' if prefixes else key)
+
+            self._prefixes = tuple(prefixes)
+
+        return self._prefixes
+
+    def _resolve_cached(self, data: Any, default_value: Any, cache: ResolutionCache) -> Tuple[Any, bool]:
+        """Resolve the path without wildcards from its longest cached prefix
+
+        The resolved prefixes are added to the cache.
+
+        Arguments:
+            data {Any}
+            default_value {Any}
+            cache {ResolutionCache}
+
+        Returns:
+            Tuple[Any, bool]
+        """
+        prefixes = self._get_prefixes()
+        cached_value_details = cache.find(prefixes)
+
+        if cached_value_details is None:
+            position, value, value_exists = 0, data, True
+
+        else:
+            position, value, value_exists = cached_value_details
+
+        if not value_exists:
+            return default_value, False
+
+        steps = self._steps
+        steps_count = len(steps)
+
+        while position < steps_count:
+            step_type, key, index = steps[position]
+
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+
+            elif index is not None and isinstance(value, list) and index < len(value):
+                value = value[index]
+
+            else:
+                # The flat keys and the missing values.
+                _, value, value_exists, _ = self._walk_steps(value, position, default_value)
+                cache.set(prefixes[-1], value if value_exists else None, value_exists)
+                return value, value_exists
+
+            position += 1
+            cache.set(prefixes[position - 1], value, True)
+
+        return value, True
+
+    def _walk_steps(self, data: Any, start: int, default_value: Any = None) -> Tuple[int, Any, bool, int]:
+        """Walk into the data from the specified step until the end of the path or the next wildcard
+
+        Arguments:
+            data {Any}
+            start {int} -- The step position to start from.
+
+        Keyword Arguments:
+            default_value {Any}
+
+        Returns:
+            Tuple[int, Any, bool, int] -- The step position, the value, the existed flag and the number of
+            the wildcards which are skipped by the flat keys. The position is the wildcard step position if
+            there is a list to expand, otherwise it is the number of the steps.
+        """
+        steps = self._steps
+        steps_count = len(steps)
+        position = start
+        value = data
+        skipped_wildcards = 0
+
+        while position < steps_count:
+            step_type, key, index = steps[position]
+
+            if step_type is PathStepType.WILDCARD:
+
+                if isinstance(value, list):
+                    return position, value, True, skipped_wildcards
+
+                accessor = AccessorRegistry.get(value)
+                list_items = accessor.iterate(value) if accessor is not None else None
+
+                if list_items is not None:
+                    return position, list_items, True, skipped_wildcards
+
+                break
+
+            if isinstance(value, dict):
+
+                if key in value:
+                    value = value[key]
+                    position += 1
+                    continue
+
+                for end, flat_key in self._get_flat_keys(position):
+                    if flat_key in value:
+                        skipped_wildcards += sum(
+                            1 for _step_type, _, _ in steps[position:end] if _step_type is PathStepType.WILDCARD
+                        )
+                        value = value[flat_key]
+                        position = end
+                        break
+
+                else:
+                    break
+
+            elif isinstance(value, list):
+
+                if index is None or index >= len(value):
+                    break
+
+                value = value[index]
+                position += 1
+
+            else:
+                accessor = AccessorRegistry.get(value)
+
+                if accessor is None:
+                    break
+
+                value, value_exists = accessor.get(value, key, index)
+
+                if not value_exists:
+                    break
+
+                position += 1
+
+        else:
+            return position, value, True, skipped_wildcards
+
+        return steps_count, default_value, False, skipped_wildcards
@@ -1,15 +1,19 @@
-from typing import Any, Tuple, List, Union, Set
+from typing import Any, Tuple, List, Union, Iterator, Optional, Iterable
+from portafilter.json_path import JsonPath
+from portafilter.resolution_cache import ResolutionCache
 
 
 class JsonSchema:
 
-    def __init__(self, data: Union[dict, None] = None):
+    def __init__(self, data: Union[dict, None] = None, cache: Optional[ResolutionCache] = None):
         """The initialize method.
 
         Arguments:
             data {Union[dict, None]} -- The data input (default: {None})
+            cache {Optional[ResolutionCache]} -- The resolved prefixes of the data input (default: {None})
         """
         self._data = data
+        self._cache = cache
 
     def get_value_details(self, attribute: str, default_value: Any = None) -> \
             Union[Tuple[Any, bool], List[Tuple[int, Tuple[Any, bool]]]]:
@@ -25,203 +29,129 @@ class JsonSchema:
             Union[Tuple[Any, bool], List[Tuple[int, Tuple[Any, bool]]]] -- The value and the existed flag or
             the list of the index and the tuple of the value and the existed flag.
         """
-        return self._walk_into_data(attribute, self._data, default_value)
+        return JsonPath.compile(attribute).get_value_details(self._data, default_value, self._cache)
 
-    def _walk_into_data(self, attribute: str, data: dict, default_value: Any = None) -> \
-            Union[Tuple[Any, bool], List[Tuple[int, Tuple[Any, bool]]]]:
-        """Get the specified attribute value details
+    def iter_value_details(self, attribute: str, default_value: Any = None) -> Iterator[Tuple[str, Any, bool]]:
+        """Iterate over the value details of each leaf of the specified attribute
+
+        Unlike get_value_details, the wildcards are expanded lazily without building the nested lists.
 
         Arguments:
             attribute {str}
-            data {dict}
 
         Keyword Arguments:
             default_value {Any}
 
         Returns:
-            Union[Tuple[Any, bool], List[Tuple[int, Tuple[Any, bool]]]] -- The value and the existed flag or
-            the list of the index and the tuple of the value and the existed flag.
+            Iterator[Tuple[str, Any, bool]] -- The tuples of the concrete attribute, the value and the existed flag.
         """
-        try:
-            _key = attribute.split('.')
-
-            if self.is_integer(_key[-1]) or _key[-1] == '*':
-                _partial_key = _key.pop()
-                if not _key:
-                    _key = [_partial_key]
-                else:
-                    _key = ['.'.join(_key), _partial_key]
-
-            iteration = len(_key)
-            _key_path = []
-
-            if iteration > 1:
-                result = None
-                counter = 1
-
-                key_exists = False
-                for key_holder in _key:
-
-                    _key_path.append(key_holder)
-
-                    if self.is_integer(key_holder):
-                        _list_key = f"{'.'.join([str(a) for a in _key[:-1]])}"
-                        if _list_key in data:
-                            result = self._walk_into_data(
-                                attribute.replace(_list_key, '').strip('.'),
-                                data.get(_list_key),
-                                default_value=default_value
-                            )
-                            key_exists = True
-                            break
-
-                    if isinstance(result, list):
-
-                        if key_holder == '*':
-                            _walk_into_list = True
-
-                            if _key[-1] == '*':
-                                _walk_into_list = False
-
-                                result = self._walk_into_data(
-                                    f"{'.'.join([str(a) for a in _key_path[:-1]])}",
-                                    data,
-                                    default_value=default_value
-                                )[0]
-
-                                if not isinstance(result, list):
-                                    key_exists = True
-                                    break
-
-                            list_result = []
-                            list_index = 0
-                            for list_item in result:
-                                list_item_target_key = '.'.join(_key[counter:])
-                                # Recursive
-                                list_result.append(
-                                    (
-                                        list_index,
-                                        self._walk_into_data(
-                                            list_item_target_key,
-                                            list_item,
-                                            default_value=default_value
-                                        )
-                                        if _walk_into_list else (list_item, True)
-                                    )
-                                )
-                                list_index += 1
-
-                            return list_result
-
-                        else:
-                            try:
-                                parsed_partial_key = int(key_holder)
-
-                                result = self._walk_into_data(
-                                    f"{'.'.join([str(a) for a in _key_path[:-1]])}",
-                                    data,
-                                    default_value=default_value
-                                )[0][parsed_partial_key]
-
-                                key_exists = True
-                                break
-
-                            except (ValueError, IndexError) as e:
-                                # TODO: handle the not existed value
-                                result = None
-                                key_exists = False
-                                pass
-
-                    if counter == 1:
-                        key_exists = JsonSchema._key_exists(key_holder, data)
-                        result = data.get(key_holder, {})
-
-                    elif counter < iteration:
-                        key_exists = JsonSchema._key_exists(key_holder, result)
-                        result = result.get(key_holder, {})
-
-                    else:
-                        key_exists = JsonSchema._key_exists(key_holder, result)
-                        result = result.get(key_holder, default_value)
-
-                    counter += 1
-
-                return result, key_exists
+        path = JsonPath.compile(attribute)
 
-            else:
-                if self.is_integer(_key[0]) and isinstance(data, list):
-                    return data[int(_key[0])]
+        for indices, value, value_exists in path.iter_value_details(self._data, default_value):
+            yield path.concrete(indices), value, value_exists
 
-                else:
-                    return data.get(_key[0], default_value), _key[0] in data
+    def dot(self) -> dict:
+        """Flat the dictionary with dot
 
-        except AttributeError as e:
-            return default_value, False
+        Returns:
+            dict
+        """
+        return dict(self.iter_dot())
 
-    @staticmethod
-    def _key_exists(key: str, data: Any) -> bool:
-        """The key exists check
+    def iter_dot(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the flatten dictionary with dot
 
-        Arguments:
-            key {str}
-            data {Any}
+        The pairs are yielded lazily, so only the current key path is kept in memory.
 
         Returns:
-            bool
+            Iterator[Tuple[str, Any]] -- The tuples of the dotted path and the value of each leaf.
         """
-        try:
-            return key in data
+        # The stack of the key path and the items iterator of the nested dictionaries and lists.
+        stack = [(None, iter(self._data.items()) if isinstance(self._data, dict) else enumerate(self._data))]
 
-        except Exception as e:
-            return False
+        while stack:
+            key_path, items = stack[-1]
+            item = next(items, None)
 
-    def dot(self) -> dict:
-        """Flat the dictionary with dot
+            if item is None:
+                stack.pop()
+                continue
 
-        Returns:
-            dict
-        """
-        result = {}
-        self._dot_walk(self._data, result)
-        return result
+            key, value = item
+            item_key_path = str(key) if key_path is None else f'{key_path}.{key}'
 
-    def _dot_walk(self, data: Union[None, list, dict], result: dict, key_path: list = []) -> None:
-        """Flat the dictionary with dot
+            if isinstance(value, dict):
+                stack.append((item_key_path, iter(value.items())))
 
-        Keyword Arguments:
-            data {Union[None, list, dict]} -- The data input (default: {None})
-            key_path {list} -- The key path (default: {[]})
+            elif isinstance(value, list):
+                stack.append((item_key_path, enumerate(value)))
+
+            else:
+                yield item_key_path, value
+
+    @staticmethod
+    def undot(items: Iterable[Tuple[str, Any]]) -> dict:
+        """Build the nested dictionary from the dotted paths
+
+        It is the counterpart of iter_dot. The pairs are consumed one by one, so a flatten, transform and
+        unflatten pipeline does not keep more than the result in memory. The containers whose keys are all
+        numeric are the lists, the numeric keys are their indexes, the containers with any other key are the
+        dictionaries.
+
+        Arguments:
+            items {Iterable[Tuple[str, Any]]} -- The tuples of the dotted path and the value.
 
         Returns:
             dict
+
+        Raises:
+            ValueError -- A path goes through the value of another path or ends at its container.
         """
-        for key, value in data.items():
-            key_path.append(key)
+        result = _UndotNode()
 
-            if isinstance(value, dict):
-                self._dot_walk(value, result, key_path)
-                key_path.pop()
+        for key_path, value in items:
+            keys = key_path.split('.')
+            container = result
 
-            elif isinstance(value, list):
-                list_index = 0
-                for list_item in value:
-                    key_path.append(str(list_index))
+            for key in keys[:-1]:
+                child = container.get(key)
+
+                if child is None and key not in container:
+                    child = container[key] = _UndotNode()
+
+                elif not isinstance(child, _UndotNode):
+                    raise ValueError(f'The {key_path} path goes through the value of another path.')
+
+                container = child
 
-                    if isinstance(list_item, list) or isinstance(list_item, dict):
-                        self._dot_walk(list_item, result, key_path)
+            if isinstance(container.get(keys[-1]), _UndotNode):
+                raise ValueError(f'The {key_path} path ends at the container of another path.')
 
-                    else:
-                        result['.'.join(key_path)] = list_item
+            container[keys[-1]] = value
 
-                    key_path.pop()
+        # The containers are built once all the keys are known, the children before their parents.
+        nodes = []
+        stack = [(None, None, result)]
 
-                    list_index += 1
+        while stack:
+            parent, key, node = stack.pop()
+            nodes.append((parent, key, node))
+            stack.extend((node, _key, _value) for _key, _value in node.items() if isinstance(_value, _UndotNode))
 
-                key_path.pop()
+        for parent, key, node in reversed(nodes):
+            if parent is None:
+                return dict(node)
+
+            if all(_key.isdigit() for _key in node):
+                list_items = [None] * (max(int(_key) for _key in node) + 1)
+
+                for _key, _value in node.items():
+                    list_items[int(_key)] = _value
+
+                parent[key] = list_items
 
             else:
-                result['.'.join(key_path)] = value
-                key_path.pop()
+                parent[key] = dict(node)
 
     @staticmethod
     def is_integer(value: Any) -> bool:
@@ -239,3 +169,9 @@ class JsonSchema:
 
         except ValueError as e:
             return False
+
+
+class _UndotNode(dict):
+    """The container which undot builds, the values of the pairs are never changed even if they are dictionaries
+    """
+    pass
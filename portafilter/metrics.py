@@ -0,0 +1,202 @@
+from bisect import bisect_left
+from os import replace
+from threading import Lock, local
+from typing import Dict, Optional, Sequence, Tuple
+from portafilter.capture import get_plan_schema_id
+from portafilter.plan import ValidationPlan
+from portafilter.stats import ValidationStats
+
+
+class MetricsRegistry:
+
+    # The upper bounds of the latency histogram buckets in seconds.
+    LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+    # The upper bounds of the payload size histogram buckets in the validated values.
+    SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000, 100000)
+
+    def __init__(self, latency_buckets: Optional[Sequence[float]] = None,
+                 size_buckets: Optional[Sequence[float]] = None):
+        """The init method
+
+        Each thread counts into its own shard, so the hot path takes no lock, the shards are merged on
+        the export. The shards of the finished threads are kept, their counts are not lost.
+
+        Keyword Arguments:
+            latency_buckets {Optional[Sequence[float]]} -- (default: {LATENCY_BUCKETS})
+            size_buckets {Optional[Sequence[float]]} -- (default: {SIZE_BUCKETS})
+        """
+        self._latency_buckets = tuple(latency_buckets or self.LATENCY_BUCKETS)
+        self._size_buckets = tuple(size_buckets or self.SIZE_BUCKETS)
+        self._lock = Lock()
+        self._local = local()
+        self._shards = []
+
+    def observe(self, plan: ValidationPlan, stats: ValidationStats) -> None:
+        """Count a validation run
+
+        Arguments:
+            plan {ValidationPlan} -- The plan which the payload is validated by.
+            stats {ValidationStats} -- The counters of the run.
+        """
+        shard = getattr(self._local, 'shard', None)
+
+        if shard is None:
+            shard = self._add_shard()
+
+        schema = get_plan_schema_id(plan)
+
+        self._observe(shard['latency'], schema, self._latency_buckets, stats.get_wall_time())
+        self._observe(shard['size'], schema, self._size_buckets, stats.get_values_visited())
+
+        failures = shard['failures']
+        for (attribute, rule_name), count in stats.get_failures().items():
+            key = (schema, attribute, rule_name)
+            failures[key] = failures.get(key, 0) + count
+
+    @staticmethod
+    def _observe(histograms: dict, schema: str, buckets: Tuple[float, ...], value: float) -> None:
+        """Add the value to the histogram of the schema
+
+        Arguments:
+            histograms {dict}
+            schema {str}
+            buckets {Tuple[float, ...]}
+            value {float}
+        """
+        histogram = histograms.get(schema)
+
+        if histogram is None:
+            histogram = histograms[schema] = [[0] * (len(buckets) + 1), 0]
+
+        # The counts are not cumulative, the last one is the +Inf bucket.
+        histogram[0][bisect_left(buckets, value)] += 1
+        histogram[1] += value
+
+    def _add_shard(self) -> dict:
+        """Add the shard of the current thread
+
+        Returns:
+            dict
+        """
+        shard = self._local.shard = {'latency': {}, 'size': {}, 'failures': {}}
+
+        with self._lock:
+            self._shards.append(shard)
+
+        return shard
+
+    def get_snapshot(self) -> Dict[str, dict]:
+        """Get the merged counts of all the threads
+
+        Returns:
+            Dict[str, dict] -- The latency and the size histograms by the schema, as the non-cumulative
+            bucket counts, the sum and the count, and the failures by the schema, the attribute pattern and the
+            rule name.
+        """
+        snapshot = {'latency': {}, 'size': {}, 'failures': {}}
+
+        with self._lock:
+            shards = list(self._shards)
+
+        for shard in shards:
+            for name in ['latency', 'size']:
+                for schema, (counts, total) in shard[name].copy().items():
+                    histogram = snapshot[name].setdefault(schema, {'counts': [0] * len(counts), 'sum': 0})
+                    histogram['counts'] = [_merged + _count for _merged, _count in zip(histogram['counts'], counts)]
+                    histogram['sum'] += total
+
+            for key, count in shard['failures'].copy().items():
+                snapshot['failures'][key] = snapshot['failures'].get(key, 0) + count
+
+        for name in ['latency', 'size']:
+            for histogram in snapshot[name].values():
+                histogram['count'] = sum(histogram['counts'])
+
+        return snapshot
+
+    def export(self) -> str:
+        """Export the metrics in the Prometheus text format
+
+        Returns:
+            str
+        """
+        snapshot = self.get_snapshot()
+        lines = []
+
+        self._export_histogram(lines, 'portafilter_validation_seconds', 'The wall time of the validations.',
+                               self._latency_buckets, snapshot['latency'])
+        self._export_histogram(lines, 'portafilter_payload_values', 'The number of the validated values.',
+                               self._size_buckets, snapshot['size'])
+
+        lines.append('# HELP portafilter_rule_failures_total The failed rules.')
+        lines.append('# TYPE portafilter_rule_failures_total counter')
+
+        for (schema, attribute, rule_name), count in sorted(snapshot['failures'].items()):
+            labels = self._format_labels(schema=schema, attribute=attribute, rule=rule_name)
+            lines.append(f'portafilter_rule_failures_total{labels} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def _export_histogram(self, lines: list, metric: str, description: str, buckets: Tuple[float, ...],
+                          histograms: Dict[str, dict]) -> None:
+        """Add the lines of a histogram metric
+
+        Arguments:
+            lines {list}
+            metric {str}
+            description {str}
+            buckets {Tuple[float, ...]}
+            histograms {Dict[str, dict]} -- The histograms by the schema.
+        """
+        lines.append(f'# HELP {metric} {description}')
+        lines.append(f'# TYPE {metric} histogram')
+
+        for schema, histogram in sorted(histograms.items()):
+            cumulative = 0
+
+            for bound, count in zip([*map(repr, buckets), '+Inf'], histogram['counts']):
+                cumulative += count
+                lines.append(f'{metric}_bucket{self._format_labels(schema=schema, le=bound)} {cumulative}')
+
+            labels = self._format_labels(schema=schema)
+            lines.append(f"{metric}_sum{labels} {histogram['sum']!r}")
+            lines.append(f"{metric}_count{labels} {histogram['count']}")
+
+    @staticmethod
+    def _format_labels(**labels: str) -> str:
+        """Format the labels of a sample
+
+        Returns:
+            str
+        """
+        formatted = []
+
+        for name, value in labels.items():
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            formatted.append(f'{name}="{value}"')
+
+        return '{' + ','.join(formatted) + '}'
+
+    def write(self, path: str) -> None:
+        """Write the exported metrics to a file, e.g. for the textfile collector of the node exporter
+
+        The file is replaced at once, so the collector never reads a partial export.
+
+        Arguments:
+            path {str}
+        """
+        temporary_path = f'{path}.tmp'
+
+        with open(temporary_path, 'w') as metrics_file:
+            metrics_file.write(self.export())
+
+        replace(temporary_path, path)
+
+    def reset(self) -> None:
+        """Clear the counts of all the threads
+        """
+        with self._lock:
+            for shard in self._shards:
+                for counts in shard.values():
+                    counts.clear()
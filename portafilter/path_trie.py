@@ -0,0 +1,203 @@
+from typing import Any, Iterable, Iterator, Optional, Tuple
+from portafilter.accessors import AccessorRegistry
+from portafilter.enums import PathStepType
+from portafilter.json_path import JsonPath
+from portafilter.resolution_cache import ResolutionCache
+from portafilter.stats import ValidationStats
+
+
+class PathTrieNode:
+
+    def __init__(self):
+        """The init method.
+        """
+        # The key and index children by the key, as the tuples of the list index and the node.
+        self.children = {}
+        # The tuples of the key, the list index and the node in the reversed insertion order for the walk stack.
+        self.reversed_children = []
+        self.wildcard = None
+        # The items of the paths which end at the node.
+        self.items = []
+        # The path of the node has no wildcard.
+        self.static = True
+
+
+class PathTrie:
+
+    def __init__(self):
+        """The init method.
+        """
+        self._root = PathTrieNode()
+        self._size = 0
+
+    def insert(self, path: JsonPath, item: Any) -> None:
+        """Insert an item at the end of the path
+
+        Arguments:
+            path {JsonPath} -- The compiled path.
+            item {Any} -- The item to get while walking into the end of the path.
+        """
+        node = self._root
+
+        for step_type, key, index in path.get_steps():
+
+            if step_type is PathStepType.WILDCARD:
+                if node.wildcard is None:
+                    node.wildcard = PathTrieNode()
+                    node.wildcard.static = False
+
+                node = node.wildcard
+
+            else:
+                if key not in node.children:
+                    node.children[key] = (index, PathTrieNode())
+                    node.children[key][1].static = node.static
+                    node.reversed_children.insert(0, (key, index, node.children[key][1]))
+
+                node = node.children[key][1]
+
+        node.items.append(item)
+        self._size += 1
+
+    def __len__(self) -> int:
+        """The len magic method
+
+        Returns:
+            int -- The number of the inserted items.
+        """
+        return self._size
+
+    def walk(self, data: Any, cache: Optional[ResolutionCache] = None, stats: Optional[ValidationStats] = None) -> \
+            Iterator[Tuple[Any, str, Any, bool]]:
+        """Walk into the data once for all the inserted paths
+
+        Each list and dictionary of the data is visited once, however many paths go through it. The walk uses
+        an explicit stack, so the depth of the data is not limited by the recursion limit.
+
+        Arguments:
+            data {Any}
+
+        Keyword Arguments:
+            cache {Optional[ResolutionCache]} -- The cache to add the visited paths without wildcards to
+            (default: {None})
+            stats {Optional[ValidationStats]} -- Count the list items which the wildcards expand into
+            (default: {None})
+
+        Returns:
+            Iterator[Tuple[Any, str, Any, bool]] -- The tuples of the item, the concrete path, the value and
+            the existed flag.
+        """
+        # The stack of the nodes to visit as the tuples of the node, the concrete path, the value, the existed
+        # flag and the flat key context, and the wildcard nodes as the tuples of the node, the concrete path prefix
+        # and the list iterator. The flat key context of a missing key is the tuple of the dictionary and the flat
+        # key so far, the descendants look for the longer flat keys in it like JsonPath does.
+        stack = [(self._root, None, data, True, None)]
+
+        while stack:
+            frame = stack.pop()
+
+            if len(frame) == 3:
+                node, prefix, list_items = frame
+                list_item = next(list_items, None)
+
+                if list_item is not None:
+                    stack.append(frame)
+                    stack.append((node, f'{prefix}{list_item[0]}', list_item[1], True, None))
+
+                    # The items are counted as they are walked, the iterables of the accessors have no length.
+                    if stats is not None:
+                        stats.add(wildcard_elements=1)
+
+                continue
+
+            node, concrete_path, value, value_exists, flat = frame
+
+            if cache is not None and node.static and concrete_path is not None:
+                cache.set(concrete_path, value, value_exists)
+
+            for item in node.items:
+                yield item, concrete_path, value, value_exists
+
+            # The wildcard is pushed first to be visited after the keys.
+            if node.wildcard is not None:
+                prefix = f'{concrete_path}.' if concrete_path is not None else ''
+
+                list_items = value if isinstance(value, list) else self._iterate(value)
+
+                if value_exists and list_items is not None:
+                    stack.append((node.wildcard, prefix, enumerate(list_items)))
+
+                else:
+                    # The paths keep the wildcard when there is no list to walk into.
+                    stack.append(self._get_missing_frame(node.wildcard, f'{prefix}*', '*', flat))
+
+            for _key, index, child in node.reversed_children:
+                child_path = _key if concrete_path is None else f'{concrete_path}.{_key}'
+
+                # The missing values are None, so they have no children.
+                if isinstance(value, dict):
+                    if _key in value:
+                        stack.append((child, child_path, value[_key], True, None))
+
+                    else:
+                        stack.append((child, child_path, None, False, (value, _key)))
+
+                elif isinstance(value, list):
+                    if index is not None and index < len(value):
+                        stack.append((child, child_path, value[index], True, None))
+
+                    else:
+                        stack.append((child, child_path, None, False, None))
+
+                elif value is not None:
+                    accessor = AccessorRegistry.get(value)
+                    child_value, child_value_exists = None, False
+
+                    if accessor is not None:
+                        child_value, child_value_exists = accessor.get(value, _key, index)
+
+                    stack.append((child, child_path, child_value, child_value_exists, None))
+
+                else:
+                    stack.append(self._get_missing_frame(child, child_path, _key, flat))
+
+    @staticmethod
+    def _get_missing_frame(node: PathTrieNode, concrete_path: str, key: str, flat: Optional[Tuple[dict, str]]) -> \
+            Tuple[PathTrieNode, str, Any, bool, Optional[Tuple[dict, str]]]:
+        """Get the stack frame of a child of a missing value
+
+        The child is found if the dictionary of the missing key has the flat key of the child, e.g. the a.b
+        key for the a.b path when there is no a key.
+
+        Arguments:
+            node {PathTrieNode}
+            concrete_path {str}
+            key {str}
+            flat {Optional[Tuple[dict, str]]} -- The flat key context of the missing value.
+
+        Returns:
+            Tuple[PathTrieNode, str, Any, bool, Optional[Tuple[dict, str]]]
+        """
+        if flat is None:
+            return node, concrete_path, None, False, None
+
+        flat_key = f'{flat[1]}.{key}'
+
+        if flat_key in flat[0]:
+            return node, concrete_path, flat[0][flat_key], True, None
+
+        return node, concrete_path, None, False, (flat[0], flat_key)
+
+    @staticmethod
+    def _iterate(value: Any) -> Optional[Iterable[Any]]:
+        """Get the list items of a container which is not a plain list
+
+        Arguments:
+            value {Any}
+
+        Returns:
+            Optional[Iterable[Any]] -- None if the value is not a list.
+        """
+        accessor = AccessorRegistry.get(value)
+
+        return accessor.iterate(value) if accessor is not None else None
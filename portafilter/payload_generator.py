@@ -0,0 +1,620 @@
+from datetime import datetime, timedelta
+from math import ceil, floor
+from random import Random
+from string import ascii_lowercase
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from portafilter.enums import PathStepType, ValueType
+from portafilter.exceptions import InvalidRuleParam
+from portafilter.json_path import JsonPath
+from portafilter.rules import RuleList, Ruleset
+from portafilter.sandglass import Sandglass
+
+
+class PayloadGenerator:
+
+    # The rules which depend on the value of another attribute.
+    _dependent_rule_names = ['same', 'different', 'after', 'before', 'after_or_equal', 'before_or_equal']
+
+    # The date rules and the days which their bound is moved by.
+    _date_bound_rules = [
+        ('after', 1, False),
+        ('after_or_equal', 0, False),
+        ('before', -1, True),
+        ('before_or_equal', 0, True),
+    ]
+
+    # The default dates are picked from a single year after it.
+    _base_date = datetime(2021, 1, 1)
+
+    def __init__(self, rules: Union[dict, RuleList], seed: int = 0, size: Optional[int] = None, fan_out: int = 3):
+        """The init method
+
+        Arguments:
+            rules {Union[dict, RuleList]} -- The validation rules or the parsed rule list.
+
+        Keyword Arguments:
+            seed {int} -- The same seed always generates the same payloads (default: {0})
+            size {Optional[int]} -- The number of the items of the outermost wildcard lists, the fan out by
+            default (default: {None})
+            fan_out {int} -- The number of the items of the nested wildcard lists (default: {3})
+        """
+        rule_list = rules if isinstance(rules, RuleList) else RuleList(rules)
+
+        self._seed = seed
+        self._size = fan_out if size is None else size
+        self._fan_out = fan_out
+        self._rulesets = {attribute: ruleset for attribute, ruleset in rule_list}
+
+        paths = [JsonPath.compile(attribute) for attribute in self._rulesets]
+        container_steps = {path.get_steps()[:_position] for path in paths for _position in range(len(path.get_steps()))}
+
+        # The container attributes are built by their children, the dependent ones are generated last.
+        self._leaves = sorted(
+            [_path for _path in paths if _path.get_steps() not in container_steps],
+            key=lambda _path: self._rulesets[_path.get_path()].has_one_of_rules(self._dependent_rule_names)
+        )
+
+    def generate(self, invalid: bool = False) -> dict:
+        """Generate a payload
+
+        The invalid payload keeps the valid containers, so every list item is reached, but each leaf value has
+        the wrong type and fails as many rules as possible, so every error message is rendered.
+
+        Keyword Arguments:
+            invalid {bool} -- Generate the deliberately invalid payload (default: {False})
+
+        Returns:
+            dict
+        """
+        random = Random(self._seed)
+        holder = {'data': {}}
+
+        for path in self._leaves:
+            ruleset = self._rulesets[path.get_path()]
+
+            if not invalid:
+                self._fill_other_attributes(holder, path, ruleset, random)
+
+            self._fill(
+                holder,
+                path,
+                lambda _data, ruleset=ruleset: self.generate_value(ruleset, invalid, random, _data),
+            )
+
+        return holder['data']
+
+    def _fill_other_attributes(self, holder: dict, path: JsonPath, ruleset: Ruleset, random: Random) -> None:
+        """Fill the missing other attributes of the dependent rules
+
+        The other attribute may have no rules, e.g. the password confirmation. Its value is derived from a value
+        of the ruleset, so the values of the path which are generated from it pass the dependent rules.
+
+        Arguments:
+            holder {dict} -- The holder of the payload under the data key.
+            path {JsonPath}
+            ruleset {Ruleset}
+            random {Random}
+
+        Raises:
+            InvalidRuleParam -- The other attribute has a wildcard or a date rule compares the dates of a format
+            which it does not parse, no value passes the rule.
+        """
+        # The other values are derived from the same value, so they pass the rules together.
+        value = None
+
+        for rule_name in self._dependent_rule_names:
+            if not ruleset.has_rule(rule_name):
+                continue
+
+            other_attribute = ruleset.get_rule(rule_name).get_params()[0]
+
+            if rule_name not in ['same', 'different']:
+                self._check_date_format(rule_name, path.get_path(), ruleset)
+
+                # The date rules compare with the date param when there is no such attribute.
+                if self._is_date(other_attribute):
+                    continue
+
+                if other_attribute in self._rulesets:
+                    self._check_date_format(rule_name, other_attribute, self._rulesets[other_attribute])
+
+            other_path = JsonPath.compile(other_attribute)
+
+            if other_path.has_wildcard():
+                raise InvalidRuleParam(
+                    f'The {rule_name} rule of {path.get_path()} depends on the {other_attribute} wildcard attribute.'
+                )
+
+            if other_path.get_value_details(holder['data'])[1]:
+                continue
+
+            if value is None:
+                value = self.generate_value(ruleset, random=random)
+
+            other_value = self._get_other_value(rule_name, ruleset, value)
+            self._fill(holder, other_path, lambda _data, other_value=other_value: other_value)
+
+    def _check_date_format(self, rule_name: str, attribute: str, ruleset: Ruleset) -> None:
+        """Check if the date rule parses the dates of the attribute
+
+        The date rules parse the compared dates without a format, so the dates of a custom format never pass.
+
+        Arguments:
+            rule_name {str}
+            attribute {str}
+            ruleset {Ruleset} -- The ruleset of the attribute.
+
+        Raises:
+            InvalidRuleParam
+        """
+        date_format = self._get_date_format(ruleset)
+
+        if not self._is_date(self._base_date.strftime(date_format)):
+            raise InvalidRuleParam(
+                f'The {rule_name} rule does not parse the {date_format} dates of the {attribute} attribute.'
+            )
+
+    def _get_other_value(self, rule_name: str, ruleset: Ruleset, value: Any) -> Any:
+        """Get the value of the other attribute which the value passes the dependent rule with
+
+        Arguments:
+            rule_name {str}
+            ruleset {Ruleset}
+            value {Any} -- A value of the ruleset.
+
+        Returns:
+            Any
+        """
+        if rule_name == 'same':
+            return value
+
+        if rule_name == 'different':
+            return self._make_different(value)
+
+        date = datetime.strptime(value, self._get_date_format(ruleset))
+        days = {'after': -1, 'before': 1}.get(rule_name, 0)
+
+        return (date + timedelta(days=days)).strftime('%Y-%m-%d')
+
+    def generate_value(self, ruleset: Ruleset, invalid: bool = False, random: Optional[Random] = None,
+                       data: Optional[dict] = None) -> Any:
+        """Generate a value for the ruleset
+
+        Arguments:
+            ruleset {Ruleset}
+
+        Keyword Arguments:
+            invalid {bool} -- Generate a value which fails the ruleset (default: {False})
+            random {Optional[Random]} -- The random generator, a new one is seeded by default (default: {None})
+            data {Optional[dict]} -- The payload which the dependent rules are resolved in (default: {None})
+
+        Returns:
+            Any
+
+        Raises:
+            InvalidRuleParam -- No value of the type passes the rules.
+        """
+        random = Random(self._seed) if random is None else random
+        value_type = ruleset.get_value_type()
+
+        if invalid:
+            # The empty value of the wrong type fails the required, the type and the most of the other rules.
+            return '' if value_type in [ValueType.LIST, ValueType.DICT] else []
+
+        other_values = self._get_other_values(ruleset, data)
+
+        if 'same' in other_values:
+            return other_values['same']
+
+        if ruleset.has_rule('in'):
+            # The params of the in rule are strings, they are never equal to a boolean.
+            if value_type == ValueType.BOOLEAN:
+                raise InvalidRuleParam(f"No boolean passes the in rule: {ruleset.get_rule('in').get_params()}")
+
+            choice = random.choice(ruleset.get_rule('in').get_params())
+            value = self._cast_choice(choice, value_type)
+
+        elif value_type == ValueType.INTEGER:
+            value = self._generate_integer(ruleset, random)
+
+        elif value_type == ValueType.NUMERIC:
+            value = self._generate_numeric(ruleset, random)
+
+        elif value_type == ValueType.BOOLEAN:
+            value = random.choice([True, False])
+
+        elif value_type == ValueType.LIST:
+            value = self._generate_list(ruleset, random)
+
+        elif value_type == ValueType.DICT:
+            params = ruleset.get_rule('dict').get_params()
+            value = {params[0] if params else 'key': self._generate_word(random, 8)}
+
+        elif ruleset.has_rule('date') or ruleset.has_one_of_rules([_rule for _rule, _, _ in self._date_bound_rules]):
+            value = self._generate_date(ruleset, random, other_values)
+
+        else:
+            value = self._generate_string(ruleset, random)
+
+        if 'different' in other_values and value == other_values['different']:
+            value = self._make_different(value)
+
+        return value
+
+    @staticmethod
+    def _make_different(value: Any) -> Any:
+        """Change the value into a different one of the same type
+
+        Arguments:
+            value {Any}
+
+        Returns:
+            Any
+        """
+        if isinstance(value, bool):
+            return not value
+
+        elif isinstance(value, (int, float)):
+            return value + 1
+
+        return f'{value}-different'
+
+    def _fill(self, holder: dict, path: JsonPath, make_value: Callable[[dict], Any]) -> None:
+        """Fill the payload with the values of the path
+
+        The missing containers are created on the way and the wildcard lists are extended to their length.
+
+        Arguments:
+            holder {dict} -- The holder of the payload under the data key.
+            path {JsonPath}
+            make_value {Callable[[dict], Any]} -- Makes the leaf value from the payload.
+        """
+        steps = path.get_steps()
+        steps_count = len(steps)
+        stack = [(holder, 'data', 0)]
+
+        while stack:
+            parent, slot, position = stack.pop()
+            current = parent[slot]
+
+            if position == steps_count:
+                parent[slot] = make_value(holder['data'])
+                continue
+
+            step_type, key, index = steps[position]
+
+            if step_type is PathStepType.KEY:
+                if not isinstance(current, dict):
+                    current = parent[slot] = {}
+
+                current.setdefault(key, None)
+                stack.append((current, key, position + 1))
+
+            else:
+                if not isinstance(current, list):
+                    current = parent[slot] = []
+
+                length = index + 1 if step_type is PathStepType.INDEX else self._get_list_length(steps, position)
+                current.extend([None] * (length - len(current)))
+
+                if step_type is PathStepType.INDEX:
+                    stack.append((current, index, position + 1))
+
+                else:
+                    stack.extend((current, _index, position + 1) for _index in range(length - 1, -1, -1))
+
+    def _get_list_length(self, steps: Tuple[Tuple[PathStepType, str, Optional[int]], ...], position: int) -> int:
+        """Get the length of the wildcard list
+
+        Arguments:
+            steps {Tuple[Tuple[PathStepType, str, Optional[int]], ...]}
+            position {int} -- The position of the wildcard step.
+
+        Returns:
+            int
+        """
+        is_outermost = all(_step[0] is not PathStepType.WILDCARD for _step in steps[:position])
+        length = self._size if is_outermost else self._fan_out
+
+        ruleset = self._rulesets.get('.'.join(_key for _, _key, _ in steps[:position]))
+
+        if ruleset is not None and ruleset.get_value_type() == ValueType.LIST:
+            length = self._get_length(ruleset, length)
+
+        return length
+
+    @staticmethod
+    def _get_bounds(ruleset: Ruleset) -> Tuple[Optional[float], Optional[float]]:
+        """Get the min and the max of the size, the length or the value
+
+        Arguments:
+            ruleset {Ruleset}
+
+        Returns:
+            Tuple[Optional[float], Optional[float]]
+        """
+        if ruleset.has_rule('size'):
+            size = float(ruleset.get_rule('size').get_params()[0])
+            return size, size
+
+        lower = upper = None
+
+        if ruleset.has_rule('between') and not ruleset.has_rule('date'):
+            lower, upper = [float(_param) for _param in ruleset.get_rule('between').get_params()[:2]]
+
+        if ruleset.has_rule('min'):
+            min_value = float(ruleset.get_rule('min').get_params()[0])
+            lower = min_value if lower is None else max(lower, min_value)
+
+        if ruleset.has_rule('max'):
+            max_value = float(ruleset.get_rule('max').get_params()[0])
+            upper = max_value if upper is None else min(upper, max_value)
+
+        return lower, upper
+
+    def _get_length(self, ruleset: Ruleset, default: int) -> int:
+        """Get the length of a string or a list
+
+        Arguments:
+            ruleset {Ruleset}
+            default {int}
+
+        Returns:
+            int
+        """
+        lower, upper = self._get_bounds(ruleset)
+        length = default
+
+        if lower is not None:
+            length = max(length, ceil(lower))
+
+        if upper is not None:
+            length = min(length, floor(upper))
+
+        if ruleset.has_rule('required'):
+            length = max(length, 1)
+
+        return length
+
+    def _generate_integer(self, ruleset: Ruleset, random: Random) -> int:
+        """Generate an integer
+
+        Arguments:
+            ruleset {Ruleset}
+            random {Random}
+
+        Returns:
+            int
+        """
+        lower, upper = self._get_bounds(ruleset)
+        lower = 0 if lower is None else ceil(lower)
+        upper = lower + 1000 if upper is None else floor(upper)
+
+        value = random.randint(lower, max(lower, upper))
+
+        return value if not ruleset.has_rule('not_in') else \
+            self._avoid(value, ruleset.get_rule('not_in').get_params(), lambda _value: _value + 1)
+
+    def _generate_numeric(self, ruleset: Ruleset, random: Random) -> float:
+        """Generate a number
+
+        Arguments:
+            ruleset {Ruleset}
+            random {Random}
+
+        Returns:
+            float
+        """
+        lower, upper = self._get_bounds(ruleset)
+        lower = 0.0 if lower is None else lower
+        upper = lower + 1000 if upper is None else upper
+
+        return min(max(round(random.uniform(lower, upper), 2), lower), upper)
+
+    def _generate_list(self, ruleset: Ruleset, random: Random) -> list:
+        """Generate a list of the list rule item type
+
+        Arguments:
+            ruleset {Ruleset}
+            random {Random}
+
+        Returns:
+            list
+
+        Raises:
+            InvalidRuleParam -- The list rule does not validate the items of the type.
+        """
+        params = ruleset.get_rule('list').get_params()
+        item_type = ValueType(params[0]) if params else ValueType.STRING
+        length = self._get_length(ruleset, self._fan_out)
+
+        generators = {
+            ValueType.STRING: lambda: self._generate_word(random, 8),
+            ValueType.INTEGER: lambda: random.randint(0, 1000),
+            ValueType.NUMERIC: lambda: round(random.uniform(0, 1000), 2),
+            ValueType.BOOLEAN: lambda: random.choice([True, False]),
+            ValueType.DICT: lambda: {'key': self._generate_word(random, 8)},
+        }
+
+        if item_type not in generators:
+            raise InvalidRuleParam(f'The list rule does not validate the {item_type.value} items.')
+
+        return [generators[item_type]() for _ in range(length)]
+
+    def _generate_string(self, ruleset: Ruleset, random: Random) -> str:
+        """Generate a string
+
+        Arguments:
+            ruleset {Ruleset}
+            random {Random}
+
+        Returns:
+            str
+        """
+        if ruleset.has_rule('email'):
+            return f'{self._generate_word(random, 8)}@{self._generate_word(random, 6)}.dev'
+
+        prefix = ruleset.get_rule('starts_with').get_params()[0] if ruleset.has_rule('starts_with') else ''
+        suffix = ruleset.get_rule('ends_with').get_params()[0] if ruleset.has_rule('ends_with') else ''
+        parts = ruleset.get_rule('contains').get_params() if ruleset.has_rule('contains') else []
+
+        if ruleset.has_rule('contains_one_of'):
+            parts = parts + ruleset.get_rule('contains_one_of').get_params()[:1]
+
+        fixed = prefix + ''.join(parts) + suffix
+        length = self._get_length(ruleset, max(8, len(fixed)))
+        value = prefix + ''.join(parts) + self._generate_word(random, length - len(fixed)) + suffix
+
+        return value if not ruleset.has_rule('not_in') else \
+            self._avoid(value, ruleset.get_rule('not_in').get_params(), lambda _value: f'{_value}x')
+
+    def _generate_date(self, ruleset: Ruleset, random: Random, other_values: Dict[str, Any]) -> str:
+        """Generate a date between the bounds of the date rules
+
+        Arguments:
+            ruleset {Ruleset}
+            random {Random}
+            other_values {Dict[str, Any]} -- The values of the other attributes by the rule name.
+
+        Returns:
+            str
+        """
+        lower = upper = None
+
+        for rule_name, days, is_upper in self._date_bound_rules:
+            if not ruleset.has_rule(rule_name):
+                continue
+
+            try:
+                bound = Sandglass(other_values.get(rule_name, ruleset.get_rule(rule_name).get_params()[0]))
+                bound = bound.start_of_day().add_day(days).get_datetime()
+
+            except Exception as e:
+                continue
+
+            if is_upper:
+                upper = bound if upper is None else min(upper, bound)
+
+            else:
+                lower = bound if lower is None else max(lower, bound)
+
+        if ruleset.has_rules(['date', 'between']):
+            between_lower, between_upper = [Sandglass(_param).get_datetime()
+                                            for _param in ruleset.get_rule('between').get_params()[:2]]
+            lower = between_lower if lower is None else max(lower, between_lower)
+            upper = between_upper if upper is None else min(upper, between_upper)
+
+        if lower is None:
+            lower = self._base_date if upper is None else upper - timedelta(days=365)
+
+        if upper is None:
+            upper = lower + timedelta(days=365)
+
+        value = lower + timedelta(days=random.randint(0, max((upper - lower).days, 0)))
+
+        return value.strftime(self._get_date_format(ruleset))
+
+    @staticmethod
+    def _get_date_format(ruleset: Ruleset) -> str:
+        """Get the format of the generated dates
+
+        Arguments:
+            ruleset {Ruleset}
+
+        Returns:
+            str
+        """
+        date_format = ','.join(ruleset.get_rule('date').get_params()) if ruleset.has_rule('date') else ''
+
+        return date_format or '%Y-%m-%d'
+
+    @staticmethod
+    def _is_date(param: str) -> bool:
+        """Check if the param of a date rule is a date
+
+        Arguments:
+            param {str}
+
+        Returns:
+            bool
+        """
+        try:
+            Sandglass(param)
+            return True
+
+        except Exception as e:
+            return False
+
+    @staticmethod
+    def _get_other_values(ruleset: Ruleset, data: Optional[dict]) -> Dict[str, Any]:
+        """Get the existing values of the other attributes which the rules depend on
+
+        Arguments:
+            ruleset {Ruleset}
+            data {Optional[dict]}
+
+        Returns:
+            Dict[str, Any] -- The values by the rule name.
+        """
+        other_values = {}
+
+        if data is None:
+            return other_values
+
+        for rule_name in PayloadGenerator._dependent_rule_names:
+            if ruleset.has_rule(rule_name):
+                value_details = JsonPath.compile(ruleset.get_rule(rule_name).get_params()[0]).get_value_details(data)
+
+                if isinstance(value_details, tuple) and value_details[1]:
+                    other_values[rule_name] = value_details[0]
+
+        return other_values
+
+    @staticmethod
+    def _cast_choice(choice: str, value_type: ValueType) -> Any:
+        """Cast the choice of the in rule to the value type
+
+        Arguments:
+            choice {str}
+            value_type {ValueType}
+
+        Returns:
+            Any
+        """
+        if value_type == ValueType.INTEGER:
+            return int(float(choice))
+
+        elif value_type == ValueType.NUMERIC:
+            return float(choice)
+
+        return choice
+
+    @staticmethod
+    def _avoid(value: Any, values: List[Any], change: Callable[[Any], Any]) -> Any:
+        """Change the value until it is not one of the values
+
+        Arguments:
+            value {Any}
+            values {List[Any]}
+            change {Callable[[Any], Any]}
+
+        Returns:
+            Any
+        """
+        while value in values or str(value) in values:
+            value = change(value)
+
+        return value
+
+    @staticmethod
+    def _generate_word(random: Random, length: int) -> str:
+        """Generate a lowercase word
+
+        Arguments:
+            random {Random}
+            length {int}
+
+        Returns:
+            str
+        """
+        return ''.join(random.choice(ascii_lowercase) for _ in range(max(length, 0)))
@@ -0,0 +1,316 @@
+from typing import Any, Dict, List, Tuple, Union, Optional
+from portafilter.exceptions import ValidationError
+from portafilter.explain import PlanExplanation
+from portafilter.json_path import JsonPath
+from portafilter.path_trie import PathTrie
+from portafilter.profile import ValidationProfile, perf_counter_ns
+from portafilter.resolution_cache import ResolutionCache
+from portafilter.rules import RuleList, Ruleset
+from portafilter.stats import ValidationStats
+from portafilter.tracing import Tracer
+
+
+class ValidationPlan:
+
+    # The rules which are compared with the value details of another attribute.
+    _attribute_dependent_rule_names = ['same', 'different']
+
+    # The rules which are compared with the value of another attribute (or a date).
+    _date_related_rule_names = ['after', 'before', 'after_or_equal', 'before_or_equal']
+
+    def __init__(self, rules: Union[dict, RuleList], name: Optional[str] = None):
+        """The init method
+
+        The rules are parsed and prepared once, so the plan can validate any number of payloads
+        without parsing or constructing the rules again.
+
+        Arguments:
+            rules {Union[dict, RuleList]} -- The validation rules or the parsed rule list.
+
+        Keyword Arguments:
+            name {Optional[str]} -- The name of the schema, e.g. the endpoint (default: {None})
+        """
+        self._name = name
+        self._source_rules = rules
+        self._rules = rules if isinstance(rules, RuleList) else RuleList(rules)
+        # The names of the rules which are added by the plan by the attribute, e.g. the date rule of after.
+        self._added_rules = {}
+        steps = []
+
+        for attribute, ruleset in self._rules:
+            rule_names = list(ruleset.get_rules())
+            ruleset = self._prepare_ruleset(ruleset)
+            self._added_rules[attribute] = [_name for _name in ruleset.get_rules() if _name not in rule_names]
+            steps.append((attribute, JsonPath.compile(attribute), ruleset, self._get_dependencies(ruleset)))
+
+        self._steps = tuple(steps)
+
+        # All the attributes are resolved in a single walk into the data.
+        self._trie = PathTrie()
+        for position, (attribute, path, ruleset, dependencies) in enumerate(self._steps):
+            self._trie.insert(path, position)
+
+    def get_name(self) -> Optional[str]:
+        """Get the name of the schema
+
+        Returns:
+            Optional[str]
+        """
+        return self._name
+
+    def get_source_rules(self) -> Union[dict, RuleList]:
+        """Get the rules which the plan is compiled from
+
+        Returns:
+            Union[dict, RuleList]
+        """
+        return self._source_rules
+
+    def get_rules(self) -> RuleList:
+        """Get the parsed rules
+
+        Returns:
+            RuleList
+        """
+        return self._rules
+
+    def explain(self, fan_out: int = 10) -> PlanExplanation:
+        """Explain the work of the plan without validating any data
+
+        Keyword Arguments:
+            fan_out {int} -- The assumed number of the items of each list which a wildcard expands
+            (default: {10})
+
+        Returns:
+            PlanExplanation
+        """
+        return PlanExplanation(self._steps, self._added_rules, fan_out)
+
+    def validate(self, data: Any, cache: Optional[ResolutionCache] = None) -> None:
+        """Validate the input data
+
+        Arguments:
+            data {Any} -- The input data, a dictionary or any object which has an accessor.
+
+        Keyword Arguments:
+            cache {Optional[ResolutionCache]} -- The resolution cache of the run (default: {None})
+
+        Raises:
+            ValidationError
+        """
+        errors = self.errors(data, cache)
+
+        if errors:
+            raise ValidationError(errors=errors)
+
+    def errors(self, data: Any, cache: Optional[ResolutionCache] = None,
+               profile: Optional[ValidationProfile] = None, stats: Optional[ValidationStats] = None,
+               tracer: Optional[Tracer] = None) -> dict:
+        """Get the validation errors of the input data
+
+        Arguments:
+            data {Any} -- The input data, a dictionary or any object which has an accessor.
+
+        Keyword Arguments:
+            cache {Optional[ResolutionCache]} -- The resolution cache of the run, a new one is used by default.
+            It is shared by all the lookups into the data, pass one to see its hits and misses (default: {None})
+            profile {Optional[ValidationProfile]} -- Record the costs of the run into it (default: {None})
+            stats {Optional[ValidationStats]} -- Add the counters of the run to it (default: {None})
+            tracer {Optional[Tracer]} -- Start the spans of the validation phases (default: {None})
+
+        Returns:
+            dict
+        """
+        if cache is None:
+            cache = ResolutionCache()
+
+        if profile is not None or stats is not None or tracer is not None:
+            return self._instrumented_errors(data, cache, profile, stats, tracer)
+
+        steps = self._steps
+        # The params of the dependent rules are resolved on the first visit of each attribute.
+        steps_params = [None] * len(steps)
+        steps_errors = {}
+
+        # The ruleset is stateless, so it is shared between all the list items.
+        for position, concrete_attribute, value, value_exists in self._trie.walk(data, cache):
+            _, _, ruleset, dependencies = steps[position]
+            params = steps_params[position]
+
+            if params is None:
+                params = steps_params[position] = self._get_dependent_params(data, ruleset, dependencies, cache)
+
+            attribute_errors = ruleset.evaluate(concrete_attribute, value, value_exists, params)
+
+            if attribute_errors:
+                steps_errors.setdefault(position, {})[concrete_attribute] = attribute_errors
+
+        return self._merge_errors(steps_errors)
+
+    def _instrumented_errors(self, data: Any, cache: ResolutionCache, profile: Optional[ValidationProfile],
+                             stats: Optional[ValidationStats], tracer: Optional[Tracer]) -> dict:
+        """Get the validation errors of the input data, record the costs, count and trace the work of the run
+
+        It is the errors method with the timers, the counters and the spans, they are kept out of the errors
+        method to cost nothing when they are disabled.
+
+        Arguments:
+            data {Any}
+            cache {ResolutionCache}
+            profile {Optional[ValidationProfile]}
+            stats {Optional[ValidationStats]}
+            tracer {Optional[Tracer]}
+
+        Returns:
+            dict
+        """
+        validate_span = tracer.start_span(Tracer.VALIDATE, {'schema': self._name}) if tracer is not None else None
+        started_at = perf_counter_ns()
+        steps = self._steps
+        steps_params = [None] * len(steps)
+        steps_errors = {}
+        walk = self._trie.walk(data, cache, stats)
+        # The rules are not timed for the profiles which only record the attributes or the path resolution.
+        rules_profile = profile if profile is not None and (
+            profile.has_section(ValidationProfile.RULES) or profile.has_section(ValidationProfile.MESSAGES)
+        ) else None
+
+        while True:
+            resolve_span = tracer.start_span(Tracer.RESOLVE, {}) if tracer is not None else None
+            resolve_started_at = perf_counter_ns() if profile is not None else 0
+
+            try:
+                position, concrete_attribute, value, value_exists = next(walk)
+
+            except StopIteration as e:
+                if profile is not None:
+                    profile.add(ValidationProfile.RESOLUTION, 'walk', perf_counter_ns() - resolve_started_at)
+
+                if tracer is not None:
+                    tracer.end_span(resolve_span)
+                break
+
+            attribute, _, ruleset, dependencies = steps[position]
+            params = steps_params[position]
+
+            if profile is not None:
+                evaluate_started_at = perf_counter_ns()
+                profile.add(ValidationProfile.RESOLUTION, 'walk', evaluate_started_at - resolve_started_at)
+
+            if params is None:
+                params = steps_params[position] = self._get_dependent_params(data, ruleset, dependencies, cache)
+
+                if profile is not None:
+                    profile.add(ValidationProfile.RESOLUTION, 'dependencies', perf_counter_ns() - evaluate_started_at)
+                    evaluate_started_at = perf_counter_ns()
+
+            if tracer is not None:
+                tracer.end_span(resolve_span)
+                evaluate_span = tracer.start_span(Tracer.EVALUATE, {'attribute': attribute})
+
+            attribute_errors = ruleset.evaluate(concrete_attribute, value, value_exists, params, rules_profile, stats,
+                                                attribute, tracer)
+
+            if profile is not None:
+                profile.add(ValidationProfile.ATTRIBUTES, attribute, perf_counter_ns() - evaluate_started_at)
+
+            if tracer is not None:
+                tracer.end_span(evaluate_span)
+
+            if attribute_errors:
+                steps_errors.setdefault(position, {})[concrete_attribute] = attribute_errors
+
+        errors = self._merge_errors(steps_errors)
+        elapsed = perf_counter_ns() - started_at
+
+        if profile is not None:
+            profile.set_total(elapsed)
+
+        if stats is not None:
+            stats.add(runs=1, wall_time=elapsed / 1e9)
+
+        if tracer is not None:
+            tracer.end_span(validate_span)
+
+        return errors
+
+    @staticmethod
+    def _merge_errors(steps_errors: Dict[int, dict]) -> dict:
+        """Merge the errors of the steps in the order of the rules
+
+        Arguments:
+            steps_errors {Dict[int, dict]} -- The errors by the step position.
+
+        Returns:
+            dict
+        """
+        errors = {}
+        for position in sorted(steps_errors):
+            errors.update(steps_errors[position])
+
+        return errors
+
+    def _prepare_ruleset(self, ruleset: Ruleset) -> Ruleset:
+        """Apply the structural changes which the dependent rules need
+
+        Arguments:
+            ruleset {Ruleset}
+
+        Returns:
+            Ruleset
+        """
+        if ruleset.has_one_of_rules(self._date_related_rule_names) and not ruleset.has_rule('date'):
+            ruleset.add_rule('date')
+
+        return ruleset
+
+    def _get_dependencies(self, ruleset: Ruleset) -> Tuple[Tuple[str, JsonPath, bool], ...]:
+        """Get the other attributes which the ruleset depends on
+
+        Arguments:
+            ruleset {Ruleset}
+
+        Returns:
+            Tuple[Tuple[str, JsonPath, bool], ...] -- The tuples of the rule name, the compiled path of
+            the other attribute and the date related flag.
+        """
+        dependencies = []
+
+        for rule_name in self._attribute_dependent_rule_names + self._date_related_rule_names:
+            _rule = ruleset.get_rule(rule_name)
+            if _rule:
+                dependencies.append((
+                    rule_name,
+                    JsonPath.compile(_rule.get_params()[0]),
+                    rule_name in self._date_related_rule_names,
+                ))
+
+        return tuple(dependencies)
+
+    @staticmethod
+    def _get_dependent_params(data: Any, ruleset: Ruleset, dependencies: Tuple[Tuple[str, JsonPath, bool], ...],
+                              cache: ResolutionCache) -> Dict[str, List[Any]]:
+        """Get the params of the dependent rules for the current data
+
+        Arguments:
+            data {Any}
+            ruleset {Ruleset}
+            dependencies {Tuple[Tuple[str, JsonPath, bool], ...]}
+            cache {ResolutionCache}
+
+        Returns:
+            Dict[str, List[Any]] -- The rule params by the rule name.
+        """
+        params = {}
+
+        for rule_name, other_path, is_date_related in dependencies:
+            other_value_details = other_path.get_value_details(data, cache=cache)
+            rule_params = ruleset.get_rule(rule_name).get_params()
+
+            if not is_date_related:
+                params[rule_name] = rule_params + [other_value_details]
+
+            elif isinstance(other_value_details, tuple) and other_value_details[1]:
+                params[rule_name] = rule_params + [other_value_details[0]]
+
+        return params
@@ -0,0 +1,133 @@
+from typing import Dict, List, Optional
+
+try:
+    from time import perf_counter_ns
+
+except ImportError:
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        """The perf_counter_ns of Python 3.7 for Python 3.6
+
+        Returns:
+            int -- The nanoseconds.
+        """
+        return int(perf_counter() * 1e9)
+
+
+class ValidationProfile:
+
+    # The profiled sections of the validation.
+    RULES = 'rules'
+    MESSAGES = 'messages'
+    ATTRIBUTES = 'attributes'
+    RESOLUTION = 'resolution'
+
+    def __init__(self, sections: Optional[List[str]] = None):
+        """The init method
+
+        The call counts and the cumulative nanoseconds are kept by the section and the name, e.g. the rule name
+        in the rules section or the attribute pattern in the attributes section.
+
+        Keyword Arguments:
+            sections {Optional[List[str]]} -- The recorded sections, all of them by default. The rules are not
+            timed if neither the rules nor the messages section is recorded (default: {None})
+        """
+        self._sections = {
+            _section: {} for _section in (sections or [self.RULES, self.MESSAGES, self.ATTRIBUTES, self.RESOLUTION])
+        }
+        self._total = 0
+
+    def add(self, section: str, name: str, elapsed: int, calls: int = 1) -> None:
+        """Add the calls of a name
+
+        Arguments:
+            section {str}
+            name {str}
+            elapsed {int} -- The nanoseconds.
+
+        Keyword Arguments:
+            calls {int} -- (default: {1})
+        """
+        entries = self._sections.get(section)
+
+        if entries is None:
+            return
+
+        entry = entries.get(name)
+
+        if entry is None:
+            entries[name] = [calls, elapsed]
+
+        else:
+            entry[0] += calls
+            entry[1] += elapsed
+
+    def set_total(self, elapsed: int) -> None:
+        """Set the wall time of the validation
+
+        Arguments:
+            elapsed {int} -- The nanoseconds.
+        """
+        self._total = elapsed
+
+    def get_report(self) -> Dict[str, object]:
+        """Get the structured report
+
+        The entries of each section are sorted by the cumulative time, the slowest first. The rules entries
+        only count the passes calls, the message rendering of the failing values is in the messages section.
+
+        Returns:
+            Dict[str, object] -- The total seconds and the list of the name, the calls and the seconds by the
+            section.
+        """
+        report = {'total': self._total / 1e9}
+
+        for section, entries in self._sections.items():
+            report[section] = [
+                {'name': _name, 'calls': _calls, 'seconds': _elapsed / 1e9}
+                for _name, (_calls, _elapsed) in sorted(entries.items(), key=lambda _item: -_item[1][1])
+            ]
+
+        return report
+
+    def render(self, limit: int = 10) -> str:
+        """Render the report as the text tables
+
+        Keyword Arguments:
+            limit {int} -- The max number of the entries of each section (default: {10})
+
+        Returns:
+            str
+        """
+        report = self.get_report()
+        lines = [f"total: {report['total'] * 1e3:.3f}ms"]
+
+        for section in self._sections:
+            lines.append('')
+            lines.append(f"{section:<48}{'calls':>10}{'ms':>12}{'%':>8}")
+
+            for entry in report[section][:limit]:
+                share = entry['seconds'] / report['total'] * 100 if report['total'] else 0
+                lines.append(f"{entry['name']:<48}{entry['calls']:>10}{entry['seconds'] * 1e3:>12.3f}{share:>8.1f}")
+
+        return '\n'.join(lines)
+
+    def has_section(self, section: str) -> bool:
+        """Check if the section is recorded
+
+        Arguments:
+            section {str}
+
+        Returns:
+            bool
+        """
+        return section in self._sections
+
+    def get_sections(self) -> List[str]:
+        """Get the section names
+
+        Returns:
+            List[str]
+        """
+        return list(self._sections)
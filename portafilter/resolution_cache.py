@@ -0,0 +1,73 @@
+from typing import Any, Optional, Tuple
+
+
+class ResolutionCache:
+
+    def __init__(self):
+        """The init method
+
+        The cache keeps the resolved value details by the dotted path of the resolved prefixes. It is meant to
+        live for a single validation run of a single document.
+        """
+        self._values = {}
+        self._hits = 0
+        self._misses = 0
+
+    def set(self, key: str, value: Any, value_exists: bool) -> None:
+        """Set the value details of a resolved path
+
+        Arguments:
+            key (str) -- The dotted path.
+            value (Any)
+            value_exists (bool)
+        """
+        self._values[key] = (value, value_exists)
+
+    def find(self, keys: Tuple[str, ...]) -> Optional[Tuple[int, Any, bool]]:
+        """Find the longest resolved prefix
+
+        A missing prefix is only used for the path itself, the longer paths may still exist as the flat keys,
+        e.g. the a.b key when there is no a key.
+
+        Arguments:
+            keys (Tuple[str, ...]) -- The dotted paths of the prefixes from the shortest to the longest.
+
+        Returns:
+            Optional[Tuple[int, Any, bool]] -- The number of the resolved steps, the value and the existed flag.
+        """
+        values = self._values
+        last_position = len(keys) - 1
+
+        for position in range(last_position, -1, -1):
+            value_details = values.get(keys[position])
+
+            if value_details is not None and (value_details[1] or position == last_position):
+                self._hits += 1
+                return position + 1, value_details[0], value_details[1]
+
+        self._misses += 1
+        return None
+
+    def get_hits(self) -> int:
+        """Get the number of the lookups which are resolved from the cache
+
+        Returns:
+            int
+        """
+        return self._hits
+
+    def get_misses(self) -> int:
+        """Get the number of the lookups which are resolved from the root
+
+        Returns:
+            int
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        """The len magic method
+
+        Returns:
+            int -- The number of the cached paths.
+        """
+        return len(self._values)
@@ -0,0 +1,78 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class RuleRegistry:
+
+    # The rule factories by the rule name, e.g. the rule classes. The lazy ones are the 'module:Class' import
+    # paths until their first use.
+    _factories = {}
+
+    @classmethod
+    def register(cls, rule_name: str, factory: Union[Callable[..., Any], str]) -> None:
+        """Register a rule under a name
+
+        The factory is called with the rule params of the rule string, e.g. 'max_words:10' calls it with '10'.
+        An import path is loaded on the first use of the rule, so registering a large rule library does not
+        import it.
+
+        Arguments:
+            rule_name (str) -- The name in the rule strings, e.g. max_words.
+            factory (Union[Callable[..., Any], str]) -- The rule class, any callable which returns a rule or
+            the 'module:Class' import path of it.
+        """
+        cls._factories[rule_name] = factory
+
+    @classmethod
+    def unregister(cls, rule_name: str) -> None:
+        """Unregister a rule
+
+        Arguments:
+            rule_name (str)
+        """
+        cls._factories.pop(rule_name, None)
+
+    @classmethod
+    def get(cls, rule_name: str) -> Optional[Callable[..., Any]]:
+        """Get the factory of a rule
+
+        Arguments:
+            rule_name (str)
+
+        Returns:
+            Optional[Callable[..., Any]] -- None if the rule is not registered.
+        """
+        factory = cls._factories.get(rule_name)
+
+        if isinstance(factory, str):
+            factory = cls._factories[rule_name] = cls._load(factory)
+
+        return factory
+
+    @classmethod
+    def get_names(cls) -> Dict[str, bool]:
+        """Get the registered rule names
+
+        Returns:
+            Dict[str, bool] -- The loaded flag by the rule name, the lazy rules are not loaded until their
+            first use.
+        """
+        return {_rule_name: not isinstance(_factory, str) for _rule_name, _factory in cls._factories.items()}
+
+    @staticmethod
+    def _load(path: str) -> Callable[..., Any]:
+        """Import the factory of the 'module:Class' path
+
+        Arguments:
+            path (str)
+
+        Returns:
+            Callable[..., Any]
+        """
+        module_name, qualname = path.split(':')
+        factory = import_module(module_name)
+
+        for name in qualname.split('.'):
+            factory = getattr(factory, name)
+
+        return factory
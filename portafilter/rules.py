@@ -1,17 +1,38 @@
 from collections import OrderedDict
+from copy import copy
+from functools import lru_cache
 from abc import ABC, abstractmethod
-from typing import Any, Tuple, List, Union, Callable
+from typing import Any, Tuple, List, Union, Callable, Dict, Optional
 from portafilter.enums import ValueType
-from portafilter.exceptions import InvalidRule, InvalidRuleParam, ValidationError
+from portafilter.exceptions import ImmutableRule, InvalidRule, InvalidRuleParam, ValidationError
+from portafilter.profile import ValidationProfile, perf_counter_ns
+from portafilter.rule_registry import RuleRegistry
+from portafilter.stats import ValidationStats
+from portafilter.tracing import Tracer
 from portafilter.sandglass import Sandglass, InvalidDate, ParseSpecialKey
 from portafilter.utils import trans
 from re import match as regex_match
 from numbers import Number
 from inspect import isclass
+from threading import Lock
+from weakref import WeakValueDictionary
 
 
 class Rule(ABC):
 
+    __slots__ = ('_params', '_metadata', '_parsed_params', '_is_shared', '__weakref__')
+
+    # The relative cost of the passes call, a type check is 1. It is the estimate of the plan explanation.
+    cost = 1
+
+    # The instances of the class are shared when they are equal by the params and the metadata. The classes opt in
+    # one by one, it is not inherited, and the ones which keep any other state, e.g. in their own slots, must not.
+    shareable = False
+
+    # The shared rules by the class, the params and the metadata, they are shared by all the rulesets.
+    _shared_rules = WeakValueDictionary()
+    _shared_rules_lock = Lock()
+
     def __init__(self, *args, **kwargs):
         """The init method.
         """
@@ -19,6 +40,95 @@ class Rule(ABC):
         self._metadata = {
             'value_type': None,
         }
+        # The typed form of the own params, it is parsed by prepare once the metadata is set.
+        self._parsed_params = None
+        self._is_shared = False
+
+    def share(self) -> 'Rule':
+        """Get the shared rule which equals the rule
+
+        The rules are immutable once they are shared, e.g. all the string rules of the required strings are
+        a single object. Only the classes which opt in by shareable are shared, the rules which keep any other
+        state in their __dict__ are not.
+
+        Returns:
+            Rule -- The shared rule, or the rule itself if it cannot be shared.
+        """
+        if not Rule._is_shareable_class(type(self)) or getattr(self, '__dict__', None):
+            return self
+
+        try:
+            key = (type(self), tuple(self._params), tuple(sorted(self._metadata.items())))
+            hash(key)
+
+        except TypeError as e:
+            # The rules with the unhashable params or metadata are not shared.
+            return self
+
+        with Rule._shared_rules_lock:
+            rule = Rule._shared_rules.get(key)
+
+            if rule is None:
+                self._is_shared = True
+                rule = Rule._shared_rules[key] = self
+
+        return rule
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _is_shareable_class(rule_class: type) -> bool:
+        """Check the instances of the rule class can be shared
+
+        The class must opt in by its own shareable attribute, and neither it nor its bases below Rule may add
+        slots or override the init method, their state is not a part of the shared key.
+
+        Arguments:
+            rule_class {type}
+
+        Returns:
+            bool
+        """
+        if not rule_class.__dict__.get('shareable', False):
+            return False
+
+        for _class in rule_class.__mro__:
+            if _class is Rule:
+                break
+
+            if _class.__dict__.get('__slots__') or '__init__' in _class.__dict__:
+                return False
+
+        return True
+
+    def is_shared(self) -> bool:
+        """Check the rule is shared, so it is immutable
+
+        Returns:
+            bool
+        """
+        return self._is_shared
+
+    def copy(self) -> 'Rule':
+        """Get a mutable copy of the rule
+
+        Returns:
+            Rule
+        """
+        rule = copy(self)
+        rule._params = list(self._params)
+        rule._metadata = dict(self._metadata)
+        rule._is_shared = False
+
+        return rule
+
+    def _check_mutable(self) -> None:
+        """Check the rule is not shared
+
+        Raises:
+            ImmutableRule
+        """
+        if self._is_shared:
+            raise ImmutableRule(f'The shared {type(self).__name__} is immutable, change a copy of it.')
 
     def get_params(self) -> List[Any]:
         """Get the rule params
@@ -33,8 +143,56 @@ class Rule(ABC):
 
         Arguments:
             value (Any) -- The rule parameter.
+
+        Raises:
+            ImmutableRule
         """
+        self._check_mutable()
         self._params.append(value)
+        self._parsed_params = None
+
+    def parse_params(self, params: List[Any]) -> Any:
+        """Parse the params into the typed form which the passes method compares with
+
+        The base rule keeps the params as they are.
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            Any
+
+        Raises:
+            InvalidRuleParam
+        """
+        return params
+
+    def prepare(self) -> None:
+        """Parse the own params once, it is called by the ruleset when the metadata is set
+
+        Raises:
+            InvalidRuleParam
+        """
+        self._parsed_params = self.parse_params(self._params)
+
+    def get_parsed_params(self, params: List[Any]) -> Any:
+        """Get the typed params
+
+        The own params of a prepared rule are parsed once, the other params are parsed on each call.
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            Any
+
+        Raises:
+            InvalidRuleParam
+        """
+        if params is self._params and self._parsed_params is not None:
+            return self._parsed_params
+
+        return self.parse_params(params)
 
     def set_metadata(self, key: Union[str, List[Tuple[str, Any]]], value: Any = None) -> None:
         """Set the metadata.
@@ -44,7 +202,12 @@ class Rule(ABC):
 
         Keyword Arguments:
             value (Any) -- (default None)
+
+        Raises:
+            ImmutableRule
         """
+        self._check_mutable()
+
         if isinstance(key, list):
             for _key, _value in key:
                 self._metadata[_key] = _value
@@ -57,7 +220,12 @@ class Rule(ABC):
 
         Arguments:
             key (Union[str, List[str]])
+
+        Raises:
+            ImmutableRule
         """
+        self._check_mutable()
+
         if isinstance(key, list):
 
             for _key in key:
@@ -111,20 +279,26 @@ class Rule(ABC):
         """
         return self.get_metadata('nullable')
 
-    def is_skippable(self) -> bool:
+    def is_skippable(self, value: Any, value_exists: bool = True) -> bool:
         """Skip the rule check
 
+        Arguments:
+            value {Any}
+
+        Keyword Arguments:
+            value_exists {bool} -- The value exists in the main data (default: {True})
+
         Returns:
             bool
         """
-        if self.get_metadata('value') is not None:
+        if value is not None:
             return False
 
         elif self.is_nullable():
             return True
 
         elif not self.is_required():
-            return not self.get_metadata('value_exists')
+            return not value_exists
 
         return False
 
@@ -159,6 +333,12 @@ class Rule(ABC):
 
 class RequiredRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 5
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -192,6 +372,10 @@ class RequiredRule(Rule):
 
 class NullableRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -221,6 +405,10 @@ class NullableRule(Rule):
 
 class StringRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -250,6 +438,30 @@ class StringRule(Rule):
 
 class MinRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 5
+
+    def parse_params(self, params: List[Any]) -> float:
+        """Parse the min param
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            float
+
+        Raises:
+            InvalidRuleParam
+        """
+        try:
+            return float(params[0])
+
+        except (IndexError, TypeError, ValueError) as e:
+            raise InvalidRuleParam(f'Invalid min rule params: {params}')
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -266,12 +478,7 @@ class MinRule(Rule):
             InvalidRuleParam
         """
         value_type = self.get_value_type()
-
-        try:
-            min_value = float(params[0])
-
-        except Exception as e:
-            raise InvalidRuleParam
+        min_value = self.get_parsed_params(params)
 
         if value_type == ValueType.STRING:
             return isinstance(value, str) and len(value) >= min_value
@@ -315,6 +522,30 @@ class MinRule(Rule):
 
 class MaxRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 5
+
+    def parse_params(self, params: List[Any]) -> float:
+        """Parse the max param
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            float
+
+        Raises:
+            InvalidRuleParam
+        """
+        try:
+            return float(params[0])
+
+        except (IndexError, TypeError, ValueError) as e:
+            raise InvalidRuleParam(f'Invalid max rule params: {params}')
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -331,12 +562,7 @@ class MaxRule(Rule):
             InvalidRuleParam
         """
         value_type = self.get_value_type()
-
-        try:
-            max_value = float(params[0])
-
-        except Exception as e:
-            raise InvalidRuleParam
+        max_value = self.get_parsed_params(params)
 
         if value_type == ValueType.STRING:
             return isinstance(value, str) and len(value) <= max_value
@@ -380,6 +606,30 @@ class MaxRule(Rule):
 
 class SizeRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 5
+
+    def parse_params(self, params: List[Any]) -> float:
+        """Parse the size param
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            float
+
+        Raises:
+            InvalidRuleParam
+        """
+        try:
+            return float(params[0])
+
+        except (IndexError, TypeError, ValueError) as e:
+            raise InvalidRuleParam(f'Invalid size rule params: {params}')
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -396,12 +646,7 @@ class SizeRule(Rule):
             InvalidRuleParam
         """
         value_type = self.get_value_type()
-
-        try:
-            size_value = float(params[0])
-
-        except Exception as e:
-            raise InvalidRuleParam
+        size_value = self.get_parsed_params(params)
 
         if value_type == ValueType.STRING:
             return isinstance(value, str) and len(value) == size_value
@@ -445,6 +690,10 @@ class SizeRule(Rule):
 
 class IntegerRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -474,6 +723,12 @@ class IntegerRule(Rule):
 
 class NumericRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 3
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -503,6 +758,10 @@ class NumericRule(Rule):
 
 class BooleanRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -532,6 +791,33 @@ class BooleanRule(Rule):
 
 class InRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 5
+
+    def parse_params(self, params: List[Any]) -> Tuple[Any, ...]:
+        """Parse the allowed values, they are the numbers for the numeric values
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            Tuple[Any, ...]
+
+        Raises:
+            InvalidRuleParam
+        """
+        if self.is_numeric_value_type():
+            try:
+                return tuple(float(_param) for _param in params)
+
+            except (TypeError, ValueError) as e:
+                raise InvalidRuleParam(f'Invalid in rule params: {params}')
+
+        return tuple(params)
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -543,10 +829,7 @@ class InRule(Rule):
         Returns:
             bool
         """
-        if self.get_value_type() in [ValueType.NUMERIC, ValueType.INTEGER]:
-            params = [float(_param) for _param in params]
-
-        return value in params
+        return value in self.get_parsed_params(params)
 
     def message(self, attribute: str, value: Any, params: List[str]) -> str:
         """The validation error message.
@@ -564,6 +847,10 @@ class InRule(Rule):
 
 class NotInRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -593,6 +880,10 @@ class NotInRule(Rule):
 
 class SameRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -623,6 +914,10 @@ class SameRule(Rule):
 
 class DifferentRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -653,6 +948,12 @@ class DifferentRule(Rule):
 
 class EmailRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 10
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -683,6 +984,12 @@ class EmailRule(Rule):
 
 class ListRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 10
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -758,6 +1065,10 @@ class ListRule(Rule):
 
 class DictRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -803,6 +1114,12 @@ class DictRule(Rule):
 
 class DateRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 100
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -843,6 +1160,12 @@ class DateRule(Rule):
 
 class AfterRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 300
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -880,6 +1203,12 @@ class AfterRule(Rule):
 
 class AfterOrEqualRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 300
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -917,6 +1246,12 @@ class AfterOrEqualRule(Rule):
 
 class BeforeRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 300
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -954,6 +1289,12 @@ class BeforeRule(Rule):
 
 class BeforeOrEqualRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 300
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -991,6 +1332,12 @@ class BeforeOrEqualRule(Rule):
 
 class StartsWithRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 2
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -1025,6 +1372,12 @@ class StartsWithRule(Rule):
 
 class EndsWithRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 2
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -1059,6 +1412,12 @@ class EndsWithRule(Rule):
 
 class ContainsRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 2
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -1095,6 +1454,12 @@ class ContainsRule(Rule):
 
 class ContainsOneOfRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 2
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -1131,6 +1496,36 @@ class ContainsOneOfRule(Rule):
 
 class BetweenRule(Rule):
 
+    __slots__ = ()
+
+    shareable = True
+
+    cost = 10
+
+    def parse_params(self, params: List[Any]) -> Tuple[Any, Any]:
+        """Parse the min and the max params
+
+        The dates are parsed once, except the parsing special keys, e.g. today, which are parsed on each call.
+
+        Arguments:
+            params {List[Any]}
+
+        Returns:
+            Tuple[Any, Any] -- The floats, or the dates and the special keys.
+
+        Raises:
+            InvalidRuleParam
+        """
+        try:
+            if self.get_metadata('is_date'):
+                return tuple(_param if Sandglass.is_parse_special_key(_param) else Sandglass(_param)
+                             for _param in (params[0], params[1]))
+
+            return float(params[0]), float(params[1])
+
+        except Exception as e:
+            raise InvalidRuleParam(f'Invalid between rule params: {params}')
+
     def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
         """Determine if the validation rule passes.
 
@@ -1147,22 +1542,13 @@ class BetweenRule(Rule):
             InvalidRuleParam
         """
         value_type = self.get_value_type()
-
-        try:
-            if self.get_metadata('is_date'):
-                min_value = Sandglass(params[0])
-                max_value = Sandglass(params[1])
-
-            else:
-                min_value = float(params[0])
-                max_value = float(params[1])
-
-        except Exception as e:
-            raise InvalidRuleParam
+        min_value, max_value = self.get_parsed_params(params)
 
         if value_type == ValueType.STRING:
             if self.get_metadata('is_date'):
                 try:
+                    min_value = Sandglass(min_value) if isinstance(min_value, str) else min_value
+                    max_value = Sandglass(max_value) if isinstance(max_value, str) else max_value
                     parsed_value = Sandglass(value)
                     return parsed_value >= min_value and parsed_value <= max_value
 
@@ -1211,20 +1597,122 @@ class BetweenRule(Rule):
         return trans(message_key, attributes={'attribute': attribute, 'min': params[0], 'max': params[1]})
 
 
-class Ruleset:
+# The built-in rules by their names in the rule strings.
+RuleRegistry.register('required', RequiredRule)
+RuleRegistry.register('nullable', NullableRule)
+RuleRegistry.register('string', StringRule)
+RuleRegistry.register('min', MinRule)
+RuleRegistry.register('max', MaxRule)
+RuleRegistry.register('size', SizeRule)
+RuleRegistry.register('integer', IntegerRule)
+RuleRegistry.register('numeric', NumericRule)
+RuleRegistry.register('boolean', BooleanRule)
+RuleRegistry.register('in', InRule)
+RuleRegistry.register('not_in', NotInRule)
+RuleRegistry.register('same', SameRule)
+RuleRegistry.register('different', DifferentRule)
+RuleRegistry.register('email', EmailRule)
+RuleRegistry.register('list', ListRule)
+RuleRegistry.register('dict', DictRule)
+RuleRegistry.register('date', DateRule)
+RuleRegistry.register('after', AfterRule)
+RuleRegistry.register('after_or_equal', AfterOrEqualRule)
+RuleRegistry.register('before', BeforeRule)
+RuleRegistry.register('before_or_equal', BeforeOrEqualRule)
+RuleRegistry.register('starts_with', StartsWithRule)
+RuleRegistry.register('ends_with', EndsWithRule)
+RuleRegistry.register('contains', ContainsRule)
+RuleRegistry.register('contains_one_of', ContainsOneOfRule)
+RuleRegistry.register('between', BetweenRule)
+
+
+class RulesetMeta(type):
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """The setattr magic method, reassigning the rules of a ruleset class drops the parsed rules of all the
+        ruleset classes, e.g. of the ones which nest it
+
+        Arguments:
+            name {str}
+            value {Any}
+        """
+        super().__setattr__(name, value)
+
+        if name == 'rules':
+            Ruleset._bump_rules_version()
+
+    def __delattr__(cls, name: str) -> None:
+        """The delattr magic method
+
+        Arguments:
+            name {str}
+        """
+        super().__delattr__(name)
+
+        if name == 'rules':
+            Ruleset._bump_rules_version()
+
+
+class Ruleset(metaclass=RulesetMeta):
 
     # Static variable for the custom ruleset.
     rules = None
 
+    # The version of the rules of the ruleset classes, the parsed rules of a class are cached with the version
+    # which they are parsed at. The rules lists are not watched, reassign the rules to change them.
+    _rules_version = 0
+
+    # The rules which make the values of the ruleset dates, the plan adds the date rule for the others.
+    _date_rule_names = ['date', 'after', 'after_or_equal', 'before', 'before_or_equal']
+
     def __init__(self, rules: Union[str, List[Union[Rule, str]]]):
         """The init method
 
+        Arguments:
+            rules {Union[str, List[Union[Rule, str]]]}
+        """
+        if rules is not None and rules is type(self).rules:
+            # The rules of the class are parsed once, the rules are shared, so each instance copies the dict.
+            self._rules = OrderedDict(type(self)._get_class_rules())
+
+        else:
+            self._build(rules)
+
+        self._errors = []
+
+    def _build(self, rules: Union[str, List[Union[Rule, str]]]) -> None:
+        """Parse the rules and set their metadata
+
         Arguments:
             rules {Union[str, List[Union[Rule, str]]]}
         """
         self._rules = self._parse(rules)
         self._set_rules_metadata()
-        self._errors = []
+
+    @classmethod
+    def _get_class_rules(cls) -> OrderedDict:
+        """Get the parsed rules of the class, they are parsed on the first use and after the rules of any ruleset
+        class are reassigned
+
+        Returns:
+            OrderedDict -- The cached dict, it must not be changed.
+        """
+        cached = cls.__dict__.get('_parsed_rules')
+        version = Ruleset._rules_version
+
+        if cached is None or cached[0] != version:
+            ruleset = cls.__new__(cls)
+            ruleset._build(cls.rules)
+            cached = (version, ruleset._rules)
+            type.__setattr__(cls, '_parsed_rules', cached)
+
+        return cached[1]
+
+    @classmethod
+    def _bump_rules_version(cls) -> None:
+        """Drop the parsed rules of all the ruleset classes
+        """
+        type.__setattr__(Ruleset, '_rules_version', Ruleset._rules_version + 1)
 
     def _parse(self, rules: Union[str, List[Union[Rule, str]]]) -> OrderedDict:
         """Parse the rules
@@ -1237,21 +1725,21 @@ class Ruleset:
         """
         parsed_rules = OrderedDict()
 
-        rules_list = rules if isinstance(rules, list) else rules.split('|')
+        rules_list = rules if isinstance(rules, list) else [rules]
 
         for _rule in rules_list:
             if isinstance(_rule, str):
-                _rule_params = _rule.split(':')
-                _rule_name = _rule_params.pop(0)
-                _rule_params = self._split_rule_params(':'.join(_rule_params))
+                # The items of a rules list are single rules, their params may have the | separator, e.g. in:a|b
+                spec = self.parse_spec(_rule) if _rule is rules else (self.parse_token(_rule),)
 
-                rule_class = globals().get(f"{''.join([_.capitalize() for _ in _rule_name.split('_')])}Rule")
+                for _rule_name, _rule_params in spec:
+                    rule_factory = RuleRegistry.get(_rule_name)
 
-                if rule_class:
-                    parsed_rules[_rule_name] = rule_class(*_rule_params)
+                    if rule_factory:
+                        parsed_rules[_rule_name] = rule_factory(*_rule_params)
 
-                else:
-                    raise InvalidRule(f"Invalid rule: {_rule_name}")
+                    else:
+                        raise InvalidRule(f"Invalid rule: {_rule_name}")
 
             elif isinstance(_rule, object):
 
@@ -1261,12 +1749,12 @@ class Ruleset:
                         parsed_rules[_rule.__name__] = _rule()
 
                     elif issubclass(_rule, Ruleset) and isinstance(_rule, Callable):
-                        _rule_instance = _rule(_rule.rules)
-                        for _ruleset_rule_name, _ruleset_rule_class in _rule_instance.get_rules().items():
+                        for _ruleset_rule_name, _ruleset_rule_class in _rule._get_class_rules().items():
                             parsed_rules[_ruleset_rule_name] = _ruleset_rule_class
 
                 else:
-                    parsed_rules[_rule.__class__.__name__] = _rule
+                    # The metadata is set on a copy and the copy is shared, the caller's rule stays mutable.
+                    parsed_rules[_rule.__class__.__name__] = _rule.copy()
 
         return parsed_rules
 
@@ -1339,7 +1827,39 @@ class Ruleset:
             rule (str)
         """
         # self._rules = self._parse(rule)
-        self._rules[rule] = self._parse(rule)[rule]
+        self._rules[rule] = self._parse(rule)[rule].share()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_spec(rules: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Parse the rule string into the rule names and params
+
+        The specs are immutable, so they are cached and shared by the rule string, the schemas which repeat
+        a rule string split it once.
+
+        Arguments:
+            rules {str} -- E.g. required|string|max:255
+
+        Returns:
+            Tuple[Tuple[str, Tuple[str, ...]], ...] -- The tuples of the rule name and the rule params.
+        """
+        return tuple(Ruleset.parse_token(_rule) for _rule in rules.split('|'))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_token(rule: str) -> Tuple[str, Tuple[str, ...]]:
+        """Parse a single rule into the rule name and params
+
+        Arguments:
+            rule {str} -- E.g. max:255
+
+        Returns:
+            Tuple[str, Tuple[str, ...]]
+        """
+        _rule_params = rule.split(':')
+        _rule_name = _rule_params.pop(0)
+
+        return _rule_name, tuple(Ruleset._split_rule_params(':'.join(_rule_params)))
 
     @staticmethod
     def _split_rule_params(rule_params: str) -> List[str]:
@@ -1377,14 +1897,21 @@ class Ruleset:
         value_type = self.get_value_type()
         is_required = 'required' in self._rules
         is_nullable = 'nullable' in self._rules
+        is_date = self.has_one_of_rules(self._date_rule_names)
         for rule_name, rule in self._rules.items():
+            # The shared rules of the nested rulesets are copied, the metadata of this ruleset differs.
+            rule = rule.copy() if rule.is_shared() else rule
             rule.set_metadata([
                 ('value_type', value_type),
                 ('required', is_required),
                 ('nullable', is_nullable),
+                ('is_date', is_date),
             ])
+            rule.prepare()
+            self._rules[rule_name] = rule.share()
 
-    def validate(self, attribute: str, value: Any, value_exists: bool = True) -> None:
+    def validate(self, attribute: str, value: Any, value_exists: bool = True,
+                 params: Optional[Dict[str, List[Any]]] = None) -> None:
         """Validate the ruleset
 
         Arguments:
@@ -1393,26 +1920,126 @@ class Ruleset:
 
         Keyword Arguments:
             value_exists {bool} -- The value exists in the main data (default: {True})
+            params {Optional[Dict[str, List[Any]]]} -- The rule params which override the rule's own
+            params by the rule name (default: {None})
 
         Raises:
             ValidationError
         """
-        self._clear_errors()
+        self._errors = self.evaluate(attribute, value, value_exists, params)
+
+        if self.has_error():
+            raise ValidationError
+
+    def evaluate(self, attribute: str, value: Any, value_exists: bool = True,
+                 params: Optional[Dict[str, List[Any]]] = None, profile: Optional[ValidationProfile] = None,
+                 stats: Optional[ValidationStats] = None, pattern: Optional[str] = None,
+                 tracer: Optional[Tracer] = None) -> List[str]:
+        """Evaluate the ruleset and get the error messages
+
+        It does not change the state of the ruleset or its rules, so a single ruleset can be shared
+        between the list items and the threads.
+
+        Arguments:
+            attribute {str}
+            value {Any}
+
+        Keyword Arguments:
+            value_exists {bool} -- The value exists in the main data (default: {True})
+            params {Optional[Dict[str, List[Any]]]} -- The rule params which override the rule's own
+            params by the rule name (default: {None})
+            profile {Optional[ValidationProfile]} -- Record the costs of the rules into it (default: {None})
+            stats {Optional[ValidationStats]} -- Count the evaluated, the skipped and the failed rules
+            (default: {None})
+            pattern {Optional[str]} -- The attribute pattern which the failed rules are counted by in the stats,
+            e.g. products.*.name (default: {attribute})
+            tracer {Optional[Tracer]} -- Start a span for the message of each failed rule (default: {None})
+
+        Returns:
+            List[str]
+        """
+        if profile is not None or stats is not None or tracer is not None:
+            return self._instrumented_evaluate(attribute, value, value_exists, params, profile, stats,
+                                               pattern or attribute, tracer)
+
+        errors = []
 
         for rule_name, rule in self._rules.items():
 
-            # Adding the temporary metadata
-            rule.set_metadata([('value_exists', value_exists), ('value', value)])
+            if rule.is_skippable(value, value_exists):
+                continue
 
-            if not rule.is_skippable() and not rule.passes(attribute, value, rule.get_params()):
+            rule_params = params[rule_name] if params and rule_name in params else rule.get_params()
 
-                self._errors.append(rule.message(attribute, value, rule.get_params()))
+            if not rule.passes(attribute, value, rule_params):
+                errors.append(rule.message(attribute, value, rule_params))
 
-            # Removing the temporary metadata
-            rule.unset_metadata(['value_exists', 'value'])
+        return errors
 
-        if self.has_error():
-            raise ValidationError
+    def _instrumented_evaluate(self, attribute: str, value: Any, value_exists: bool,
+                               params: Optional[Dict[str, List[Any]]], profile: Optional[ValidationProfile],
+                               stats: Optional[ValidationStats], pattern: str, tracer: Optional[Tracer]) -> \
+            List[str]:
+        """Evaluate the ruleset, record the costs of the rules and their messages, count and trace the rules
+
+        Arguments:
+            attribute {str}
+            value {Any}
+            value_exists {bool}
+            params {Optional[Dict[str, List[Any]]]}
+            profile {Optional[ValidationProfile]}
+            stats {Optional[ValidationStats]}
+            pattern {str}
+            tracer {Optional[Tracer]}
+
+        Returns:
+            List[str]
+        """
+        errors = []
+        skipped = 0
+
+        for rule_name, rule in self._rules.items():
+
+            if rule.is_skippable(value, value_exists):
+                skipped += 1
+                continue
+
+            rule_params = params[rule_name] if params and rule_name in params else rule.get_params()
+
+            # The rules are only timed for the profile, the counters and the spans need no clock.
+            if profile is not None:
+                started_at = perf_counter_ns()
+                rule_passes = rule.passes(attribute, value, rule_params)
+                passed_at = perf_counter_ns()
+                profile.add(ValidationProfile.RULES, rule_name, passed_at - started_at)
+
+            else:
+                rule_passes = rule.passes(attribute, value, rule_params)
+
+            if not rule_passes:
+                if tracer is not None:
+                    span = tracer.start_span(Tracer.RENDER, {'attribute': pattern, 'rule': rule_name})
+                    errors.append(rule.message(attribute, value, rule_params))
+                    tracer.end_span(span)
+
+                else:
+                    errors.append(rule.message(attribute, value, rule_params))
+
+                if profile is not None:
+                    profile.add(ValidationProfile.MESSAGES, rule_name, perf_counter_ns() - passed_at)
+
+                if stats is not None:
+                    stats.add_failure(pattern, rule_name)
+
+        if stats is not None:
+            stats.add(
+                values_visited=1,
+                rules_evaluated=len(self._rules) - skipped,
+                rules_skipped=skipped,
+                messages_rendered=len(errors),
+            )
+
+        return errors
 
     def has_error(self) -> bool:
         """Check the failure status.
@@ -1442,7 +2069,10 @@ class Ruleset:
             rule_name (str) -- The rule name.
             metadata (Tuple[str, Any]) -- The rule metadata.
         """
-        self.get_rule(rule_name).set_metadata(metadata[0], metadata[1])
+        rule = self.get_rule(rule_name).copy()
+        rule.set_metadata(metadata[0], metadata[1])
+        rule.prepare()
+        self._rules[rule_name] = rule.share()
 
 
 class RuleList:
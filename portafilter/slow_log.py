@@ -0,0 +1,148 @@
+from json import dumps
+from logging import getLogger
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+from portafilter.capture import get_plan_schema_id
+from portafilter.plan import ValidationPlan
+from portafilter.profile import ValidationProfile
+
+
+class SlowValidationLog:
+
+    def __init__(self, threshold: float = 0.1, handler: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 top: int = 5, timing: bool = True):
+        """The init method
+
+        A record is emitted for each validation which runs longer than the threshold. The record describes
+        the shape of the payload, it never contains the values or the keys of the payload.
+
+        Keyword Arguments:
+            threshold {float} -- The seconds (default: {0.1})
+            handler {Optional[Callable[[Dict[str, Any]], None]]} -- Called with each record, the default one
+            logs it as JSON by the portafilter logger (default: {None})
+            top {int} -- The number of the top-cost attributes in the record (default: {5})
+            timing {bool} -- Time the attributes of the runs which are not profiled while the log is enabled,
+            otherwise their records have no top-cost attributes (default: {True})
+        """
+        self._threshold = threshold
+        self._handler = handler or self._log
+        self._top = top
+        self._timing = timing
+        self._lock = Lock()
+        self._emitted = 0
+
+    def get_threshold(self) -> float:
+        """Get the threshold in seconds
+
+        Returns:
+            float
+        """
+        return self._threshold
+
+    def start_profile(self) -> Optional[ValidationProfile]:
+        """Get the profile of a run which is not profiled by the caller
+
+        Only the attributes are timed, the rules are not.
+
+        Returns:
+            Optional[ValidationProfile] -- None if the timing is disabled.
+        """
+        return ValidationProfile([ValidationProfile.ATTRIBUTES]) if self._timing else None
+
+    def check(self, plan: ValidationPlan, data: Any, elapsed: float,
+              profile: Optional[ValidationProfile] = None) -> bool:
+        """Emit a record if the validation is slow
+
+        The record is emitted by the caller thread, only the shape of the payload is kept. The top-cost
+        attributes come from the profile of the run, they are empty if the run is not profiled.
+
+        Arguments:
+            plan {ValidationPlan}
+            data {Any}
+            elapsed {float} -- The seconds of the run.
+
+        Keyword Arguments:
+            profile {Optional[ValidationProfile]} -- The profile of the run (default: {None})
+
+        Returns:
+            bool -- The record is emitted.
+        """
+        if elapsed < self._threshold:
+            return False
+
+        self._handler({
+            'schema': get_plan_schema_id(plan),
+            'elapsed': elapsed,
+            'threshold': self._threshold,
+            'shape': get_shape(data),
+            'top_attributes': profile.get_report()[ValidationProfile.ATTRIBUTES][:self._top]
+            if profile is not None else [],
+        })
+
+        with self._lock:
+            self._emitted += 1
+
+        return True
+
+    def get_emitted(self) -> int:
+        """Get the number of the emitted records
+
+        Returns:
+            int
+        """
+        return self._emitted
+
+    @staticmethod
+    def _log(record: Dict[str, Any]) -> None:
+        """Log the record
+
+        Arguments:
+            record {Dict[str, Any]}
+        """
+        getLogger('portafilter').warning('Slow validation: %s', dumps(record))
+
+
+def get_shape(data: Any) -> Dict[str, int]:
+    """Get the shape summary of the data
+
+    Only the structure is counted, the values and the keys are not kept.
+
+    Arguments:
+        data {Any}
+
+    Returns:
+        Dict[str, int] -- The max depth, the number of the values, the dictionaries and the lists, the max and
+        the total number of the dictionary keys and the list items.
+    """
+    shape = {
+        'depth': 0,
+        'values': 0,
+        'dicts': 0,
+        'max_keys': 0,
+        'total_keys': 0,
+        'lists': 0,
+        'max_list_size': 0,
+        'total_list_size': 0,
+    }
+    stack = [(data, 0)]
+
+    while stack:
+        value, depth = stack.pop()
+        shape['values'] += 1
+
+        if depth > shape['depth']:
+            shape['depth'] = depth
+
+        if isinstance(value, dict):
+            shape['dicts'] += 1
+            shape['max_keys'] = max(shape['max_keys'], len(value))
+            shape['total_keys'] += len(value)
+            stack.extend((_value, depth + 1) for _value in value.values())
+
+        elif isinstance(value, list):
+            shape['lists'] += 1
+            shape['max_list_size'] = max(shape['max_list_size'], len(value))
+            shape['total_list_size'] += len(value)
+            stack.extend((_value, depth + 1) for _value in value)
+
+    return shape
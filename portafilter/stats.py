@@ -0,0 +1,148 @@
+from typing import Dict, Tuple
+
+
+class ValidationStats:
+
+    def __init__(self):
+        """The init method
+
+        The counters of a validation run, the stats of many runs can be merged into a single one, e.g. by the
+        endpoint.
+        """
+        self._runs = 0
+        self._values_visited = 0
+        self._rules_evaluated = 0
+        self._rules_skipped = 0
+        self._wildcard_elements = 0
+        self._messages_rendered = 0
+        self._wall_time = 0.0
+        self._failures = {}
+
+    def add(self, runs: int = 0, values_visited: int = 0, rules_evaluated: int = 0, rules_skipped: int = 0,
+            wildcard_elements: int = 0, messages_rendered: int = 0, wall_time: float = 0.0) -> None:
+        """Add to the counters
+
+        Keyword Arguments:
+            runs {int} -- The number of the validation runs (default: {0})
+            values_visited {int} -- The number of the values which the rulesets are evaluated on (default: {0})
+            rules_evaluated {int} -- The number of the passes calls (default: {0})
+            rules_skipped {int} -- The number of the rules which are skipped by is_skippable (default: {0})
+            wildcard_elements {int} -- The number of the list items which the wildcards expand into (default: {0})
+            messages_rendered {int} -- The number of the error messages (default: {0})
+            wall_time {float} -- The seconds (default: {0.0})
+        """
+        self._runs += runs
+        self._values_visited += values_visited
+        self._rules_evaluated += rules_evaluated
+        self._rules_skipped += rules_skipped
+        self._wildcard_elements += wildcard_elements
+        self._messages_rendered += messages_rendered
+        self._wall_time += wall_time
+
+    def add_failure(self, attribute: str, rule_name: str) -> None:
+        """Count a failed rule
+
+        Arguments:
+            attribute {str} -- The attribute pattern, e.g. products.*.name
+            rule_name {str}
+        """
+        key = (attribute, rule_name)
+        self._failures[key] = self._failures.get(key, 0) + 1
+
+    def merge(self, other: 'ValidationStats') -> None:
+        """Add the counters of the other stats
+
+        Arguments:
+            other {ValidationStats}
+        """
+        counters = other.to_dict()
+        counters.pop('failures')
+        self.add(**counters)
+
+        for (attribute, rule_name), count in other.get_failures().items():
+            key = (attribute, rule_name)
+            self._failures[key] = self._failures.get(key, 0) + count
+
+    def get_runs(self) -> int:
+        """Get the number of the validation runs
+
+        Returns:
+            int
+        """
+        return self._runs
+
+    def get_values_visited(self) -> int:
+        """Get the number of the values which the rulesets are evaluated on
+
+        Returns:
+            int
+        """
+        return self._values_visited
+
+    def get_rules_evaluated(self) -> int:
+        """Get the number of the passes calls
+
+        Returns:
+            int
+        """
+        return self._rules_evaluated
+
+    def get_rules_skipped(self) -> int:
+        """Get the number of the rules which are skipped by is_skippable
+
+        Returns:
+            int
+        """
+        return self._rules_skipped
+
+    def get_wildcard_elements(self) -> int:
+        """Get the number of the list items which the wildcards expand into
+
+        Returns:
+            int
+        """
+        return self._wildcard_elements
+
+    def get_messages_rendered(self) -> int:
+        """Get the number of the error messages
+
+        Returns:
+            int
+        """
+        return self._messages_rendered
+
+    def get_wall_time(self) -> float:
+        """Get the seconds
+
+        Returns:
+            float
+        """
+        return self._wall_time
+
+    def get_failures(self) -> Dict[Tuple[str, str], int]:
+        """Get the number of the failures by the attribute pattern and the rule name
+
+        Returns:
+            Dict[Tuple[str, str], int]
+        """
+        return self._failures
+
+    def to_dict(self) -> dict:
+        """Get the counters
+
+        Returns:
+            dict
+        """
+        return {
+            'runs': self._runs,
+            'values_visited': self._values_visited,
+            'rules_evaluated': self._rules_evaluated,
+            'rules_skipped': self._rules_skipped,
+            'wildcard_elements': self._wildcard_elements,
+            'messages_rendered': self._messages_rendered,
+            'wall_time': self._wall_time,
+            'failures': [
+                {'attribute': _attribute, 'rule': _rule_name, 'count': _count}
+                for (_attribute, _rule_name), _count in self._failures.items()
+            ],
+        }
@@ -0,0 +1,35 @@
+from typing import Any, Dict
+
+
+class Tracer:
+
+    # The phases of the validation which the spans are started for.
+    COMPILE = 'portafilter.compile'
+    VALIDATE = 'portafilter.validate'
+    RESOLVE = 'portafilter.resolve'
+    EVALUATE = 'portafilter.evaluate'
+    RENDER = 'portafilter.render'
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Any:
+        """Start a span, the base tracer does nothing
+
+        The spans are nested, each one is ended before its parent: the compile and the validate spans are
+        the roots, the resolve and the evaluate spans of each visited value are in the validate span and the
+        render spans of the failing rules are in the evaluate span.
+
+        Arguments:
+            name {str} -- The phase.
+            attributes {Dict[str, Any]} -- E.g. the attribute pattern and the rule name, never the values.
+
+        Returns:
+            Any -- The span which is passed to end_span, e.g. the span of the application tracer.
+        """
+        return None
+
+    def end_span(self, span: Any) -> None:
+        """End a span, the base tracer does nothing
+
+        Arguments:
+            span {Any} -- The return value of start_span.
+        """
+        pass
@@ -1,85 +1,138 @@
-from copy import deepcopy
-from typing import Tuple, Any, List
-from portafilter.enums import ValueType
+from typing import Any, Optional, Union
+from portafilter.capture import PayloadCapture
 from portafilter.exceptions import ValidationError
-from portafilter.json_schema import JsonSchema
-from portafilter.rules import RuleList, Ruleset
+from portafilter.metrics import MetricsRegistry
+from portafilter.plan import ValidationPlan
+from portafilter.profile import ValidationProfile, perf_counter_ns
+from portafilter.slow_log import SlowValidationLog
+from portafilter.stats import ValidationStats
+from portafilter.tracing import Tracer
 
 
 class Validator:
 
-    def __init__(self, data: dict, rules: dict):
+    # The opt-in capture of the validated payloads, it is shared by all the validators.
+    _capture = None
+
+    # The opt-in metrics of the validations, it is shared by all the validators.
+    _metrics = None
+
+    # The opt-in log of the slow validations, it is shared by all the validators.
+    _slow_log = None
+
+    # The opt-in tracer of the validation phases, it is shared by all the validators.
+    _tracer = None
+
+    def __init__(self, data: Any, rules: Union[dict, ValidationPlan]):
         """The init method
 
         Arguments:
-            data {dict} -- The input data.
-            rules {dict} -- The validation rules.
+            data {Any} -- The input data, a dictionary or any object which has an accessor.
+            rules {Union[dict, ValidationPlan]} -- The validation rules or a compiled validation plan.
         """
         self._data = data
-        self._rules = RuleList(rules)
+        self._plan = rules if isinstance(rules, ValidationPlan) else Validator.compile(rules)
         self._errors = {}
+        self._profile = None
+        self._stats = None
 
-    def validate(self) -> None:
-        """Validate the input data
-
-        Raises:
-            ValidationError
-        """
-        self._clear_errors()
+    @staticmethod
+    def compile(rules: dict, name: Optional[str] = None) -> ValidationPlan:
+        """Compile the rules into a reusable validation plan
 
-        for attribute, ruleset in self._rules:
+        Arguments:
+            rules {dict} -- The validation rules.
 
-            try:
-                ruleset = self._modify_dependent_rules(ruleset)
+        Keyword Arguments:
+            name {Optional[str]} -- The name of the schema, e.g. the endpoint, the metrics are labeled by it
+            (default: {None})
 
-                value_details = JsonSchema(self._data).get_value_details(attribute)
+        Returns:
+            ValidationPlan
+        """
+        tracer = Validator._tracer
 
-                if isinstance(value_details, list):
+        if tracer is not None:
+            span = tracer.start_span(Tracer.COMPILE, {'schema': name})
+            plan = ValidationPlan(rules, name)
+            tracer.end_span(span)
 
-                    for list_item in value_details:
-                        ruleset_clone = deepcopy(ruleset)
-                        item_attribute, item_value_details = self._extract_list_details(attribute, list_item)
+            return plan
 
-                        try:
-                            item_value, value_exists = item_value_details
+        return ValidationPlan(rules, name)
 
-                            ruleset_clone.validate(
-                                attribute=item_attribute,
-                                value=item_value,
-                                value_exists=value_exists
-                            )
+    @classmethod
+    def set_capture(cls, capture: Optional[PayloadCapture]) -> None:
+        """Set the capture of the validated payloads, None to disable it
 
-                        except ValidationError as e:
-                            self._errors[item_attribute] = ruleset_clone.errors()
+        Arguments:
+            capture {Optional[PayloadCapture]}
+        """
+        cls._capture = capture
 
-                else:
-                    value, value_exists = value_details
+    @classmethod
+    def set_metrics(cls, metrics: Optional[MetricsRegistry]) -> None:
+        """Set the metrics registry which the validations report into, None to disable it
 
-                    ruleset.validate(attribute=attribute, value=value, value_exists=value_exists)
+        Arguments:
+            metrics {Optional[MetricsRegistry]}
+        """
+        cls._metrics = metrics
 
-            except ValidationError as e:
-                self._errors[attribute] = ruleset.errors()
+    @classmethod
+    def set_slow_log(cls, slow_log: Optional[SlowValidationLog]) -> None:
+        """Set the log of the slow validations, None to disable it
 
-        if self.has_error():
-            raise ValidationError(errors=self.errors())
+        Arguments:
+            slow_log {Optional[SlowValidationLog]}
+        """
+        cls._slow_log = slow_log
 
-    def _extract_list_details(self, attribute: str, list_details: Tuple[int, Any]) -> Tuple[str, Any]:
-        """Extract the list details
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Tracer]) -> None:
+        """Set the tracer of the validation phases, None to disable it
 
         Arguments:
-            attribute {str}
-            list_details {Tuple[int, Any]}
+            tracer {Optional[Tracer]}
+        """
+        cls._tracer = tracer
 
-        Returns:
-            Tuple[str, Any] -- The tuple of the attribute and the value.
+    def validate(self, profile: bool = False, stats: bool = False) -> None:
+        """Validate the input data
+
+        Keyword Arguments:
+            profile {bool} -- Record the costs of the rules, the attributes, the path resolution and the
+            message rendering, the report is available by get_profile (default: {False})
+            stats {bool} -- Count the visited values, the evaluated and the skipped rules, the expanded list
+            items and the rendered messages, the counters are available by get_stats (default: {False})
+
+        Raises:
+            ValidationError
         """
-        _index, _value = list_details
-        attribute = attribute.replace('.*', f'.{_index}', 1)
-        if isinstance(_value, list) and _value and isinstance(_value[0], tuple):
-            # Recursive
-            attribute, _value = self._extract_list_details(attribute, _value[0])
+        self._clear_errors()
+        self._profile = ValidationProfile() if profile else None
+        self._stats = ValidationStats() if stats else None
+
+        metrics = Validator._metrics
+        run_stats = ValidationStats() if metrics is not None and self._stats is None else self._stats
+        slow_log = Validator._slow_log
+        run_profile = slow_log.start_profile() if slow_log is not None and self._profile is None else self._profile
+        started_at = perf_counter_ns() if slow_log is not None else 0
 
-        return attribute, _value
+        self._errors = self._plan.errors(self._data, profile=run_profile, stats=run_stats,
+                                         tracer=Validator._tracer)
+
+        if slow_log is not None:
+            slow_log.check(self._plan, self._data, (perf_counter_ns() - started_at) / 1e9, run_profile)
+
+        if metrics is not None:
+            metrics.observe(self._plan, run_stats)
+
+        if Validator._capture is not None:
+            Validator._capture.capture(self._data, self._plan, self._errors)
+
+        if self.has_error():
+            raise ValidationError(errors=self.errors())
 
     def _clear_errors(self) -> None:
         """Clear the errors.
@@ -130,43 +183,18 @@ class Validator:
         """
         return self._errors
 
-    def _modify_dependent_rules(self, ruleset: Ruleset) -> Ruleset:
-        """Modify dependent rules
+    def get_profile(self) -> Optional[ValidationProfile]:
+        """Get the profile of the last profiled validation
 
-        Arguments:
-            ruleset (Ruleset)
+        Returns:
+            Optional[ValidationProfile]
+        """
+        return self._profile
+
+    def get_stats(self) -> Optional[ValidationStats]:
+        """Get the counters of the last validation which is run with the stats
 
         Returns:
-            Ruleset
+            Optional[ValidationStats]
         """
-        # The rules are mutable object
-        if ruleset.has_rule('same'):
-            same_rule = ruleset.get_rule('same')
-            other_attribute = same_rule.get_params()[0]
-            other_value_details = JsonSchema(self._data).get_value_details(other_attribute)
-            same_rule.add_param(other_value_details)
-
-        if ruleset.has_rule('different'):
-            different_rule = ruleset.get_rule('different')
-            other_attribute = different_rule.get_params()[0]
-            other_value_details = JsonSchema(self._data).get_value_details(other_attribute)
-            different_rule.add_param(other_value_details)
-
-        date_related_rule_names = ['after', 'before', 'after_or_equal', 'before_or_equal']
-
-        if ruleset.has_one_of_rules(date_related_rule_names):
-            if not ruleset.has_rule('date'):
-                ruleset.add_rule('date')
-
-            for rule_name in date_related_rule_names:
-                _rule = ruleset.get_rule(rule_name)
-                if _rule:
-                    _rule_param = _rule.get_params()[0]
-                    other_attribute_value_details = JsonSchema(self._data).get_value_details(_rule_param)
-                    if isinstance(other_attribute_value_details, tuple) and other_attribute_value_details[1]:
-                        _rule.add_param(other_attribute_value_details[0])
-
-        if ruleset.has_rules(['date', 'between']):
-            ruleset.set_rule_metadata('between', ('is_date', True))
-
-        return ruleset
+        return self._stats
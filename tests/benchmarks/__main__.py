@@ -0,0 +1,277 @@
+"""The benchmark suite
+
+Run the suites and write the machine-readable report:
+
+    python -m tests.benchmarks run --output baseline.json
+
+Run it again in the other checkout and compare the two reports, the exit code is 1 if any case regressed:
+
+    python -m tests.benchmarks compare baseline.json current.json --threshold 0.1
+
+The Validator.validate(plan) cases run without a tracer, so comparing them with a baseline from before a change
+to the hooks confirms the disabled hooks cost nothing, the Validator.validate(plan,tracer) cases measure the
+base no-op tracer.
+
+Trace the memory of the validator on the standard payload shapes, the exit code is 1 if the bytes per
+element of any case exceed its budget:
+
+    python -m tests.benchmarks memory --budgets tests/benchmarks/memory_budgets.json
+
+The bytes per element of the Validator.compile case are the bytes per loaded schema. The memory reports are
+compared by the bytes per element:
+
+    python -m tests.benchmarks compare baseline.json current.json --metric bytes_per_element
+
+Validate a payload corpus by the concurrent threads, processes or asyncio tasks for a fixed duration and
+report the throughput and the latency percentiles:
+
+    python -m tests.benchmarks load --modes thread process --workers 1 2 4 8 --duration 10
+
+Replay a corpus which is captured by portafilter.capture.PayloadCapture, the exit code is 1 if the errors of
+any payload differ from the captured ones:
+
+    python -m tests.benchmarks replay corpus.jsonl.gz --repeat 3
+"""
+from argparse import ArgumentParser
+from json import dump, load
+from sys import exit
+from tests.benchmarks import bench_memory, bench_paths, bench_rules, bench_validator
+from tests.benchmarks.load import get_interpreter, run_load
+from tests.benchmarks.replay import replay
+from tests.benchmarks.runner import check_budgets, compare, format_duration, format_size, get_key, read_report, \
+    run, run_memory, write_report
+
+SUITES = {
+    'rules': bench_rules.get_cases,
+    'paths': bench_paths.get_cases,
+    'validator': bench_validator.get_cases,
+}
+
+
+def run_command(arguments) -> int:
+    """Run the suites
+
+    Arguments:
+        arguments {Namespace}
+
+    Returns:
+        int -- The exit code.
+    """
+    options = {'depths': arguments.depths, 'fan_outs': arguments.fan_outs, 'sizes': arguments.sizes}
+    results = []
+
+    print(f"{'benchmark':<72}{'best':>12}{'ops/sec':>14}")
+
+    for suite in arguments.suites:
+        results += run(
+            SUITES[suite](**options),
+            repeat=arguments.repeat,
+            min_time=arguments.min_time,
+            name_filter=arguments.filter,
+            on_result=lambda _result: print(
+                f"{_result['key']:<72}{format_duration(_result['best']):>12}{_result['ops_per_sec']:>14.1f}"
+            ),
+        )
+
+    if arguments.output:
+        write_report(arguments.output, results)
+
+    return 0
+
+
+def memory_command(arguments) -> int:
+    """Trace the memory of the validator
+
+    Arguments:
+        arguments {Namespace}
+
+    Returns:
+        int -- The exit code, 1 if any case exceeds its budget.
+    """
+    print(f"{'benchmark':<72}{'peak':>12}{'retained':>12}{'bytes/element':>16}")
+
+    results = run_memory(
+        bench_memory.get_cases(sizes=arguments.sizes, schemas=arguments.schemas),
+        top=arguments.top,
+        name_filter=arguments.filter,
+        on_result=lambda _result: print(
+            f"{_result['key']:<72}{format_size(_result['peak']):>12}{format_size(_result['retained']):>12}"
+            f"{_result['bytes_per_element']:>16.1f}"
+        ),
+    )
+
+    if arguments.verbose:
+        for result in results:
+            print(f"\n{result['key']}")
+            for statistic in result['top']:
+                print(f"    {format_size(statistic['size']):>10}{statistic['count']:>10}  {statistic['site']}")
+
+    if arguments.output:
+        write_report(arguments.output, results)
+
+    if arguments.update_budgets:
+        with open(arguments.update_budgets, 'w') as budgets_file:
+            dump({
+                _result['key']: round(_result['bytes_per_element'] * arguments.headroom + arguments.slack, 1)
+                for _result in results
+            }, budgets_file, indent=2)
+
+    if arguments.budgets:
+        with open(arguments.budgets) as budgets_file:
+            exceeded = check_budgets(results, load(budgets_file))
+
+        for item in exceeded:
+            print(f"OVER BUDGET {item['key']}: {item['value']:.1f} > {item['budget']:.1f} bytes per element")
+
+        return 1 if exceeded else 0
+
+    return 0
+
+
+def load_command(arguments) -> int:
+    """Run the concurrent load
+
+    Arguments:
+        arguments {Namespace}
+
+    Returns:
+        int -- The exit code.
+    """
+    interpreter = get_interpreter()
+    print(f"free-threaded build: {interpreter['free_threaded_build']}, GIL enabled: {interpreter['gil_enabled']}")
+    print(f"{'benchmark':<48}{'ops/sec':>12}{'p50':>12}{'p95':>12}{'p99':>12}{'p99.9':>12}")
+
+    results = []
+
+    for mode in arguments.modes:
+        for workers in arguments.workers:
+            result = run_load(
+                mode, workers, arguments.duration, arguments.size, arguments.corpus_size, arguments.invalid_ratio
+            )
+            params = {'workers': workers, 'size': arguments.size}
+            result.update({'key': get_key('load', mode, params), 'group': 'load', 'name': mode, 'params': params})
+            results.append(result)
+
+            percentiles = ''.join(f"{format_duration(result[_name]):>12}" for _name in ['p50', 'p95', 'p99', 'p99.9'])
+            print(f"{result['key']:<48}{result['ops_per_sec']:>12.1f}{percentiles}")
+
+    if arguments.output:
+        write_report(arguments.output, results)
+
+    return 0
+
+
+def replay_command(arguments) -> int:
+    """Replay the captured corpus
+
+    Arguments:
+        arguments {Namespace}
+
+    Returns:
+        int -- The exit code, 1 if the errors of any payload differ.
+    """
+    result = replay(arguments.corpus, arguments.repeat)
+
+    print(f"payloads: {result['payloads']}, schemas: {result['schemas']}")
+    print(f"best pass: {format_duration(result['seconds'] or 0)}, payloads/sec: {result['payloads_per_sec'] or 0:.1f}")
+
+    for mismatch in result['mismatches']:
+        print(
+            f"ERROR PARITY payload {mismatch['position']}: captured {mismatch['captured'][0]} attributes and "
+            f"{mismatch['captured'][1]} messages, replayed {mismatch['replayed'][0]} and {mismatch['replayed'][1]}"
+        )
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            dump(result, output_file, indent=2)
+
+    return 1 if result['mismatches'] else 0
+
+
+def compare_command(arguments) -> int:
+    """Compare two reports
+
+    Arguments:
+        arguments {Namespace}
+
+    Returns:
+        int -- The exit code, 1 if any case regressed.
+    """
+    comparisons = compare(
+        read_report(arguments.baseline), read_report(arguments.current), arguments.threshold, arguments.metric
+    )
+    formatter = format_duration if arguments.metric == 'best' else lambda _value: f'{_value:.1f}'
+
+    print(f"{'benchmark':<72}{'baseline':>12}{'current':>12}{'change':>10}")
+
+    for comparison in comparisons:
+        flag = '  REGRESSION' if comparison['regression'] else ''
+        print(
+            f"{comparison['key']:<72}{formatter(comparison['baseline']):>12}"
+            f"{formatter(comparison['current']):>12}{(comparison['ratio'] - 1) * 100:>+9.1f}%{flag}"
+        )
+
+    return 1 if any(_comparison['regression'] for _comparison in comparisons) else 0
+
+
+def main():
+    parser = ArgumentParser(prog='python -m tests.benchmarks', description='The portafilter benchmark suite.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks.')
+    run_parser.add_argument('--suites', nargs='+', choices=list(SUITES), default=list(SUITES))
+    run_parser.add_argument('--depths', type=int, nargs='+', default=[1, 5, 20, 100])
+    run_parser.add_argument('--fan-outs', type=int, nargs='+', default=[1, 10, 100])
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000])
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--min-time', type=float, default=0.2, help='The min seconds of a single round.')
+    run_parser.add_argument('--filter', help='Only run the benchmarks which have it in their key.')
+    run_parser.add_argument('--output', help='The path of the JSON report.')
+    run_parser.set_defaults(handler=run_command)
+
+    memory_parser = subparsers.add_parser('memory', help='Trace the memory allocations of the validator.')
+    memory_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000])
+    memory_parser.add_argument('--schemas', type=int, default=1000, help='The number of the compiled schemas.')
+    memory_parser.add_argument('--top', type=int, default=10, help='The number of the top allocation sites.')
+    memory_parser.add_argument('--verbose', action='store_true', help='Print the top allocation sites.')
+    memory_parser.add_argument('--filter', help='Only run the benchmarks which have it in their key.')
+    memory_parser.add_argument('--output', help='The path of the JSON report.')
+    memory_parser.add_argument('--budgets', help='The JSON budgets of the bytes per element by the benchmark key.')
+    memory_parser.add_argument('--update-budgets', help='Write the current bytes per element as the budgets.')
+    memory_parser.add_argument('--headroom', type=float, default=1.2, help='The relative headroom of the written budgets.')
+    memory_parser.add_argument('--slack', type=float, default=8,
+                               help='The bytes per element which are added to the written budgets.')
+    memory_parser.set_defaults(handler=memory_command)
+
+    load_parser = subparsers.add_parser('load', help='Validate a payload corpus under the concurrent load.')
+    load_parser.add_argument('--modes', nargs='+', choices=['thread', 'process', 'asyncio'], default=['thread'])
+    load_parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    load_parser.add_argument('--duration', type=float, default=5, help='The seconds of each run.')
+    load_parser.add_argument('--size', type=int, default=100, help='The number of the list items of each payload.')
+    load_parser.add_argument('--corpus-size', type=int, default=8)
+    load_parser.add_argument('--invalid-ratio', type=float, default=0.5,
+                             help='The ratio of the payloads which fail on every leaf.')
+    load_parser.add_argument('--output', help='The path of the JSON report.')
+    load_parser.set_defaults(handler=load_command)
+
+    replay_parser = subparsers.add_parser('replay', help='Replay a captured payload corpus.')
+    replay_parser.add_argument('corpus', help='The path of the gzip compressed JSON lines corpus.')
+    replay_parser.add_argument('--repeat', type=int, default=1)
+    replay_parser.add_argument('--output', help='The path of the JSON result.')
+    replay_parser.set_defaults(handler=replay_command)
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two JSON reports.')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='The relative growth which counts as a regression.')
+    compare_parser.add_argument('--metric', default='best',
+                                choices=['best', 'bytes_per_element', 'peak', 'p50', 'p95', 'p99', 'p99.9'])
+    compare_parser.set_defaults(handler=compare_command)
+
+    arguments = parser.parse_args()
+    exit(arguments.handler(arguments))
+
+
+if __name__ == '__main__':
+    main()
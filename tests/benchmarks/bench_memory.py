@@ -0,0 +1,63 @@
+from typing import Any, Iterator, List
+from portafilter import Validator, ValidationPlan
+from portafilter.payload_generator import PayloadGenerator
+from tests.benchmarks.bench_validator import ORDER_RULES, build_order
+from tests.benchmarks.runner import BenchmarkCase
+
+
+def validate(data: dict) -> Validator:
+    """Run the validator and keep it, so its errors are counted as the retained memory
+
+    Arguments:
+        data {dict}
+
+    Returns:
+        Validator
+    """
+    validator = Validator(data, ORDER_RULES)
+    validator.fails()
+    return validator
+
+
+def compile_schemas(count: int) -> List[ValidationPlan]:
+    """Compile the schemas and keep them, so the rules of each one are counted as the retained memory
+
+    Arguments:
+        count {int}
+
+    Returns:
+        List[ValidationPlan]
+    """
+    return [Validator.compile(ORDER_RULES) for _ in range(count)]
+
+
+def get_cases(sizes: List[int] = (1000, 100000), schemas: int = 1000, **options: Any) -> Iterator[BenchmarkCase]:
+    """Get the memory cases of the standard payload shapes and of the loaded schemas
+
+    The payloads are built before the measurement, only the validation allocations are traced.
+
+    Keyword Arguments:
+        sizes {List[int]} -- The numbers of the list items (default: {(1000, 100000)})
+        schemas {int} -- The number of the compiled schemas (default: {1000})
+
+    Returns:
+        Iterator[BenchmarkCase]
+    """
+    # The lazy imports and the compiled path caches of the first run are not counted.
+    validate(build_order(1, invalid=True))
+
+    for size in sizes:
+        generator = PayloadGenerator(ORDER_RULES, size=size)
+
+        payloads = [
+            ('valid', lambda: build_order(size)),
+            ('invalid', lambda: build_order(size, invalid=True)),
+            ('generated-invalid', lambda: generator.generate(invalid=True)),
+        ]
+
+        for payload, build in payloads:
+            data = build()
+            yield 'memory', 'Validator.validate', {'size': size, 'payload': payload}, lambda data=data: validate(data)
+
+    # The bytes per element of the compile case are the bytes per loaded schema.
+    yield 'memory', 'Validator.compile', {'size': schemas}, lambda: compile_schemas(schemas)
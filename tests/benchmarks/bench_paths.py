@@ -0,0 +1,53 @@
+from typing import Any, Iterator, List, Tuple
+from portafilter.json_schema import JsonSchema
+from tests.benchmarks.runner import BenchmarkCase
+
+
+def build_data(depth: int, fan_out: int) -> Tuple[dict, str]:
+    """Build the data which has a list of the fan out size at the specified depth
+
+    Arguments:
+        depth {int} -- The number of the nested dictionaries before the list.
+        fan_out {int} -- The size of the list, each item has another list of the same size.
+
+    Returns:
+        Tuple[dict, str] -- The data and the dotted path of the list.
+    """
+    data = node = {}
+
+    for _ in range(depth):
+        node['node'] = {}
+        node = node['node']
+
+    node['items'] = [
+        {'id': _index, 'tags': [{'name': f'tag-{_tag}'} for _tag in range(fan_out)]} for _index in range(fan_out)
+    ]
+
+    return data, '.'.join(['node'] * depth + ['items'])
+
+
+def get_cases(depths: List[int] = (1, 5, 20, 100), fan_outs: List[int] = (1, 10, 100),
+              **options: Any) -> Iterator[BenchmarkCase]:
+    """Get the path resolution cases
+
+    Keyword Arguments:
+        depths {List[int]} -- The nesting depths (default: {(1, 5, 20, 100)})
+        fan_outs {List[int]} -- The list sizes which the wildcards are expanded into (default: {(1, 10, 100)})
+
+    Returns:
+        Iterator[BenchmarkCase]
+    """
+    for depth in depths:
+        for fan_out in fan_outs:
+            data, attribute = build_data(depth, fan_out)
+            schema = JsonSchema(data)
+            params = {'depth': depth, 'fan_out': fan_out}
+
+            yield 'paths', 'JsonSchema.get_value_details', params, \
+                lambda schema=schema, attribute=attribute: schema.get_value_details(f'{attribute}.0.id')
+            yield 'paths', 'JsonSchema.get_value_details[*]', params, \
+                lambda schema=schema, attribute=attribute: schema.get_value_details(f'{attribute}.*.id')
+            yield 'paths', 'JsonSchema.get_value_details[*][*]', params, \
+                lambda schema=schema, attribute=attribute: schema.get_value_details(f'{attribute}.*.tags.*.name')
+            yield 'paths', 'JsonSchema.iter_value_details[*][*]', params, \
+                lambda schema=schema, attribute=attribute: list(schema.iter_value_details(f'{attribute}.*.tags.*.name'))
@@ -0,0 +1,76 @@
+from inspect import isclass
+from typing import Any, Iterator, List
+from portafilter import rules as rules_module
+from portafilter.rules import Rule, Ruleset
+from tests.benchmarks.runner import BenchmarkCase
+
+# The rules string, the rule name, a passing value and the value details of the other attribute for the
+# attribute dependent rules.
+RULE_CASES = [
+    ('required', 'required', 'espresso', None),
+    ('nullable|string', 'nullable', None, None),
+    ('string', 'string', 'espresso', None),
+    ('string|min:3', 'min', 'espresso', None),
+    ('integer|max:100', 'max', 42, None),
+    ('list|size:3', 'size', [1, 2, 3], None),
+    ('integer', 'integer', 42, None),
+    ('numeric', 'numeric', 4.2, None),
+    ('boolean', 'boolean', True, None),
+    ('in:espresso,latte,mocha', 'in', 'mocha', None),
+    ('not_in:espresso,latte,mocha', 'not_in', 'ristretto', None),
+    ('same:other', 'same', 'espresso', ('espresso', True)),
+    ('different:other', 'different', 'espresso', ('latte', True)),
+    ('email', 'email', 'espresso@codewithcoffee.dev', None),
+    ('list:integer', 'list', list(range(10)), None),
+    ('dict', 'dict', {'name': 'espresso'}, None),
+    ('date', 'date', '2021-03-01', None),
+    ('date|after:2021-01-01', 'after', '2021-03-01', None),
+    ('date|after_or_equal:2021-01-01', 'after_or_equal', '2021-03-01', None),
+    ('date|before:2021-12-01', 'before', '2021-03-01', None),
+    ('date|before_or_equal:2021-12-01', 'before_or_equal', '2021-03-01', None),
+    ('starts_with:esp,lat', 'starts_with', 'espresso', None),
+    ('ends_with:sso,tte', 'ends_with', 'espresso', None),
+    ('contains:pre,sso', 'contains', 'espresso', None),
+    ('contains_one_of:lat,sso', 'contains_one_of', 'espresso', None),
+    ('integer|between:1,100', 'between', 42, None),
+]
+
+
+def get_rule_classes() -> List[type]:
+    """Get all the rule classes of the package
+
+    Returns:
+        List[type]
+    """
+    return [
+        _value for _value in vars(rules_module).values()
+        if isclass(_value) and issubclass(_value, Rule) and _value is not Rule
+    ]
+
+
+def get_cases(**options: Any) -> Iterator[BenchmarkCase]:
+    """Get the microbenchmark cases of each rule class
+
+    The passing value and the error message are measured separately, the message rendering is only paid
+    by the failing values.
+
+    Returns:
+        Iterator[BenchmarkCase]
+    """
+    for rules, rule_name, value, other_value_details in RULE_CASES:
+        rule = Ruleset(rules).get_rule(rule_name)
+        # The own params are passed as they are, like by the ruleset, so the prepared params are used.
+        params = rule.get_params()
+
+        if other_value_details is not None:
+            params = params + [other_value_details]
+
+        if not rule.passes('value', value, params):
+            raise AssertionError(f'The benchmark value of the {rule_name} rule does not pass.')
+
+        class_name = type(rule).__name__
+
+        yield 'rules', f'{class_name}.passes', {}, lambda rule=rule, value=value, params=params: \
+            rule.passes('value', value, params)
+        yield 'rules', f'{class_name}.message', {}, lambda rule=rule, value=value, params=params: \
+            rule.message('value', value, params)
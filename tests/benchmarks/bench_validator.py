@@ -0,0 +1,125 @@
+from typing import Any, Iterator, List, Optional
+from portafilter import Validator
+from portafilter.exceptions import ValidationError
+from portafilter.payload_generator import PayloadGenerator
+from portafilter.tracing import Tracer
+from tests.benchmarks.runner import BenchmarkCase
+
+ORDER_RULES = {
+    'id': 'required|integer',
+    'status': 'required|in:pending,paid,shipped',
+    'created_at': 'required|date|before:2030-01-01',
+    'customer.name': 'required|string|min:2',
+    'customer.email': 'required|email',
+    'customer.password': 'required|string|same:customer.password_confirmation',
+    'items': 'required|list',
+    'items.*.sku': 'required|string|starts_with:SKU-',
+    'items.*.quantity': 'required|integer|between:1,100',
+    'items.*.price': 'required|numeric|min:0',
+    'items.*.tags': 'list:string',
+    'items.*.options.*.name': 'required|string',
+}
+
+
+def build_order(size: int, invalid: bool = False) -> dict:
+    """Build a realistic nested order payload
+
+    Arguments:
+        size {int} -- The number of the order items.
+
+    Keyword Arguments:
+        invalid {bool} -- Break every tenth item (default: {False})
+
+    Returns:
+        dict
+    """
+    items = []
+
+    for _index in range(size):
+        item = {
+            'sku': f'SKU-{_index:06}',
+            'quantity': _index % 100 + 1,
+            'price': _index * 0.25,
+            'tags': ['coffee', 'beans'],
+            'options': [{'name': 'grind'}, {'name': 'roast'}],
+        }
+
+        if invalid and _index % 10 == 0:
+            item['quantity'] = 0
+            item['options'][1]['name'] = None
+
+        items.append(item)
+
+    return {
+        'id': 1,
+        'status': 'paid',
+        'created_at': '2021-03-01',
+        'customer': {
+            'name': 'Espresso',
+            'email': 'espresso@codewithcoffee.dev',
+            'password': 'ristretto',
+            'password_confirmation': 'ristretto',
+        },
+        'items': items,
+    }
+
+
+def validate(data: dict, rules: Any, profile: bool = False, tracer: Optional[Tracer] = None) -> None:
+    """Run the validator and ignore the validation errors
+
+    Arguments:
+        data {dict}
+        rules {Any} -- The rules or the compiled plan.
+
+    Keyword Arguments:
+        profile {bool} -- (default: {False})
+        tracer {Optional[Tracer]} -- The tracer of the run, the cases without it measure the default path
+        (default: {None})
+    """
+    if tracer is not None:
+        Validator.set_tracer(tracer)
+
+    try:
+        Validator(data, rules).validate(profile)
+
+    except ValidationError as e:
+        pass
+
+    finally:
+        if tracer is not None:
+            Validator.set_tracer(None)
+
+
+def get_cases(sizes: List[int] = (10, 1000, 100000), **options: Any) -> Iterator[BenchmarkCase]:
+    """Get the end-to-end validation cases
+
+    Keyword Arguments:
+        sizes {List[int]} -- The numbers of the list items (default: {(10, 1000, 100000)})
+
+    Returns:
+        Iterator[BenchmarkCase]
+    """
+    plan = Validator.compile(ORDER_RULES)
+
+    yield 'validator', 'Validator.compile', {}, lambda: Validator.compile(ORDER_RULES)
+
+    for size in sizes:
+        for invalid in [False, True]:
+            data = build_order(size, invalid)
+            params = {'size': size, 'payload': 'invalid' if invalid else 'valid'}
+
+            yield 'validator', 'Validator.validate', params, lambda data=data: validate(data, ORDER_RULES)
+            yield 'validator', 'Validator.validate(plan)', params, lambda data=data: validate(data, plan)
+            yield 'validator', 'Validator.validate(plan,profile)', params, \
+                lambda data=data: validate(data, plan, profile=True)
+            yield 'validator', 'Validator.validate(plan,tracer)', params, \
+                lambda data=data: validate(data, plan, tracer=Tracer())
+
+        # The generated invalid payload is the worst case, every leaf of every list item fails.
+        generator = PayloadGenerator(ORDER_RULES, size=size)
+
+        for invalid in [False, True]:
+            data = generator.generate(invalid)
+            params = {'size': size, 'payload': 'generated-invalid' if invalid else 'generated-valid'}
+
+            yield 'validator', 'Validator.validate(plan)', params, lambda data=data: validate(data, plan)
@@ -0,0 +1,80 @@
+from argparse import ArgumentParser
+from timeit import Timer
+from typing import Any, Callable, List, Tuple
+from portafilter.json_parser import JsonParser
+from portafilter.json_path import JsonPath
+from portafilter.json_schema import JsonSchema
+from portafilter.path_trie import PathTrie
+
+
+def build_nested_data(depth: int, list_size: int = 10) -> Tuple[dict, str]:
+    """Build the nested data
+
+    Arguments:
+        depth (int) -- The nesting depth.
+
+    Keyword Arguments:
+        list_size (int) -- The size of the list at the deepest level (default 10)
+
+    Returns:
+        Tuple[dict, str] -- The data and the dotted path of the deepest level.
+    """
+    data = node = {}
+
+    for _ in range(depth):
+        node['node'] = {}
+        node = node['node']
+
+    node['items'] = [{'id': _index} for _index in range(list_size)]
+
+    return data, '.'.join(['node'] * depth)
+
+
+def get_walkers(data: dict, attribute: str) -> List[Tuple[str, Callable[[], Any]]]:
+    """Get the walkers to benchmark
+
+    Arguments:
+        data (dict)
+        attribute (str) -- The dotted path of the deepest level.
+
+    Returns:
+        List[Tuple[str, Callable[[], Any]]] -- The walker names and callables.
+    """
+    key_path = JsonPath.compile(f'{attribute}.items.0.id')
+    wildcard_path = JsonPath.compile(f'{attribute}.items.*.id')
+
+    trie = PathTrie()
+    trie.insert(key_path, 'key')
+    trie.insert(wildcard_path, 'wildcard')
+
+    return [
+        ('JsonPath.get_value_details', lambda: key_path.get_value_details(data)),
+        ('JsonPath.get_value_details[*]', lambda: wildcard_path.get_value_details(data)),
+        ('JsonPath.iter_value_details[*]', lambda: list(wildcard_path.iter_value_details(data))),
+        ('PathTrie.walk', lambda: list(trie.walk(data))),
+        ('JsonSchema.dot', lambda: JsonSchema(data).dot()),
+        ('JsonParser._walk_into_data', lambda: JsonParser._walk_into_data(data, attribute)),
+    ]
+
+
+def main():
+    parser = ArgumentParser(description='The document walkers benchmark.')
+    parser.add_argument('--depths', type=int, nargs='+', default=[100, 250, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    arguments = parser.parse_args()
+
+    print(f"{'walker':<36}{'depth':>8}{'ops/sec':>14}")
+
+    for depth in arguments.depths:
+        data, attribute = build_nested_data(depth)
+
+        for name, walker in get_walkers(data, attribute):
+            timer = Timer(walker)
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=arguments.repeat, number=number)) / number
+
+            print(f'{name:<36}{depth:>8}{1 / best:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
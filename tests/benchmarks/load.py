@@ -0,0 +1,237 @@
+import sys
+from asyncio import gather, run as run_async, sleep
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from sysconfig import get_config_var
+from threading import Barrier
+from time import perf_counter, perf_counter_ns
+from typing import Any, Dict, List
+from portafilter import ValidationPlan, Validator
+from portafilter.payload_generator import PayloadGenerator
+from tests.benchmarks.bench_validator import ORDER_RULES
+
+# The reported latency percentiles.
+PERCENTILES = [50, 95, 99, 99.9]
+
+
+def build_corpus(size: int, corpus_size: int = 8, invalid_ratio: float = 0.5) -> List[dict]:
+    """Build the payload corpus
+
+    Arguments:
+        size {int} -- The number of the list items of each payload.
+
+    Keyword Arguments:
+        corpus_size {int} -- The number of the payloads (default: {8})
+        invalid_ratio {float} -- The ratio of the payloads which fail on every leaf (default: {0.5})
+
+    Returns:
+        List[dict]
+    """
+    invalid_count = round(corpus_size * invalid_ratio)
+
+    return [
+        PayloadGenerator(ORDER_RULES, seed=_seed, size=size).generate(invalid=_seed < invalid_count)
+        for _seed in range(corpus_size)
+    ]
+
+
+def validate_for(corpus: List[dict], plan: ValidationPlan, duration: float, offset: int = 0) -> List[int]:
+    """Validate the corpus payloads one after another for the duration
+
+    Arguments:
+        corpus {List[dict]}
+        plan {ValidationPlan} -- The plan which is shared by the workers, as the servers do.
+        duration {float} -- The seconds.
+
+    Keyword Arguments:
+        offset {int} -- The corpus position which the worker starts from (default: {0})
+
+    Returns:
+        List[int] -- The latencies in nanoseconds.
+    """
+    latencies = []
+    position = offset
+    deadline = perf_counter() + duration
+
+    while perf_counter() < deadline:
+        data = corpus[position % len(corpus)]
+        start = perf_counter_ns()
+        Validator(data, plan).fails()
+        latencies.append(perf_counter_ns() - start)
+        position += 1
+
+    return latencies
+
+
+def run_process_worker(size: int, corpus_size: int, invalid_ratio: float, duration: float, offset: int) -> List[int]:
+    """Build the corpus in the worker process and validate it
+
+    Arguments:
+        size {int}
+        corpus_size {int}
+        invalid_ratio {float}
+        duration {float}
+        offset {int}
+
+    Returns:
+        List[int]
+    """
+    corpus = build_corpus(size, corpus_size, invalid_ratio)
+    return validate_for(corpus, Validator.compile(ORDER_RULES), duration, offset)
+
+
+def run_threads(corpus: List[dict], workers: int, duration: float) -> List[List[int]]:
+    """Run the threads, they start together after all of them are ready
+
+    Arguments:
+        corpus {List[dict]}
+        workers {int}
+        duration {float}
+
+    Returns:
+        List[List[int]]
+    """
+    plan = Validator.compile(ORDER_RULES)
+    barrier = Barrier(workers)
+
+    def work(offset: int) -> List[int]:
+        barrier.wait()
+        return validate_for(corpus, plan, duration, offset)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(work, range(workers)))
+
+
+def run_processes(size: int, corpus_size: int, invalid_ratio: float, workers: int, duration: float) -> \
+        List[List[int]]:
+    """Run the processes, each of them has its own copy of the corpus
+
+    Arguments:
+        size {int}
+        corpus_size {int}
+        invalid_ratio {float}
+        workers {int}
+        duration {float}
+
+    Returns:
+        List[List[int]]
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_process_worker, size, corpus_size, invalid_ratio, duration, _offset)
+            for _offset in range(workers)
+        ]
+        return [_future.result() for _future in futures]
+
+
+def run_tasks(corpus: List[dict], workers: int, duration: float) -> List[List[int]]:
+    """Run the asyncio tasks, each of them yields to the event loop after each validation
+
+    Arguments:
+        corpus {List[dict]}
+        workers {int}
+        duration {float}
+
+    Returns:
+        List[List[int]]
+    """
+    plan = Validator.compile(ORDER_RULES)
+
+    async def work(offset: int, deadline: float) -> List[int]:
+        latencies = []
+        position = offset
+
+        while perf_counter() < deadline:
+            data = corpus[position % len(corpus)]
+            start = perf_counter_ns()
+            Validator(data, plan).fails()
+            latencies.append(perf_counter_ns() - start)
+            position += 1
+            await sleep(0)
+
+        return latencies
+
+    async def main() -> List[List[int]]:
+        deadline = perf_counter() + duration
+        return list(await gather(*[work(_offset, deadline) for _offset in range(workers)]))
+
+    return run_async(main())
+
+
+def get_percentiles(latencies: List[int]) -> Dict[str, float]:
+    """Get the latency percentiles by the nearest rank
+
+    Arguments:
+        latencies {List[int]} -- The latencies in nanoseconds.
+
+    Returns:
+        Dict[str, float] -- The seconds by the percentile name, e.g. p99.9
+    """
+    ordered = sorted(latencies)
+    percentiles = {}
+
+    for percentile in PERCENTILES:
+        rank = max(int(len(ordered) * percentile / 100 + 0.5), 1) if ordered else 0
+        percentiles[f'p{percentile:g}'] = ordered[rank - 1] / 1e9 if ordered else None
+
+    return percentiles
+
+
+def get_interpreter() -> Dict[str, Any]:
+    """Get the details of the interpreter which affect the concurrency
+
+    Returns:
+        Dict[str, Any]
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+
+    return {
+        'free_threaded_build': bool(get_config_var('Py_GIL_DISABLED')),
+        'gil_enabled': is_gil_enabled() if is_gil_enabled else True,
+    }
+
+
+def run_load(mode: str, workers: int, duration: float, size: int = 100, corpus_size: int = 8,
+             invalid_ratio: float = 0.5) -> Dict[str, Any]:
+    """Validate the payload corpus by the concurrent workers for the duration
+
+    Arguments:
+        mode {str} -- The thread, the process or the asyncio mode.
+        workers {int} -- The number of the threads, the processes or the tasks.
+        duration {float} -- The seconds.
+
+    Keyword Arguments:
+        size {int} -- The number of the list items of each payload (default: {100})
+        corpus_size {int} -- The number of the payloads (default: {8})
+        invalid_ratio {float} -- The ratio of the payloads which fail on every leaf (default: {0.5})
+
+    Raises:
+        ValueError -- The mode is not supported.
+
+    Returns:
+        Dict[str, Any]
+    """
+    if mode == 'process':
+        workers_latencies = run_processes(size, corpus_size, invalid_ratio, workers, duration)
+
+    elif mode in ['thread', 'asyncio']:
+        corpus = build_corpus(size, corpus_size, invalid_ratio)
+        runner = run_threads if mode == 'thread' else run_tasks
+        workers_latencies = runner(corpus, workers, duration)
+
+    else:
+        raise ValueError(f'Invalid load mode: {mode}')
+
+    latencies = [_latency for _latencies in workers_latencies for _latency in _latencies]
+
+    result = {
+        'mode': mode,
+        'workers': workers,
+        'duration': duration,
+        'ops': len(latencies),
+        'ops_per_sec': len(latencies) / duration,
+        'worker_ops': [len(_latencies) for _latencies in workers_latencies],
+    }
+    result.update(get_percentiles(latencies))
+    result.update(get_interpreter())
+
+    return result
@@ -0,0 +1,66 @@
+from json import dumps
+from time import perf_counter
+from typing import Any, Dict
+from portafilter import Validator
+from portafilter.capture import deserialize_rules, read_corpus
+
+
+def replay(path: str, repeat: int = 1) -> Dict[str, Any]:
+    """Run the captured corpus through the current code
+
+    The plan of each schema is compiled once before the timing. The error parity compares the number of the
+    failing attributes and the error messages with the captured ones.
+
+    Arguments:
+        path {str} -- The path of the corpus file.
+
+    Keyword Arguments:
+        repeat {int} -- The number of the passes over the corpus, the fastest one is reported (default: {1})
+
+    Returns:
+        Dict[str, Any]
+    """
+    plans = {}
+    corpus = []
+
+    for serialized_rules, record in read_corpus(path):
+        schema_key = dumps(serialized_rules, sort_keys=True)
+
+        if schema_key not in plans:
+            plans[schema_key] = Validator.compile(deserialize_rules(serialized_rules))
+
+        corpus.append((plans[schema_key], record))
+
+    best = None
+    results = []
+    mismatches = []
+
+    for _round in range(repeat):
+        start = perf_counter()
+        results = []
+
+        for plan, record in corpus:
+            validator = Validator(record['data'], plan)
+            validator.fails()
+            results.append(validator.errors())
+
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    for position, ((plan, record), errors) in enumerate(zip(corpus, results)):
+        error_messages = sum(len(_messages) for _messages in errors.values())
+
+        if len(errors) != record['error_attributes'] or error_messages != record['error_messages']:
+            mismatches.append({
+                'position': position,
+                'captured': [record['error_attributes'], record['error_messages']],
+                'replayed': [len(errors), error_messages],
+            })
+
+    return {
+        'payloads': len(corpus),
+        'schemas': len(plans),
+        'seconds': best,
+        'payloads_per_sec': len(corpus) / best if best else None,
+        'mismatches': mismatches,
+    }
@@ -0,0 +1,315 @@
+import tracemalloc
+from datetime import datetime, timezone
+from gc import collect
+from json import dump, load
+from platform import platform, python_implementation, python_version
+from subprocess import CalledProcessError, DEVNULL, check_output
+from timeit import Timer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# The benchmark case: the group, the name, the case params and the callable to measure.
+BenchmarkCase = Tuple[str, str, Dict[str, Any], Callable[[], Any]]
+
+
+def measure(function: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> Dict[str, Any]:
+    """Measure the callable
+
+    The number of the calls per round is chosen to take at least the min time, the best round is the
+    reported one, the slower rounds are mostly the noise of the machine.
+
+    Arguments:
+        function {Callable[[], Any]}
+
+    Keyword Arguments:
+        repeat {int} -- The number of the rounds (default: {5})
+        min_time {float} -- The min seconds of a single round (default: {0.2})
+
+    Returns:
+        Dict[str, Any]
+    """
+    timer = Timer(function)
+    number = 1
+
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed * 10 < min_time else 2
+
+    rounds = [elapsed / number] + [_round / number for _round in timer.repeat(repeat=repeat - 1, number=number)]
+    best = min(rounds)
+
+    return {
+        'number': number,
+        'repeat': repeat,
+        'best': best,
+        'mean': sum(rounds) / len(rounds),
+        'ops_per_sec': 1 / best if best else None,
+    }
+
+
+def run(cases: Iterable[BenchmarkCase], repeat: int = 5, min_time: float = 0.2,
+        name_filter: Optional[str] = None, on_result: Optional[Callable[[dict], None]] = None) -> List[dict]:
+    """Run the benchmark cases
+
+    Arguments:
+        cases {Iterable[BenchmarkCase]}
+
+    Keyword Arguments:
+        repeat {int} -- The number of the rounds (default: {5})
+        min_time {float} -- The min seconds of a single round (default: {0.2})
+        name_filter {Optional[str]} -- Only the cases which have it in their key are run (default: {None})
+        on_result {Optional[Callable[[dict], None]]} -- Called with each result as soon as it is ready (default: {None})
+
+    Returns:
+        List[dict]
+    """
+    results = []
+
+    for group, name, params, function in cases:
+        key = get_key(group, name, params)
+
+        if name_filter and name_filter not in key:
+            continue
+
+        result = {'key': key, 'group': group, 'name': name, 'params': params}
+        result.update(measure(function, repeat, min_time))
+        results.append(result)
+
+        if on_result:
+            on_result(result)
+
+    return results
+
+
+def get_key(group: str, name: str, params: Dict[str, Any]) -> str:
+    """Get the unique key of the benchmark case, the results of two runs are matched by it
+
+    Arguments:
+        group {str}
+        name {str}
+        params {Dict[str, Any]}
+
+    Returns:
+        str
+    """
+    params_key = ','.join(f'{_key}={_value}' for _key, _value in sorted(params.items()))
+    return f'{group}/{name}[{params_key}]' if params_key else f'{group}/{name}'
+
+
+def get_environment() -> Dict[str, Any]:
+    """Get the details of the environment which the benchmarks are run in
+
+    Returns:
+        Dict[str, Any]
+    """
+    try:
+        commit = check_output(['git', 'rev-parse', 'HEAD'], stderr=DEVNULL, text=True).strip()
+
+    except (OSError, CalledProcessError) as e:
+        commit = None
+
+    return {
+        'python': python_version(),
+        'implementation': python_implementation(),
+        'platform': platform(),
+        'commit': commit,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def write_report(path: str, results: List[dict]) -> dict:
+    """Write the machine-readable report
+
+    Arguments:
+        path {str}
+        results {List[dict]}
+
+    Returns:
+        dict -- The report.
+    """
+    report = {
+        'environment': get_environment(),
+        'results': results,
+    }
+
+    with open(path, 'w') as report_file:
+        dump(report, report_file, indent=2)
+
+    return report
+
+
+def read_report(path: str) -> dict:
+    """Read the report
+
+    Arguments:
+        path {str}
+
+    Returns:
+        dict
+    """
+    with open(path) as report_file:
+        return load(report_file)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1, metric: str = 'best') -> List[dict]:
+    """Compare the results of two reports
+
+    Arguments:
+        baseline {dict} -- The report of the reference checkout.
+        current {dict} -- The report of the checkout under test.
+
+    Keyword Arguments:
+        threshold {float} -- The relative growth which counts as a regression (default: {0.1})
+        metric {str} -- The compared value, the seconds or the bytes per element (default: {'best'})
+
+    Returns:
+        List[dict] -- The comparisons of the cases which both reports have.
+    """
+    baseline_results = {_result['key']: _result for _result in baseline['results']}
+    comparisons = []
+
+    for result in current['results']:
+        baseline_result = baseline_results.get(result['key'])
+
+        if baseline_result is None:
+            continue
+
+        ratio = result[metric] / baseline_result[metric] if baseline_result[metric] else 1.0
+
+        comparisons.append({
+            'key': result['key'],
+            'baseline': baseline_result[metric],
+            'current': result[metric],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+
+    return comparisons
+
+
+def format_duration(seconds: float) -> str:
+    """Format the duration in the closest unit
+
+    Arguments:
+        seconds {float}
+
+    Returns:
+        str
+    """
+    for unit, scale in [('s', 1), ('ms', 1e-3), ('us', 1e-6)]:
+        if seconds >= scale:
+            return f'{seconds / scale:.2f}{unit}'
+
+    return f'{seconds / 1e-9:.0f}ns'
+
+
+def measure_memory(function: Callable[[], Any], top: int = 10) -> Dict[str, Any]:
+    """Measure the memory allocations of the callable
+
+    The result of the callable is kept alive until the snapshot is taken, so the top allocation sites are
+    the sites of the memory which the result holds, e.g. the error messages.
+
+    Arguments:
+        function {Callable[[], Any]}
+
+    Keyword Arguments:
+        top {int} -- The number of the top allocation sites (default: {10})
+
+    Returns:
+        Dict[str, Any]
+    """
+    collect()
+    tracemalloc.start()
+
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ])
+
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return {
+        'peak': peak,
+        'retained': current,
+        'top': [
+            {'site': str(_statistic.traceback), 'size': _statistic.size, 'count': _statistic.count}
+            for _statistic in snapshot.statistics('lineno')[:top]
+        ],
+    }
+
+
+def run_memory(cases: Iterable[BenchmarkCase], top: int = 10, name_filter: Optional[str] = None,
+               on_result: Optional[Callable[[dict], None]] = None) -> List[dict]:
+    """Run the memory benchmark cases
+
+    The bytes per element are the peak bytes divided by the size param of the case.
+
+    Arguments:
+        cases {Iterable[BenchmarkCase]}
+
+    Keyword Arguments:
+        top {int} -- The number of the top allocation sites (default: {10})
+        name_filter {Optional[str]} -- Only the cases which have it in their key are run (default: {None})
+        on_result {Optional[Callable[[dict], None]]} -- Called with each result as soon as it is ready (default: {None})
+
+    Returns:
+        List[dict]
+    """
+    results = []
+
+    for group, name, params, function in cases:
+        key = get_key(group, name, params)
+
+        if name_filter and name_filter not in key:
+            continue
+
+        result = {'key': key, 'group': group, 'name': name, 'params': params}
+        result.update(measure_memory(function, top))
+        result['bytes_per_element'] = result['peak'] / params.get('size', 1)
+        results.append(result)
+
+        if on_result:
+            on_result(result)
+
+    return results
+
+
+def check_budgets(results: List[dict], budgets: Dict[str, float], metric: str = 'bytes_per_element') -> List[dict]:
+    """Check the results against the budgets
+
+    Arguments:
+        results {List[dict]}
+        budgets {Dict[str, float]} -- The max value of the metric by the case key.
+
+    Keyword Arguments:
+        metric {str} -- (default: {'bytes_per_element'})
+
+    Returns:
+        List[dict] -- The results which exceed their budget.
+    """
+    return [
+        {'key': _result['key'], 'value': _result[metric], 'budget': budgets[_result['key']]}
+        for _result in results if _result['key'] in budgets and _result[metric] > budgets[_result['key']]
+    ]
+
+
+def format_size(size: float) -> str:
+    """Format the bytes in the closest unit
+
+    Arguments:
+        size {float}
+
+    Returns:
+        str
+    """
+    for unit, scale in [('MiB', 1 << 20), ('KiB', 1 << 10)]:
+        if size >= scale:
+            return f'{size / scale:.1f}{unit}'
+
+    return f'{size:.0f}B'
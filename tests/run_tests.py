@@ -27,6 +27,23 @@ from tests.test_same_rule import TestSameRule
 from tests.test_size_rule import TestSizeRule
 from tests.test_string_rule import TestStringRule
 from tests.test_list_rule import TestListRule
+from tests.test_validation_plan import TestValidationPlan
+from tests.test_ruleset import TestRuleset
+from tests.test_json_path import TestJsonPath
+from tests.test_path_trie import TestPathTrie
+from tests.test_resolution_cache import TestResolutionCache
+from tests.test_json_schema import TestJsonSchema
+from tests.test_accessors import TestAccessors
+from tests.test_benchmarks import TestBenchmarks
+from tests.test_payload_generator import TestPayloadGenerator
+from tests.test_capture import TestCapture
+from tests.test_profile import TestProfile
+from tests.test_stats import TestStats
+from tests.test_metrics import TestMetrics
+from tests.test_slow_log import TestSlowLog
+from tests.test_tracing import TestTracing
+from tests.test_explain import TestExplain
+from tests.test_rule_registry import TestRuleRegistry
 
 
 test_cases = [
@@ -57,6 +74,23 @@ test_cases = [
     TestContainsOneOfRule,
     TestBetweenRule,
     TestDecoratorRule,
+    TestValidationPlan,
+    TestRuleset,
+    TestJsonPath,
+    TestPathTrie,
+    TestResolutionCache,
+    TestJsonSchema,
+    TestAccessors,
+    TestBenchmarks,
+    TestPayloadGenerator,
+    TestCapture,
+    TestProfile,
+    TestStats,
+    TestMetrics,
+    TestSlowLog,
+    TestTracing,
+    TestExplain,
+    TestRuleRegistry,
 ]
 
 
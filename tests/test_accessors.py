@@ -0,0 +1,224 @@
+from collections import namedtuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Optional
+from portafilter.accessors import Accessor, AccessorRegistry, AttributeAccessor
+from portafilter.exceptions import ValidationError
+from portafilter.json_path import JsonPath
+from portafilter.utils import trans
+from tests import BaseTest
+from portafilter import Validator
+
+
+@dataclass
+class Ingredient:
+    name: Optional[str]
+    grams: float = 0
+
+
+@dataclass
+class Coffee:
+    name: str
+    ingredients: List[Ingredient] = field(default_factory=list)
+
+
+class Cup:
+
+    __slots__ = ['size', 'material']
+
+    def __init__(self, size: int, material: str):
+        self.size = size
+        self.material = material
+
+
+@dataclass
+class Order:
+    number: str
+    _secret: str = 'hidden'
+
+    @property
+    def total(self) -> float:
+        Order.loads += 1
+        return 10.0
+
+    def lines(self) -> list:
+        return []
+
+
+Order.loads = 0
+
+
+class Customer:
+
+    def __init__(self, name: str, email: str):
+        self.name = name
+        self.email = email
+
+
+Price = namedtuple('Price', ['amount', 'currency'])
+
+
+class Row:
+
+    def __init__(self, **columns):
+        self._columns = columns
+
+
+class RowAccessor(Accessor):
+
+    def get(self, data, key, index):
+        if key in data._columns:
+            return data._columns[key], True
+
+        return None, False
+
+
+class Batch:
+
+    def __init__(self, *rows):
+        self._rows = rows
+
+
+class BatchAccessor(Accessor):
+
+    def get(self, data, key, index):
+        return None, False
+
+    def iterate(self, data):
+        return (_row for _row in data._rows)
+
+
+class TestAccessors(BaseTest):
+
+    def test_dataclass(self):
+        coffee = Coffee('Flat White', [Ingredient('Espresso', 18), Ingredient(None)])
+
+        validator = Validator(
+            coffee,
+            {
+                'name': 'required|string',
+                'ingredients.*.name': 'required|string',
+                'ingredients.*.grams': 'numeric',
+            }
+        )
+
+        self.assert_true(validator.fails())
+
+        self.assert_json(
+            validator.errors(),
+            {
+                'ingredients.1.name': [
+                    trans('en.required', attributes={'attribute': 'ingredients.1.name'}),
+                    trans('en.string', attributes={'attribute': 'ingredients.1.name'}),
+                ],
+            }
+        )
+
+    def test_slots(self):
+        self.assert_true(JsonPath.compile('cup.size').get_value_details({'cup': Cup(8, 'glass')}) == (8, True))
+        self.assert_true(JsonPath.compile('cup.color').get_value_details({'cup': Cup(8, 'glass')}) == (None, False))
+
+    def test_undeclared_attributes(self):
+        data = {'order': Order('A-1'), 'customer': Customer('Aryan', 'espresso@codewithcoffee.dev')}
+
+        for attribute in ['order.total', 'order.lines', 'order._secret', 'order.__class__', 'customer.name']:
+            self.assert_true(JsonPath.compile(attribute).get_value_details(data) == (None, False))
+
+        self.assert_true(JsonPath.compile('order.number').get_value_details(data) == ('A-1', True))
+        self.assert_true(Order.loads == 0)
+
+    def test_attribute_allowlist(self):
+        AccessorRegistry.register(Customer, AttributeAccessor(['name']))
+
+        try:
+            data = {'customer': Customer('Aryan', 'espresso@codewithcoffee.dev')}
+
+            self.assert_true(JsonPath.compile('customer.name').get_value_details(data) == ('Aryan', True))
+            self.assert_true(JsonPath.compile('customer.email').get_value_details(data) == (None, False))
+
+        finally:
+            AccessorRegistry.unregister(Customer)
+
+    def test_tuple(self):
+        validator = Validator(
+            {
+                'sizes': (8, 'ten', 12),
+            },
+            {
+                'sizes.*': 'integer',
+            }
+        )
+
+        self.assert_true(validator.fails())
+        self.assert_true(list(validator.errors().keys()) == ['sizes.1'])
+
+    def test_named_tuple(self):
+        data = {'price': Price(3.5, 'EUR')}
+
+        self.assert_true(JsonPath.compile('price.currency').get_value_details(data) == ('EUR', True))
+        self.assert_true(JsonPath.compile('price.0').get_value_details(data) == (3.5, True))
+
+    def test_mapping(self):
+        validator = Validator(
+            MappingProxyType({'name': 'Espresso', 'shots': 'two'}),
+            {
+                'name': 'required|string',
+                'shots': 'required|integer',
+            }
+        )
+
+        self.assert_true(validator.fails())
+        self.assert_true(list(validator.errors().keys()) == ['shots'])
+
+    def test_string_is_not_a_list(self):
+        self.assert_true(JsonPath.compile('name.*').get_value_details({'name': 'Espresso'}) == (None, False))
+        self.assert_true(JsonPath.compile('name.0').get_value_details({'name': 'Espresso'}) == (None, False))
+
+    def test_registered_accessor(self):
+        AccessorRegistry.register(Row, RowAccessor())
+
+        try:
+            validator = Validator(
+                {
+                    'rows': [Row(id=1), Row(id='two')],
+                },
+                {
+                    'rows.*.id': 'required|integer',
+                }
+            )
+
+            self.assert_true(validator.fails())
+            self.assert_true(list(validator.errors().keys()) == ['rows.1.id'])
+
+        finally:
+            AccessorRegistry.unregister(Row)
+
+        self.assert_true(AccessorRegistry.get(Row(id=1)) is None)
+
+    def test_iterator_accessor(self):
+        AccessorRegistry.register(Batch, BatchAccessor())
+
+        try:
+            validator = Validator(
+                {
+                    'rows': Batch({'id': 1}, {'id': 'two'}),
+                },
+                {
+                    'rows.*.id': 'required|integer',
+                }
+            )
+
+            self.assert_true(validator.fails())
+            self.assert_true(list(validator.errors().keys()) == ['rows.1.id'])
+
+            try:
+                validator.validate(stats=True)
+                assert False
+
+            except ValidationError as e:
+                pass
+
+            self.assert_true(validator.get_stats().get_wildcard_elements() == 2)
+
+        finally:
+            AccessorRegistry.unregister(Batch)
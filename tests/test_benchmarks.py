@@ -0,0 +1,103 @@
+from os import path
+from tempfile import TemporaryDirectory
+from portafilter.rule_registry import RuleRegistry
+from tests.benchmarks import bench_memory, bench_paths, bench_rules, bench_validator
+from tests.benchmarks.load import get_percentiles, run_load
+from tests.benchmarks.runner import check_budgets, compare, get_key, read_report, run, run_memory, write_report
+from tests import BaseTest
+
+
+class TestBenchmarks(BaseTest):
+
+    def test_rule_cases_cover_all_rules(self):
+        rule_names = {_rule_name for _, _rule_name, _, _ in bench_rules.RULE_CASES}
+        names = [_name for _, _name, _, _ in bench_rules.get_cases()]
+
+        for rule_name in RuleRegistry.get_names():
+            self.assert_true(rule_name in rule_names)
+
+        for rule_class in bench_rules.get_rule_classes():
+            self.assert_true(f'{rule_class.__name__}.passes' in names)
+
+    def test_report(self):
+        cases = list(bench_paths.get_cases(depths=[2], fan_outs=[3])) + \
+            list(bench_validator.get_cases(sizes=[3]))
+
+        results = run(cases, repeat=1, min_time=0)
+
+        self.assert_true(len(results) == len(cases))
+        self.assert_true(results[0]['key'] == 'paths/JsonSchema.get_value_details[depth=2,fan_out=3]')
+
+        with TemporaryDirectory() as directory:
+            report_path = path.join(directory, 'report.json')
+            write_report(report_path, results)
+            report = read_report(report_path)
+
+        self.assert_true(report['results'] == results)
+        self.assert_true('python' in report['environment'])
+
+    def test_compare(self):
+        baseline = {'results': [
+            {'key': get_key('rules', 'IntegerRule.passes', {}), 'best': 1.0},
+            {'key': get_key('validator', 'Validator.validate', {'size': 10}), 'best': 1.0},
+        ]}
+        current = {'results': [
+            {'key': 'rules/IntegerRule.passes', 'best': 1.05},
+            {'key': 'validator/Validator.validate[size=10]', 'best': 1.5},
+            {'key': 'validator/Validator.validate[size=1000]', 'best': 1.5},
+        ]}
+
+        comparisons = compare(baseline, current, threshold=0.1)
+
+        self.assert_true([_comparison['regression'] for _comparison in comparisons] == [False, True])
+
+    def test_memory(self):
+        results = run_memory(bench_memory.get_cases(sizes=[10], schemas=10), top=3)
+        compile_result = results.pop()
+
+        self.assert_true([_result['params']['payload'] for _result in results] == [
+            'valid', 'invalid', 'generated-invalid',
+        ])
+        self.assert_true(compile_result['key'] == 'memory/Validator.compile[size=10]')
+        self.assert_true(compile_result['retained'] > 0)
+
+        for result in results:
+            self.assert_true(result['peak'] >= result['retained'] > 0)
+            self.assert_true(result['bytes_per_element'] == result['peak'] / 10)
+            self.assert_true(len(result['top']) <= 3)
+
+        # The invalid payloads keep the error messages.
+        self.assert_true(results[2]['retained'] > results[1]['retained'] > results[0]['retained'])
+
+    def test_budgets(self):
+        results = [
+            {'key': 'memory/valid', 'bytes_per_element': 10.0},
+            {'key': 'memory/invalid', 'bytes_per_element': 100.0},
+            {'key': 'memory/new', 'bytes_per_element': 100.0},
+        ]
+
+        exceeded = check_budgets(results, {'memory/valid': 12.0, 'memory/invalid': 90.0})
+
+        self.assert_true(exceeded == [{'key': 'memory/invalid', 'value': 100.0, 'budget': 90.0}])
+
+    def test_percentiles(self):
+        percentiles = get_percentiles(list(range(1, 1001)))
+
+        self.assert_true(percentiles == {'p50': 500e-9, 'p95': 950e-9, 'p99': 990e-9, 'p99.9': 999e-9})
+        self.assert_true(get_percentiles([])['p99'] is None)
+
+    def test_load(self):
+        for mode in ['thread', 'asyncio']:
+            result = run_load(mode, workers=2, duration=0.05, size=2, corpus_size=2)
+
+            self.assert_true(result['ops'] == sum(result['worker_ops']) > 0)
+            self.assert_true(len(result['worker_ops']) == 2)
+            self.assert_true(result['p50'] <= result['p99.9'])
+            self.assert_true(isinstance(result['gil_enabled'], bool))
+
+        try:
+            run_load('fiber', workers=1, duration=0.05)
+            assert False
+
+        except ValueError as e:
+            pass
@@ -1,3 +1,6 @@
+from portafilter.exceptions import InvalidRuleParam
+from portafilter.rules import Ruleset
+from portafilter.sandglass import Sandglass
 from portafilter.utils import trans
 from tests import BaseTest
 from portafilter import Validator
@@ -169,3 +172,31 @@ class TestBetweenRule(BaseTest):
                 ],
             }
         )
+
+    def test_between_date_with_special_key_success(self):
+        validator = Validator(
+            {
+                'date': '2023-01-02',
+            },
+            {
+                'date': 'after:2022-12-31|between:2023-01-01,tomorrow',
+            }
+        )
+
+        self.assert_false(validator.fails())
+
+    def test_between_params_are_parsed_once(self):
+        rule = Ruleset('date|between:2023-01-01,today').get_rule('between')
+        min_value, max_value = rule.get_parsed_params(rule.get_params())
+
+        self.assert_true(isinstance(min_value, Sandglass) and max_value == 'today')
+        self.assert_true(rule.get_parsed_params(rule.get_params()) is rule.get_parsed_params(rule.get_params()))
+
+    def test_between_invalid_params(self):
+        for rules in ['integer|between:8', 'integer|between:8,large', 'date|between:2023-01-01,someday']:
+            try:
+                Validator.compile({'price': rules})
+                assert False
+
+            except InvalidRuleParam as e:
+                pass
@@ -0,0 +1,163 @@
+import gzip
+from dataclasses import dataclass
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Lock
+from portafilter.capture import PayloadCapture, deserialize_rules, read_corpus, serialize_rules
+from tests import BaseTest
+from tests.benchmarks.replay import replay
+from tests.test_custom_rule import AgeVerificationRule
+from portafilter import Validator
+
+
+@dataclass
+class Coffee:
+    name: str
+
+
+class CountingLock:
+
+    def __init__(self):
+        self.acquired = 0
+        self._lock = Lock()
+
+    def __enter__(self):
+        self.acquired += 1
+        return self._lock.__enter__()
+
+    def __exit__(self, *args):
+        return self._lock.__exit__(*args)
+
+
+class TestCapture(BaseTest):
+
+    rules = {
+        'name': 'required|string|min:3',
+        'email': 'required|email',
+        'age': ['required', 'integer', AgeVerificationRule(18)],
+        'sizes.*': 'required|integer|in:8,12',
+        'started_at': 'after:2021-01-01',
+    }
+
+    payloads = [
+        {'name': 'Espresso', 'email': 'espresso@codewithcoffee.dev', 'age': 20, 'sizes': [8, 12]},
+        {'name': 'La', 'email': 'latte', 'age': 12, 'sizes': [8, 10, 'large']},
+        {'name': 'Mocha', 'email': 'mocha@codewithcoffee.dev', 'age': 30, 'sizes': []},
+    ]
+
+    def validate_all(self, capture: PayloadCapture) -> None:
+        Validator.set_capture(capture)
+
+        try:
+            for payload in self.payloads:
+                Validator(payload, self.rules).fails()
+
+        finally:
+            Validator.set_capture(None)
+            capture.close()
+
+    def test_capture_and_replay(self):
+        with TemporaryDirectory() as directory:
+            corpus_path = path.join(directory, 'corpus.jsonl.gz')
+            capture = PayloadCapture(corpus_path, sample_rate=1)
+            self.validate_all(capture)
+
+            with gzip.open(corpus_path, 'rb') as corpus_file:
+                records = [loads(_line) for _line in corpus_file]
+
+            result = replay(corpus_path, repeat=2)
+
+        self.assert_true(capture.get_captured() == 3)
+        self.assert_true([_record['type'] for _record in records] == ['schema', 'payload', 'payload', 'payload'])
+        self.assert_true(records[2]['error_attributes'] == 5 and records[2]['error_messages'] == 6)
+
+        self.assert_true(result['payloads'] == 3 and result['schemas'] == 1)
+        self.assert_true(result['mismatches'] == [])
+
+    def test_error_parity(self):
+        with TemporaryDirectory() as directory:
+            corpus_path = path.join(directory, 'corpus.jsonl.gz')
+            self.validate_all(PayloadCapture(corpus_path, sample_rate=1))
+
+            with gzip.open(corpus_path, 'rb') as corpus_file:
+                lines = [_line.replace(b'"error_messages":6', b'"error_messages":5') for _line in corpus_file]
+
+            with gzip.open(corpus_path, 'wb') as corpus_file:
+                corpus_file.writelines(lines)
+
+            result = replay(corpus_path)
+
+        self.assert_true(result['mismatches'] == [{'position': 1, 'captured': [5, 5], 'replayed': [5, 6]}])
+
+    def test_redact(self):
+        with TemporaryDirectory() as directory:
+            corpus_path = path.join(directory, 'corpus.jsonl.gz')
+            capture = PayloadCapture(
+                corpus_path,
+                sample_rate=1,
+                redact=lambda _path, _value: '[redacted]' if _path == 'email' else _value,
+            )
+            self.validate_all(capture)
+
+            records = [_record for _, _record in read_corpus(corpus_path)]
+
+        self.assert_true([_record['data']['email'] for _record in records] == ['[redacted]'] * 3)
+        self.assert_true(records[1]['data']['sizes'] == [8, 10, 'large'])
+
+    def test_sample_rate(self):
+        with TemporaryDirectory() as directory:
+            capture = PayloadCapture(path.join(directory, 'corpus.jsonl.gz'), sample_rate=0)
+            self.validate_all(capture)
+
+            self.assert_true(capture.get_captured() == 0)
+            self.assert_false(path.exists(path.join(directory, 'corpus.jsonl.gz')))
+
+    def test_sampling_takes_no_lock(self):
+        with TemporaryDirectory() as directory:
+            capture = PayloadCapture(path.join(directory, 'corpus.jsonl.gz'), sample_rate=0)
+            capture._lock = CountingLock()
+            Validator.set_capture(capture)
+
+            try:
+                for payload in self.payloads:
+                    Validator(payload, self.rules).fails()
+
+            finally:
+                Validator.set_capture(None)
+
+            self.assert_true(capture._lock.acquired == 0)
+            capture.close()
+
+    def test_max_bytes(self):
+        with TemporaryDirectory() as directory:
+            capture = PayloadCapture(path.join(directory, 'corpus.jsonl.gz'), sample_rate=1, max_bytes=1)
+            self.validate_all(capture)
+
+            self.assert_true(capture.is_full())
+            self.assert_true(capture.get_captured() == 1)
+
+    def test_not_serializable(self):
+        with TemporaryDirectory() as directory:
+            capture = PayloadCapture(path.join(directory, 'corpus.jsonl.gz'), sample_rate=1)
+            Validator.set_capture(capture)
+
+            try:
+                self.assert_true(Validator(Coffee('Espresso'), {'name': 'required'}).passes())
+
+            finally:
+                Validator.set_capture(None)
+                capture.close()
+
+        self.assert_true(capture.get_captured() == 0 and capture.get_skipped() == 1)
+
+    def test_serialize_rules(self):
+        serialized = serialize_rules(Validator.compile(self.rules))
+
+        self.assert_true(serialized['name'] == ['required', 'string', 'min:3'])
+        self.assert_true(serialized['age'][2] == {
+            'class': 'tests.test_custom_rule:AgeVerificationRule',
+            'params': [18],
+        })
+        self.assert_true(serialized['started_at'] == ['after:2021-01-01', 'date'])
+        self.assert_true(serialize_rules(Validator.compile(deserialize_rules(serialized))) == serialized)
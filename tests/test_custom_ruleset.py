@@ -164,3 +164,37 @@ class TestCustomRuleset(BaseTest):
                 ],
             }
         )
+
+    def test_custom_ruleset_rules_are_parsed_once(self):
+        first_ruleset = CustomEmailRuleset(CustomEmailRuleset.rules)
+        second_ruleset = CustomEmailRuleset(CustomEmailRuleset.rules)
+
+        self.assert_true(first_ruleset.get_rules() is not second_ruleset.get_rules())
+        self.assert_true(all(first_ruleset.get_rule(_rule_name) is _rule
+                             for _rule_name, _rule in second_ruleset.get_rules().items()))
+
+        # The plan adds the rules to its own copy.
+        first_ruleset.add_rule('date')
+        self.assert_false(second_ruleset.has_rule('date'))
+        self.assert_false(CustomEmailRuleset(CustomEmailRuleset.rules).has_rule('date'))
+
+    def test_reassigned_custom_ruleset_rules(self):
+
+        class NameRuleset(Ruleset):
+
+            rules = 'string|max:5'
+
+        class PersonRuleset(Ruleset):
+
+            rules = ['required', NameRuleset]
+
+        self.assert_true(Validator({'name': 'Aryan Arabshahi'}, {'name': PersonRuleset}).fails())
+
+        NameRuleset.rules = 'string|max:20'
+
+        self.assert_false(Validator({'name': 'Aryan Arabshahi'}, {'name': PersonRuleset}).fails())
+        self.assert_true(Validator({}, {'name': PersonRuleset}).fails())
+
+        PersonRuleset.rules = [NameRuleset]
+
+        self.assert_false(Validator({}, {'name': PersonRuleset}).fails())
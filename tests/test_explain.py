@@ -0,0 +1,70 @@
+from portafilter.rules import Rule
+from tests import BaseTest
+from portafilter import Validator
+
+
+class ExpensiveRule(Rule):
+
+    cost = 1000
+
+    def passes(self, attribute, value, params):
+        return True
+
+    def message(self, attribute, value, params):
+        return 'The value is not accepted.'
+
+
+class TestExplain(BaseTest):
+
+    rules = {
+        'email': 'required|email',
+        'password': 'required|same:password_confirmation',
+        'products.*.name': 'required|string',
+        'products.*.released_at': 'required|after:2021-01-01',
+        'products.*.sizes.*': ['integer', ExpensiveRule()],
+    }
+
+    def test_report(self):
+        report = Validator.compile(self.rules).explain(fan_out=5).get_report()
+        attributes = {_entry['attribute']: _entry for _entry in report['attributes']}
+
+        self.assert_true(report['fan_out'] == 5)
+        self.assert_true([_entry['path'] for _entry in report['wildcards']] == ['products.*', 'products.*.sizes.*'])
+        self.assert_true([_entry['visits'] for _entry in report['wildcards']] == [5, 25])
+        self.assert_true(report['traversal'][2]['path'] == 'products')
+        self.assert_true(report['traversal'][2]['attributes'] == [
+            'products.*.name',
+            'products.*.released_at',
+            'products.*.sizes.*',
+        ])
+
+        released_at = attributes['products.*.released_at']
+        self.assert_true([_rule['name'] for _rule in released_at['rules']] == ['required', 'after', 'date'])
+        self.assert_true([_rule['added'] for _rule in released_at['rules']] == [False, False, True])
+        self.assert_true(released_at['visits'] == 5 and released_at['cost'] == 5 * (5 + 300 + 100))
+        self.assert_true(released_at['dependencies'] == [{'rule': 'after', 'attribute': '2021-01-01'}])
+
+        self.assert_true(attributes['password']['dependencies'] == [
+            {'rule': 'same', 'attribute': 'password_confirmation'},
+        ])
+        self.assert_true(attributes['products.*.sizes.*']['visits'] == 25)
+
+        self.assert_true(report['rule_classes'][0]['class'] == 'ExpensiveRule')
+        self.assert_true(report['rule_classes'][0]['calls'] == 25)
+        self.assert_true(report['cost'] == sum(_entry['cost'] for _entry in report['attributes']))
+        self.assert_true(abs(sum(_entry['share'] for _entry in report['rule_classes']) - 1) < 1e-9)
+
+    def test_render(self):
+        rendered = Validator.compile(self.rules).explain().render()
+
+        self.assert_true('products.*.sizes.*' in rendered)
+        self.assert_true('required > after > date (added)' in rendered)
+        self.assert_true('same compares with password_confirmation' in rendered)
+
+    def test_same_errors(self):
+        plan = Validator.compile(self.rules)
+        data = {'email': 'espresso', 'products': [{'name': 10, 'released_at': '2020-01-01', 'sizes': [8, 'large']}]}
+        errors = plan.errors(data)
+        plan.explain()
+
+        self.assert_json(plan.errors(data), errors)
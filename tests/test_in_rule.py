@@ -1,3 +1,5 @@
+from portafilter.exceptions import InvalidRuleParam
+from portafilter.rules import Ruleset
 from portafilter.utils import trans
 from tests import BaseTest
 from portafilter import Validator
@@ -182,3 +184,16 @@ class TestInRule(BaseTest):
                 ]
             }
         )
+
+    def test_in_numeric_params_are_parsed_once(self):
+        rule = Ruleset('integer|in:8,12').get_rule('in')
+
+        self.assert_true(rule.get_parsed_params(rule.get_params()) == (8.0, 12.0))
+        self.assert_true(rule.get_params() == ['8', '12'])
+
+        try:
+            Validator.compile({'size': 'integer|in:8,large'})
+            assert False
+
+        except InvalidRuleParam as e:
+            pass
@@ -0,0 +1,178 @@
+from portafilter.enums import PathStepType
+from portafilter.json_path import JsonPath
+from portafilter.json_schema import JsonSchema
+from portafilter.utils import trans
+from tests import BaseTest
+from portafilter import Validator
+
+
+class TestJsonPath(BaseTest):
+
+    data = {
+        'name': 'Espresso',
+        'menu': {
+            'items': ['Ristretto', 'Lungo'],
+        },
+        'products': [
+            {
+                'id': 1,
+                'prices': [{'id': 10}, {'id': 'eleven'}, {}],
+            },
+            {
+                'id': 2,
+                'prices': [],
+            },
+            {
+                'id': 3,
+            },
+        ],
+    }
+
+    def test_compile(self):
+        path = JsonPath.compile('products.*.prices.0.id')
+
+        self.assert_true(path.get_steps() == (
+            (PathStepType.KEY, 'products', None),
+            (PathStepType.WILDCARD, '*', None),
+            (PathStepType.KEY, 'prices', None),
+            (PathStepType.INDEX, '0', 0),
+            (PathStepType.KEY, 'id', None),
+        ))
+        self.assert_true(path.has_wildcard())
+
+    def test_compile_cache(self):
+        self.assert_true(JsonPath.compile('menu.items') is JsonPath.compile('menu.items'))
+
+    def test_key(self):
+        self.assert_true(JsonPath.compile('name').get_value_details(self.data) == ('Espresso', True))
+        self.assert_true(JsonPath.compile('menu.items').get_value_details(self.data) == (['Ristretto', 'Lungo'], True))
+
+    def test_missing_key(self):
+        self.assert_true(JsonPath.compile('menu.size').get_value_details(self.data) == (None, False))
+        self.assert_true(JsonPath.compile('name.size').get_value_details(self.data) == (None, False))
+        self.assert_true(JsonPath.compile('size').get_value_details(self.data, 'small') == ('small', False))
+
+    def test_index(self):
+        self.assert_true(JsonPath.compile('menu.items.1').get_value_details(self.data) == ('Lungo', True))
+        self.assert_true(JsonPath.compile('products.0.prices.1.id').get_value_details(self.data) == ('eleven', True))
+        self.assert_true(JsonPath.compile('menu.items.2').get_value_details(self.data) == (None, False))
+
+    def test_wildcard(self):
+        self.assert_true(JsonPath.compile('products.*.id').get_value_details(self.data) == [
+            (0, (1, True)),
+            (1, (2, True)),
+            (2, (3, True)),
+        ])
+
+    def test_nested_wildcard(self):
+        self.assert_true(JsonPath.compile('products.*.prices.*.id').get_value_details(self.data) == [
+            (0, [(0, (10, True)), (1, ('eleven', True)), (2, (None, False))]),
+            (1, []),
+            (2, (None, False)),
+        ])
+
+    def test_wildcard_of_non_list_value(self):
+        self.assert_true(JsonPath.compile('name.*').get_value_details(self.data) == (None, False))
+        self.assert_true(JsonPath.compile('size.*').get_value_details(self.data) == (None, False))
+
+    def test_flat_key(self):
+        errors = {'products.1.id': ['The products.1.id must be an integer.']}
+
+        self.assert_true(
+            JsonSchema(errors).get_value_details('products.1.id.0') == ('The products.1.id must be an integer.', True)
+        )
+
+    def test_nested_wildcard_validation(self):
+        validator = Validator(
+            self.data,
+            {
+                'products.*.prices.*.id': 'required|integer',
+            }
+        )
+
+        self.assert_true(validator.fails())
+
+        self.assert_true(list(validator.errors().keys()) == [
+            'products.0.prices.1.id',
+            'products.0.prices.2.id',
+            'products.2.prices.*.id',
+        ])
+
+        self.assert_json(
+            validator.errors(),
+            {
+                'products.0.prices.1.id': [
+                    trans('en.integer', attributes={'attribute': 'products.0.prices.1.id'}),
+                ],
+            }
+        )
+
+    def test_iter_value_details(self):
+        path = JsonPath.compile('products.*.prices.*.id')
+
+        self.assert_true(list(path.iter_value_details(self.data)) == [
+            ((0, 0), 10, True),
+            ((0, 1), 'eleven', True),
+            ((0, 2), None, False),
+            ((2, None), None, False),
+        ])
+
+    def test_iter_value_details_without_wildcard(self):
+        self.assert_true(list(JsonPath.compile('menu.items.1').iter_value_details(self.data)) == [((), 'Lungo', True)])
+        self.assert_true(list(JsonPath.compile('menu.size').iter_value_details(self.data)) == [((), None, False)])
+
+    def test_iter_value_details_is_lazy(self):
+        leaves = JsonPath.compile('items.*.id').iter_value_details({'items': [{'id': _index} for _index in range(10)]})
+        self.assert_true(next(leaves) == ((0,), 0, True))
+        self.assert_true(next(leaves) == ((1,), 1, True))
+
+    def test_concrete(self):
+        path = JsonPath.compile('products.*.prices.*.id')
+
+        self.assert_true(path.concrete((1, 2)) == 'products.1.prices.2.id')
+        self.assert_true(path.concrete((1, None)) == 'products.1.prices.*.id')
+        self.assert_true(path.concrete(()) == 'products.*.prices.*.id')
+
+    def test_schema_iter_value_details(self):
+        self.assert_true(list(JsonSchema(self.data).iter_value_details('products.*.prices.*.id')) == [
+            ('products.0.prices.0.id', 10, True),
+            ('products.0.prices.1.id', 'eleven', True),
+            ('products.0.prices.2.id', None, False),
+            ('products.2.prices.*.id', None, False),
+        ])
+
+    def test_deeply_nested_data(self):
+        depth = 5000
+        data = value = {}
+
+        for _ in range(depth):
+            value['node'] = {}
+            value = value['node']
+
+        value['items'] = [{'id': 1}, {'id': 'two'}]
+
+        attribute = '.'.join(['node'] * depth)
+
+        self.assert_true(JsonPath.compile(f'{attribute}.items.1.id').get_value_details(data) == ('two', True))
+        self.assert_true(JsonPath.compile(f'{attribute}.items.*.id').get_value_details(data) == [
+            (0, (1, True)),
+            (1, ('two', True)),
+        ])
+        self.assert_true(JsonSchema(data).dot() == {f'{attribute}.items.0.id': 1, f'{attribute}.items.1.id': 'two'})
+
+        validator = Validator(data, {f'{attribute}.items.*.id': 'required|integer'})
+
+        self.assert_true(validator.fails())
+        self.assert_true(list(validator.errors().keys()) == [f'{attribute}.items.1.id'])
+
+    def test_dot(self):
+        self.assert_true(JsonSchema(self.data).dot() == {
+            'name': 'Espresso',
+            'menu.items.0': 'Ristretto',
+            'menu.items.1': 'Lungo',
+            'products.0.id': 1,
+            'products.0.prices.0.id': 10,
+            'products.0.prices.1.id': 'eleven',
+            'products.1.id': 2,
+            'products.2.id': 3,
+        })
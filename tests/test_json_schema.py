@@ -0,0 +1,78 @@
+from types import GeneratorType
+from portafilter.json_schema import JsonSchema
+from tests import BaseTest
+
+
+class TestJsonSchema(BaseTest):
+
+    data = {
+        'name': 'Flat White',
+        'ingredients': [
+            {'name': 'Espresso', 'shots': 2},
+            {'name': 'Steamed Milk', 'tags': ['microfoam', 'whole']},
+        ],
+        'sizes': [[8, 10], [12]],
+        'price': None,
+    }
+
+    def test_iter_dot(self):
+        pairs = JsonSchema(self.data).iter_dot()
+
+        self.assert_true(isinstance(pairs, GeneratorType))
+
+        self.assert_true(list(pairs) == [
+            ('name', 'Flat White'),
+            ('ingredients.0.name', 'Espresso'),
+            ('ingredients.0.shots', 2),
+            ('ingredients.1.name', 'Steamed Milk'),
+            ('ingredients.1.tags.0', 'microfoam'),
+            ('ingredients.1.tags.1', 'whole'),
+            ('sizes.0.0', 8),
+            ('sizes.0.1', 10),
+            ('sizes.1.0', 12),
+            ('price', None),
+        ])
+
+    def test_dot(self):
+        self.assert_true(JsonSchema(self.data).dot() == dict(JsonSchema(self.data).iter_dot()))
+
+    def test_undot(self):
+        self.assert_true(JsonSchema.undot(JsonSchema(self.data).iter_dot()) == self.data)
+
+    def test_undot_transform(self):
+        pairs = (
+            (key_path, value.upper() if isinstance(value, str) else value)
+            for key_path, value in JsonSchema(self.data).iter_dot()
+            if not key_path.startswith('sizes')
+        )
+
+        self.assert_true(JsonSchema.undot(pairs) == {
+            'name': 'FLAT WHITE',
+            'ingredients': [
+                {'name': 'ESPRESSO', 'shots': 2},
+                {'name': 'STEAMED MILK', 'tags': ['MICROFOAM', 'WHOLE']},
+            ],
+            'price': None,
+        })
+
+    def test_undot_mixed_keys(self):
+        for data in [
+            {'a': {'0': 1, 'b': 2}},
+            {'a': {'b': 2, '0': 1}},
+            {'a': [{'1': 'x', 'name': 'y'}, {'name': 'z'}]},
+        ]:
+            self.assert_true(JsonSchema.undot(JsonSchema(data).iter_dot()) == data)
+
+    def test_undot_conflicting_paths(self):
+        for pairs in [[('a', 1), ('a.b', 2)], [('a.b', 2), ('a', 1)]]:
+            try:
+                JsonSchema.undot(pairs)
+                assert False
+
+            except ValueError as e:
+                pass
+
+    def test_undot_sparse_list(self):
+        self.assert_true(JsonSchema.undot([('items.2.id', 3), ('items.0.id', 1)]) == {
+            'items': [{'id': 1}, None, {'id': 3}],
+        })
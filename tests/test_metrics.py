@@ -0,0 +1,185 @@
+from os import path
+from re import compile as compile_regex
+from tempfile import TemporaryDirectory
+from threading import Thread
+from typing import Any, List
+from portafilter import capture
+from portafilter.exceptions import ValidationError
+from portafilter.metrics import MetricsRegistry
+from tests import BaseTest
+from portafilter import Validator, Rule
+
+
+class PatternRule(Rule):
+
+    def passes(self, attribute: str, value: Any, params: List[Any]) -> bool:
+        """Determine if the validation rule passes.
+
+        Arguments:
+            attribute {str}
+            value {Any}
+            params {List[Any]}
+
+        Returns:
+            bool
+        """
+        return isinstance(value, str) and params[0].fullmatch(value) is not None
+
+    def message(self, attribute: str, value: Any, params: List[Any]) -> str:
+        """The validation error message.
+
+        Arguments:
+            attribute {str}
+            value {Any}
+            params {List[Any]}
+
+        Returns:
+            str
+        """
+        return f'The {attribute} format is invalid.'
+
+
+class TestMetrics(BaseTest):
+
+    rules = {
+        'name': 'required|string|min:3',
+        'sizes.*': 'required|integer|in:8,12',
+    }
+
+    payloads = [
+        {'name': 'Espresso', 'sizes': [8, 12]},
+        {'name': 'La', 'sizes': [8, 10, 'large']},
+    ]
+
+    def validate_all(self, metrics: MetricsRegistry, plan) -> None:
+        Validator.set_metrics(metrics)
+
+        try:
+            for payload in self.payloads:
+                Validator(payload, plan).fails()
+
+        finally:
+            Validator.set_metrics(None)
+
+    def test_snapshot(self):
+        metrics = MetricsRegistry()
+        self.validate_all(metrics, Validator.compile(self.rules, name='orders'))
+
+        snapshot = metrics.get_snapshot()
+
+        self.assert_true(snapshot['latency']['orders']['count'] == 2)
+        self.assert_true(snapshot['latency']['orders']['sum'] > 0)
+        self.assert_true(snapshot['size']['orders']['count'] == 2)
+        self.assert_true(snapshot['size']['orders']['sum'] == 3 + 4)
+        self.assert_true(snapshot['failures'] == {
+            ('orders', 'name', 'min'): 1,
+            ('orders', 'sizes.*', 'integer'): 1,
+            ('orders', 'sizes.*', 'in'): 2,
+        })
+
+    def test_schema_id(self):
+        metrics = MetricsRegistry()
+        self.validate_all(metrics, self.rules)
+
+        schemas = list(metrics.get_snapshot()['latency'])
+
+        self.assert_true(len(schemas) == 1 and len(schemas[0]) == 16)
+
+    def test_schema_id_is_cached(self):
+        serialized = []
+        serialize_rules = capture.serialize_rules
+        capture.serialize_rules = lambda _plan: serialized.append(_plan) or serialize_rules(_plan)
+        metrics = MetricsRegistry()
+        Validator.set_metrics(metrics)
+
+        try:
+            for payload in self.payloads * 2:
+                Validator(payload, {
+                    'name': 'required|string|min:4',
+                    'sizes.*': ['required', 'integer', 'in:8,12'],
+                }).fails()
+
+        finally:
+            Validator.set_metrics(None)
+            capture.serialize_rules = serialize_rules
+
+        self.assert_true(len(serialized) == 1)
+        self.assert_true(list(metrics.get_snapshot()['latency'].values())[0]['count'] == 4)
+
+    def test_schema_id_of_not_serializable_rules(self):
+        rules = {'name': ['required', PatternRule(compile_regex('[A-Za-z]{3,}'))]}
+        metrics = MetricsRegistry()
+        self.validate_all(metrics, rules)
+
+        snapshot = metrics.get_snapshot()
+
+        self.assert_true(len(snapshot['latency']) == 1)
+        self.assert_true(list(snapshot['failures'].values()) == [1])
+
+    def test_threads(self):
+        metrics = MetricsRegistry()
+        plan = Validator.compile(self.rules, name='orders')
+        threads = [
+            Thread(target=lambda: [Validator(_payload, plan).fails() for _ in range(50) for _payload in self.payloads])
+            for _ in range(4)
+        ]
+        Validator.set_metrics(metrics)
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        finally:
+            Validator.set_metrics(None)
+
+        snapshot = metrics.get_snapshot()
+
+        self.assert_true(snapshot['latency']['orders']['count'] == 4 * 50 * 2)
+        self.assert_true(snapshot['failures'][('orders', 'sizes.*', 'in')] == 4 * 50 * 2)
+
+    def test_export(self):
+        metrics = MetricsRegistry(latency_buckets=[1.0, 60.0], size_buckets=[3, 10])
+        self.validate_all(metrics, Validator.compile(self.rules, name='orders "v2"'))
+
+        lines = metrics.export().splitlines()
+
+        self.assert_true('# TYPE portafilter_validation_seconds histogram' in lines)
+        self.assert_true('portafilter_validation_seconds_bucket{schema="orders \\"v2\\"",le="60.0"} 2' in lines)
+        self.assert_true('portafilter_validation_seconds_count{schema="orders \\"v2\\""} 2' in lines)
+        self.assert_true('portafilter_payload_values_bucket{schema="orders \\"v2\\"",le="3"} 1' in lines)
+        self.assert_true('portafilter_payload_values_bucket{schema="orders \\"v2\\"",le="+Inf"} 2' in lines)
+        self.assert_true('portafilter_payload_values_sum{schema="orders \\"v2\\""} 7' in lines)
+        self.assert_true(
+            'portafilter_rule_failures_total{schema="orders \\"v2\\"",attribute="sizes.*",rule="in"} 2' in lines
+        )
+
+        with TemporaryDirectory() as directory:
+            metrics_path = path.join(directory, 'portafilter.prom')
+            metrics.write(metrics_path)
+
+            with open(metrics_path) as metrics_file:
+                self.assert_true(metrics_file.read() == metrics.export())
+
+        metrics.reset()
+        self.assert_true(metrics.get_snapshot() == {'latency': {}, 'size': {}, 'failures': {}})
+
+    def test_stats_failures(self):
+        validator = Validator(self.payloads[1], self.rules)
+        validator.fails()
+        self.assert_true(validator.get_stats() is None)
+
+        try:
+            validator.validate(stats=True)
+            assert False
+
+        except ValidationError as e:
+            pass
+
+        self.assert_true(validator.get_stats().get_failures() == {
+            ('name', 'min'): 1,
+            ('sizes.*', 'integer'): 1,
+            ('sizes.*', 'in'): 2,
+        })
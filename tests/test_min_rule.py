@@ -1,3 +1,4 @@
+from portafilter.exceptions import InvalidRuleParam
 from portafilter.json_schema import JsonSchema
 from portafilter.utils import trans
 from tests import BaseTest
@@ -170,3 +171,12 @@ class TestMinRule(BaseTest):
         )
 
         self.assert_false(validator.fails())
+
+    def test_min_invalid_param(self):
+        for rules in ['string|min', 'string|min:three']:
+            try:
+                Validator.compile({'name': rules})
+                assert False
+
+            except InvalidRuleParam as e:
+                pass
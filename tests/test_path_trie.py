@@ -0,0 +1,120 @@
+from portafilter.json_path import JsonPath
+from portafilter.path_trie import PathTrie
+from tests import BaseTest
+from portafilter import Validator
+
+
+class CountingList(list):
+
+    iterations = 0
+
+    def __iter__(self):
+        CountingList.iterations += 1
+        return super().__iter__()
+
+
+class TestPathTrie(BaseTest):
+
+    def test_walk(self):
+        trie = PathTrie()
+
+        for attribute in ['name', 'lines.*.id', 'lines.*.price', 'lines.0.id', 'missing.*.id']:
+            trie.insert(JsonPath.compile(attribute), attribute)
+
+        self.assert_true(len(trie) == 5)
+
+        self.assert_true(list(trie.walk({'name': 'Espresso', 'lines': [{'id': 1}, {'id': 2, 'price': 3}]})) == [
+            ('name', 'name', 'Espresso', True),
+            ('lines.0.id', 'lines.0.id', 1, True),
+            ('lines.*.id', 'lines.0.id', 1, True),
+            ('lines.*.price', 'lines.0.price', None, False),
+            ('lines.*.id', 'lines.1.id', 2, True),
+            ('lines.*.price', 'lines.1.price', 3, True),
+            ('missing.*.id', 'missing.*.id', None, False),
+        ])
+
+    def test_walk_matches_json_path(self):
+        data = {
+            'order': {
+                'lines': [
+                    {'sku': 'A-1', 'quantity': 1, 'tags': ['new']},
+                    {'sku': 'B-2', 'tags': []},
+                    {'quantity': 3},
+                    None,
+                ],
+            },
+        }
+        attributes = ['order', 'order.lines', 'order.lines.*', 'order.lines.*.sku', 'order.lines.*.tags.*', 'order.id']
+
+        trie = PathTrie()
+        for attribute in attributes:
+            trie.insert(JsonPath.compile(attribute), attribute)
+
+        for attribute in attributes:
+            walked = [
+                (concrete_path, value, value_exists)
+                for item, concrete_path, value, value_exists in trie.walk(data) if item == attribute
+            ]
+
+            self.assert_true(walked == self._flatten(attribute, JsonPath.compile(attribute).get_value_details(data)))
+
+    def test_walk_matches_json_path_with_flat_keys(self):
+        documents = [
+            {'a.b': 5},
+            {'a': {}, 'a.b': 5},
+            {'a': {'b.c': 1}, 'a.b.c': 2},
+            {'a.b': {'c': 3}, 'a.b.c': 4, 'x': None},
+            {'a.b.c': 6, 'lines.*': [{'id': 7}], 'lines': None},
+            {'lines.*.id': 8, 'a.x': [{'y': 9}, {}]},
+            {'a': [{'b.c': 10}]},
+        ]
+        attributes = ['a', 'a.b', 'a.b.c', 'a.x.*.y', 'a.*.b.c', 'lines.*.id', 'x.y']
+
+        trie = PathTrie()
+        for attribute in attributes:
+            trie.insert(JsonPath.compile(attribute), attribute)
+
+        for data in documents:
+            for attribute in attributes:
+                walked = [
+                    (concrete_path, value, value_exists)
+                    for item, concrete_path, value, value_exists in trie.walk(data) if item == attribute
+                ]
+
+                self.assert_true(
+                    walked == self._flatten(attribute, JsonPath.compile(attribute).get_value_details(data))
+                )
+
+    def test_flat_key_validation(self):
+        self.assert_false(Validator({'a.b': 5}, {'a.b': 'required|integer'}).fails())
+        self.assert_true(Validator({'a.b': 'espresso'}, {'a.b': 'required|integer'}).fails())
+
+    def _flatten(self, attribute: str, value_details) -> list:
+        if isinstance(value_details, tuple):
+            return [(attribute, value_details[0], value_details[1])]
+
+        result = []
+        for list_index, list_item_details in value_details:
+            result.extend(self._flatten(attribute.replace('*', str(list_index), 1), list_item_details))
+
+        return result
+
+    def test_list_is_walked_once(self):
+        CountingList.iterations = 0
+
+        validator = Validator(
+            {
+                'order': {
+                    'lines': CountingList([{'sku': 'A-1', 'quantity': 1, 'price': 2.5}] * 100),
+                },
+            },
+            {
+                'order.lines.*.sku': 'required|string',
+                'order.lines.*.quantity': 'required|integer|min:1',
+                'order.lines.*.price': 'required|numeric',
+                'order.lines.*.discount': 'numeric',
+            }
+        )
+
+        self.assert_false(validator.fails())
+        self.assert_true(CountingList.iterations == 1)
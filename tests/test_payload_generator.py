@@ -0,0 +1,128 @@
+from portafilter.exceptions import InvalidRuleParam
+from portafilter.payload_generator import PayloadGenerator
+from portafilter.rules import RuleList, Ruleset
+from portafilter.sandglass import Sandglass
+from tests import BaseTest
+from portafilter import Validator
+
+
+class TestPayloadGenerator(BaseTest):
+
+    rules = {
+        'name': 'required|string|min:3|max:12',
+        'code': 'required|string|size:6|starts_with:CF|ends_with:X',
+        'email': 'required|email',
+        'password': 'required|string|same:password_confirmation',
+        'nickname': 'string|different:name',
+        'status': 'required|in:draft,published',
+        'rating': 'integer|between:1,5',
+        'price': 'required|numeric|min:0.5|max:9.5',
+        'available': 'required|boolean',
+        'started_at': 'required|date:%d/%m/%Y',
+        'ended_at': 'required|after:2021-06-01|before:2021-06-10',
+        'settings': 'required|dict',
+        'sizes': 'required|list:integer|min:2|max:2',
+        'products': 'required|list|size:4',
+        'products.*.id': 'required|integer|not_in:0',
+        'products.*.prices.*.amount': 'required|numeric',
+    }
+
+    def test_valid_payload(self):
+        for seed in range(20):
+            data = PayloadGenerator(self.rules, seed=seed).generate()
+            self.assert_true(Validator(data, self.rules).passes())
+
+    def test_other_attributes(self):
+        for rules in [
+            {'b': 'required|date|after:a'},
+            {'b': 'required|before:a'},
+            {'b': 'required|after_or_equal:a|before_or_equal:c'},
+            {'items.*.b': 'required|after:a|before:c'},
+            {'items.*.a': 'required|same:a'},
+            {'items.*.a': 'required|integer|different:a'},
+            {'b': 'required|string|different:a'},
+        ]:
+            for seed in range(20):
+                data = PayloadGenerator(rules, seed=seed).generate()
+                self.assert_true(Validator(data, rules).passes())
+
+    def test_other_attribute_with_wildcard(self):
+        try:
+            PayloadGenerator({'a': 'required|same:items.*.a'}).generate()
+            assert False
+
+        except InvalidRuleParam as e:
+            pass
+
+        self.assert_true(Validator(
+            PayloadGenerator({'a': 'required|same:items.*.a'}).generate(invalid=True),
+            {'a': 'required|same:items.*.a'}
+        ).fails())
+
+    def test_not_generated_rules(self):
+        for rules in [
+            {'a': 'required|list:list'},
+            {'a': 'required|boolean|in:true'},
+            {'a': 'required|date:%d/%m/%Y', 'b': 'required|after:a'},
+            {'a': 'required|date:%d/%m/%Y|before:2021-06-01'},
+        ]:
+            try:
+                PayloadGenerator(rules).generate()
+                assert False
+
+            except InvalidRuleParam as e:
+                pass
+
+    def test_other_attribute_with_date_format(self):
+        rules = {'a': 'required|date:%Y-%m-%d', 'b': 'required|after:a'}
+
+        for seed in range(20):
+            self.assert_true(Validator(PayloadGenerator(rules, seed=seed).generate(), rules).passes())
+
+    def test_shape(self):
+        data = PayloadGenerator(self.rules, fan_out=2).generate()
+
+        self.assert_true(len(data['products']) == 4)
+        self.assert_true(all(len(_product['prices']) == 2 for _product in data['products']))
+        self.assert_true(len(data['sizes']) == 2)
+        self.assert_true(data['code'].startswith('CF') and len(data['code']) == 6)
+        self.assert_true(data['password'] == data['password_confirmation'])
+        self.assert_true('2021-06-01' < data['ended_at'] < '2021-06-10')
+
+    def test_size(self):
+        data = PayloadGenerator({'items.*.tags.*': 'required|string'}, size=100, fan_out=3).generate()
+
+        self.assert_true(len(data['items']) == 100)
+        self.assert_true(all(len(_item['tags']) == 3 for _item in data['items']))
+
+    def test_seed(self):
+        self.assert_true(
+            PayloadGenerator(self.rules, seed=7).generate() == PayloadGenerator(self.rules, seed=7).generate()
+        )
+        self.assert_true(
+            PayloadGenerator(self.rules, seed=7).generate() != PayloadGenerator(self.rules, seed=8).generate()
+        )
+
+    def test_invalid_payload(self):
+        data = PayloadGenerator(self.rules, fan_out=2).generate(invalid=True)
+        validator = Validator(data, self.rules)
+
+        self.assert_true(validator.fails())
+
+        # All the leaves of all the list items fail.
+        for attribute in ['name', 'email', 'settings', 'sizes', 'products.3.id', 'products.3.prices.1.amount']:
+            self.assert_true(attribute in validator.errors())
+
+        self.assert_true(len(validator.errors()['name']) == 4)
+
+    def test_rule_list(self):
+        data = PayloadGenerator(RuleList({'name': 'required|string'})).generate()
+        self.assert_true(isinstance(data['name'], str) and data['name'])
+
+    def test_generate_value(self):
+        generator = PayloadGenerator({})
+        ruleset = Ruleset('required|date|after:today')
+
+        self.assert_true(Sandglass(generator.generate_value(ruleset)) > Sandglass('today'))
+        self.assert_true(generator.generate_value(Ruleset('integer|in:3')) == 3)
+        self.assert_true(generator.generate_value(Ruleset('integer'), invalid=True) == [])
@@ -0,0 +1,84 @@
+from portafilter.profile import ValidationProfile
+from tests import BaseTest
+from portafilter import Validator
+
+
+class TestProfile(BaseTest):
+
+    rules = {
+        'email': 'required|email',
+        'password': 'required|same:password_confirmation',
+        'products.*.name': 'required|string',
+        'products.*.released_at': 'required|after:2021-01-01',
+    }
+
+    data = {
+        'email': 'espresso@codewithcoffee.dev',
+        'password': 'ristretto',
+        'password_confirmation': 'ristretto',
+        'products': [
+            {'name': 'Espresso', 'released_at': '2021-03-01'},
+            {'name': 10, 'released_at': '2020-03-01'},
+            {'name': 'Latte', 'released_at': '2021-05-01'},
+        ],
+    }
+
+    def test_profile(self):
+        validator = Validator(self.data, self.rules)
+        self.assert_true(validator.get_profile() is None)
+
+        validator.fails()
+        self.assert_true(validator.get_profile() is None)
+
+        try:
+            validator.validate(profile=True)
+
+        except Exception as e:
+            pass
+
+        report = validator.get_profile().get_report()
+        calls = {_section: {_entry['name']: _entry['calls'] for _entry in report[_section]}
+                 for _section in validator.get_profile().get_sections()}
+
+        self.assert_true(calls['rules']['required'] == 8)
+        self.assert_true(calls['rules']['email'] == 1)
+        self.assert_true(calls['rules']['after'] == 3 and calls['rules']['date'] == 3)
+        self.assert_true(calls['messages'] == {'string': 1, 'after': 1})
+        self.assert_true(calls['attributes'] == {
+            'email': 1,
+            'password': 1,
+            'products.*.name': 3,
+            'products.*.released_at': 3,
+        })
+        self.assert_true(calls['resolution']['walk'] == 9)
+        self.assert_true(calls['resolution']['dependencies'] == 4)
+
+        self.assert_true(report['total'] > 0)
+        self.assert_true(report['total'] >= sum(_entry['seconds'] for _entry in report['attributes']))
+
+    def test_same_errors(self):
+        validator = Validator(self.data, self.rules)
+        validator.fails()
+        errors = validator.errors()
+
+        try:
+            validator.validate(profile=True)
+
+        except Exception as e:
+            pass
+
+        self.assert_true(validator.errors() == errors)
+        self.assert_true(list(errors.keys()) == ['products.1.name', 'products.1.released_at'])
+
+    def test_render(self):
+        profile = ValidationProfile()
+        profile.add(ValidationProfile.RULES, 'email', 3000)
+        profile.add(ValidationProfile.RULES, 'required', 1000, calls=2)
+        profile.add(ValidationProfile.RULES, 'required', 1000)
+        profile.set_total(10000)
+
+        self.assert_true(profile.get_report()['rules'] == [
+            {'name': 'email', 'calls': 1, 'seconds': 3e-06},
+            {'name': 'required', 'calls': 3, 'seconds': 2e-06},
+        ])
+        self.assert_true('email' in profile.render())
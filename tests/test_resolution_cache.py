@@ -0,0 +1,91 @@
+from portafilter.json_path import JsonPath
+from portafilter.json_schema import JsonSchema
+from portafilter.resolution_cache import ResolutionCache
+from tests import BaseTest
+from portafilter import Validator
+
+
+class TestResolutionCache(BaseTest):
+
+    data = {
+        'user': {
+            'password': 'espresso',
+            'password_confirmation': 'espresso',
+            'settings': {'theme': 'dark'},
+            'emails': ['espresso@codewithcoffee.dev'],
+        },
+        'errors': {
+            'user.name': ['The user.name field is required.'],
+        },
+    }
+
+    def test_cached_value_details(self):
+        attributes = [
+            'user',
+            'user.settings.theme',
+            'user.settings',
+            'user.settings.theme',
+            'user.emails.0',
+            'user.emails.1',
+            'user.missing',
+            'user.missing.key',
+            'errors.user.name.0',
+        ]
+
+        cache = ResolutionCache()
+
+        for attribute in attributes:
+            self.assert_true(
+                JsonPath.compile(attribute).get_value_details(self.data, cache=cache) ==
+                JsonPath.compile(attribute).get_value_details(self.data)
+            )
+
+    def test_hits_and_misses(self):
+        cache = ResolutionCache()
+        schema = JsonSchema(self.data, cache)
+
+        self.assert_true(schema.get_value_details('user.settings.theme') == ('dark', True))
+        self.assert_true(cache.get_hits() == 0 and cache.get_misses() == 1)
+
+        self.assert_true(schema.get_value_details('user.settings') == ({'theme': 'dark'}, True))
+        self.assert_true(schema.get_value_details('user.password') == ('espresso', True))
+        self.assert_true(cache.get_hits() == 2 and cache.get_misses() == 1)
+
+        self.assert_true(schema.get_value_details('user.missing', 'default') == ('default', False))
+        self.assert_true(schema.get_value_details('user.missing', 'default') == ('default', False))
+        self.assert_true(cache.get_hits() == 4 and cache.get_misses() == 1)
+
+    def test_plan_shares_the_cache(self):
+        plan = Validator.compile({
+            'user.password': 'required|same:user.password_confirmation',
+            'user.password_confirmation': 'required',
+            'user.settings.theme': 'different:user.settings.color',
+        })
+
+        cache = ResolutionCache()
+
+        self.assert_false(plan.errors(self.data, cache=cache))
+        self.assert_true(cache.get_hits() == 2)
+        self.assert_true(cache.get_misses() == 0)
+
+    def test_missing_prefix_is_not_used_for_longer_paths(self):
+        data = {'a.b': 5}
+        cache = ResolutionCache()
+        cache.set('a', None, False)
+
+        self.assert_true(JsonPath.compile('a.b').get_value_details(data, cache=cache) == (5, True))
+        self.assert_true(cache.find(('a',)) == (1, None, False))
+        self.assert_true(cache.find(('a', 'a.b', 'a.b.c')) == (2, 5, True))
+
+    def test_same_rule_with_cached_prefix(self):
+        data = {'a.b': 5, 'c': 5}
+
+        for rules in [
+            {'c': 'same:a.b'},
+            {'a.b': 'nullable', 'c': 'same:a.b'},
+            {'c': 'same:a.b', 'a.b': 'nullable'},
+            {'a': 'nullable', 'c': 'same:a.b'},
+            {'a.x': 'nullable', 'c': 'same:a.b'},
+        ]:
+            self.assert_false(Validator(data, rules).fails())
+            self.assert_true(Validator({'a.b': 4, 'c': 5}, rules).fails())
@@ -0,0 +1,74 @@
+from typing import Any, List
+from portafilter.exceptions import InvalidRule
+from portafilter.rule_registry import RuleRegistry
+from portafilter.rules import RequiredRule
+from tests import BaseTest
+from portafilter import Validator, Rule
+
+
+class MaxWordsRule(Rule):
+
+    def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
+        return isinstance(value, str) and len(value.split()) <= int(params[0])
+
+    def message(self, attribute: str, value: Any, params: List[str]) -> str:
+        return f'The {attribute} may not have more than {params[0]} words.'
+
+
+class TestRuleRegistry(BaseTest):
+
+    def test_builtin(self):
+        self.assert_true(RuleRegistry.get('required') is RequiredRule)
+        self.assert_true(RuleRegistry.get('max_words') is None)
+
+        try:
+            Validator({'name': 'Espresso'}, {'name': 'Required'}).passes()
+            assert False
+
+        except InvalidRule as e:
+            pass
+
+    def test_register(self):
+        RuleRegistry.register('max_words', MaxWordsRule)
+
+        try:
+            validator = Validator({'name': 'Double Shot Espresso'}, {'name': 'required|string|max_words:2'})
+
+            self.assert_true(validator.fails())
+            self.assert_json(validator.errors(), {'name': ['The name may not have more than 2 words.']})
+            self.assert_true(Validator({'name': 'Espresso'}, {'name': 'max_words:2'}).passes())
+
+        finally:
+            RuleRegistry.unregister('max_words')
+
+        try:
+            Validator({'name': 'Espresso'}, {'name': 'max_words:2'}).passes()
+            assert False
+
+        except InvalidRule as e:
+            pass
+
+    def test_lazy(self):
+        RuleRegistry.register('max_words', 'tests.test_rule_registry:MaxWordsRule')
+
+        try:
+            self.assert_false(RuleRegistry.get_names()['max_words'])
+
+            plan = Validator.compile({'name': 'max_words:1'})
+
+            self.assert_true(RuleRegistry.get_names()['max_words'])
+            self.assert_true(RuleRegistry.get('max_words') is MaxWordsRule)
+            self.assert_true(Validator({'name': 'Double Shot'}, plan).fails())
+
+        finally:
+            RuleRegistry.unregister('max_words')
+
+    def test_factory(self):
+        RuleRegistry.register('short', lambda: MaxWordsRule('1'))
+
+        try:
+            self.assert_true(Validator({'name': 'Espresso'}, {'name': 'short'}).passes())
+            self.assert_true(Validator({'name': 'Double Shot'}, {'name': 'short'}).fails())
+
+        finally:
+            RuleRegistry.unregister('short')
@@ -0,0 +1,176 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+from portafilter.exceptions import ImmutableRule
+from portafilter.rules import MaxRule, Rule, Ruleset
+from portafilter.utils import trans
+from tests import BaseTest
+from portafilter import Validator
+
+
+class PrefixRule(Rule):
+
+    __slots__ = ('prefix',)
+
+    shareable = True
+
+    def __init__(self, prefix: str):
+        """The init method
+
+        Arguments:
+            prefix {str}
+        """
+        super().__init__()
+        self.prefix = prefix
+
+    def passes(self, attribute: str, value: Any, params: List[str]) -> bool:
+        """Determine if the validation rule passes.
+
+        Arguments:
+            attribute {str}
+            value {Any}
+            params {List[str]}
+
+        Returns:
+            bool
+        """
+        return isinstance(value, str) and value.startswith(self.prefix)
+
+    def message(self, attribute: str, value: Any, params: List[str]) -> str:
+        """The validation error message.
+
+        Arguments:
+            attribute {str}
+            value {Any}
+            params {List[str]}
+
+        Returns:
+            str
+        """
+        return f'The {attribute} must start with {self.prefix}.'
+
+
+class TestRuleset(BaseTest):
+
+    def test_evaluate_success(self):
+        ruleset = Ruleset('required|string|max:10')
+
+        self.assert_false(ruleset.evaluate('name', 'espresso'))
+
+    def test_evaluate_fail(self):
+        ruleset = Ruleset('required|string')
+
+        self.assert_true(
+            ruleset.evaluate('name', None, value_exists=False) == [
+                trans('en.required', attributes={'attribute': 'name'}),
+                trans('en.string', attributes={'attribute': 'name'}),
+            ]
+        )
+
+    def test_evaluate_does_not_change_the_ruleset(self):
+        ruleset = Ruleset('required|string')
+
+        ruleset.evaluate('name', None)
+
+        self.assert_false(ruleset.errors())
+
+        for rule in ruleset.get_rules().values():
+            self.assert_true(rule.get_metadata('value') is None)
+            self.assert_true(rule.get_metadata('value_exists') is None)
+
+    def test_evaluate_with_params(self):
+        ruleset = Ruleset('same:password_confirmation')
+
+        self.assert_false(
+            ruleset.evaluate('password', 'espresso', params={
+                'same': ['password_confirmation', ('espresso', True)],
+            })
+        )
+
+        self.assert_true(ruleset.get_rule('same').get_params() == ['password_confirmation'])
+
+    def test_shared_ruleset_between_threads(self):
+        plan = Validator.compile({
+            'coffee_menu.*': 'required|integer',
+        })
+
+        def validate(index: int) -> dict:
+            return plan.errors({'coffee_menu': [index, None, 'espresso']})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(validate, range(64)))
+
+        for errors in results:
+            self.assert_true(list(errors.keys()) == ['coffee_menu.1', 'coffee_menu.2'])
+
+    def test_parse_spec(self):
+        spec = Ruleset.parse_spec('required|string|between:3,255')
+
+        self.assert_true(spec == (('required', ()), ('string', ()), ('between', ('3', '255'))))
+        self.assert_true(Ruleset.parse_spec('required|string|between:3,255') is spec)
+
+    def test_rules_list_items_are_single_rules(self):
+        self.assert_true(Ruleset.parse_token('in:x|y,z') == ('in', ('x|y', 'z')))
+        self.assert_true(Ruleset(['in:x|y,z']).get_rule('in').get_params() == ['x|y', 'z'])
+
+        self.assert_false(Validator({'a': 'x|y'}, {'a': ['in:x|y,z']}).fails())
+        self.assert_true(Validator({'a': 'x'}, {'a': ['in:x|y,z']}).fails())
+        self.assert_false(Validator({'a': 'x|y'}, {'a': ['required', 'contains:|']}).fails())
+
+    def test_shared_rules(self):
+        first_ruleset = Ruleset('required|string|max:255')
+        second_ruleset = Ruleset('required|string|max:255')
+
+        self.assert_true(first_ruleset.get_rule('string') is second_ruleset.get_rule('string'))
+        self.assert_true(first_ruleset.get_rule('max') is second_ruleset.get_rule('max'))
+
+        # The metadata of the rules differs without the required rule.
+        self.assert_false(Ruleset('string|max:255').get_rule('string') is first_ruleset.get_rule('string'))
+
+        try:
+            first_ruleset.get_rule('max').add_param('10')
+            assert False
+
+        except ImmutableRule as e:
+            pass
+
+        rule = first_ruleset.get_rule('max').copy()
+        rule.add_param('10')
+
+        self.assert_true(rule.get_params() == ['255', '10'])
+        self.assert_true(second_ruleset.get_rule('max').get_params() == ['255'])
+
+    def test_slotted_custom_rules_are_not_shared(self):
+        first_ruleset = Ruleset(['required', PrefixRule('x')])
+        second_ruleset = Ruleset(['required', PrefixRule('y')])
+
+        self.assert_false(first_ruleset.get_rule('PrefixRule') is second_ruleset.get_rule('PrefixRule'))
+        self.assert_false(first_ruleset.get_rule('PrefixRule').is_shared())
+
+        self.assert_true(Validator({'b': 'xb'}, {'b': ['required', PrefixRule('x')]}).passes())
+
+        validator = Validator({'b': 'xb'}, {'b': ['required', PrefixRule('y')]})
+        self.assert_true(validator.fails())
+        self.assert_json(validator.errors(), {'b': ['The b must start with y.']})
+
+    def test_rule_instances_stay_mutable(self):
+        rule = MaxRule('255')
+        ruleset = Ruleset(['required', rule])
+
+        self.assert_false(rule.is_shared())
+        self.assert_false(ruleset.get_rule('MaxRule') is rule)
+        self.assert_true(ruleset.get_rule('MaxRule').get_metadata('required'))
+
+        rule.set_metadata('custom', True)
+        rule.add_param('10')
+
+        self.assert_true(rule.get_params() == ['255', '10'])
+        self.assert_true(ruleset.get_rule('MaxRule').get_params() == ['255'])
+        self.assert_true(Validator({'a': 'espresso'}, {'a': [rule]}).passes())
+
+    def test_set_rule_metadata_copies_the_shared_rule(self):
+        first_ruleset = Ruleset('integer|between:1,10')
+        second_ruleset = Ruleset('integer|between:1,10')
+        first_ruleset.set_rule_metadata('between', ('custom', True))
+
+        self.assert_true(first_ruleset.get_rule('between').get_metadata('custom'))
+        self.assert_true(second_ruleset.get_rule('between').get_metadata('custom') is None)
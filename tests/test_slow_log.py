@@ -0,0 +1,115 @@
+from json import dumps
+from re import compile as compile_regex
+from threading import current_thread
+from portafilter.slow_log import SlowValidationLog, get_shape
+from tests import BaseTest
+from tests.test_metrics import PatternRule
+from portafilter import Validator
+
+
+class TestSlowLog(BaseTest):
+
+    rules = {
+        'email': 'required|email',
+        'products.*.name': 'required|string',
+        'products.*.tags': 'list',
+    }
+
+    data = {
+        'email': 'espresso@codewithcoffee.dev',
+        'products': [
+            {'name': 'Espresso', 'tags': ['dark', 'strong']},
+            {'name': 'Latte', 'tags': []},
+            {'name': 'Mocha'},
+        ],
+    }
+
+    def validate(self, slow_log: SlowValidationLog, profile: bool = False, rules=None) -> None:
+        Validator.set_slow_log(slow_log)
+
+        try:
+            Validator(self.data, rules or Validator.compile(self.rules, name='products')).validate(profile=profile)
+
+        finally:
+            Validator.set_slow_log(None)
+
+    def test_slow(self):
+        records = []
+        slow_log = SlowValidationLog(threshold=0, handler=records.append, top=2)
+        self.validate(slow_log)
+
+        self.assert_true(slow_log.get_emitted() == 1)
+        self.assert_true(records[0]['schema'] == 'products')
+        self.assert_true(records[0]['elapsed'] > 0 and records[0]['threshold'] == 0)
+        self.assert_true(len(records[0]['top_attributes']) == 2)
+        self.assert_true({_entry['name'] for _entry in records[0]['top_attributes']} <= set(self.rules))
+
+        # The raw values of the payload are never in the record.
+        self.assert_false('espresso' in dumps(records[0]).lower())
+
+    def test_emitted_by_the_caller_thread(self):
+        threads = []
+        self.validate(SlowValidationLog(threshold=0, handler=lambda _record: threads.append(current_thread())))
+
+        self.assert_true(threads == [current_thread()])
+
+    def test_payload_is_not_kept(self):
+        records = []
+        data = {'email': 'espresso@codewithcoffee.dev', 'products': [{'name': 'Espresso'}]}
+        SlowValidationLog(threshold=0, handler=records.append).check(Validator.compile(self.rules), data, 1.0)
+        data['products'].append({'name': 'Latte'})
+
+        self.assert_true(records[0]['shape']['total_list_size'] == 1)
+        self.assert_true(records[0]['top_attributes'] == [])
+
+    def test_not_timed(self):
+        records = []
+        self.validate(SlowValidationLog(threshold=0, handler=records.append, timing=False))
+
+        self.assert_true(len(records) == 1 and records[0]['top_attributes'] == [])
+
+    def test_only_attributes_are_timed(self):
+        profile = SlowValidationLog().start_profile()
+        Validator.compile(self.rules).errors(self.data, profile=profile)
+        report = profile.get_report()
+
+        self.assert_true(len(report['attributes']) == 3)
+        self.assert_true('rules' not in report and 'messages' not in report)
+
+    def test_not_serializable_rules(self):
+        records = []
+        self.validate(SlowValidationLog(threshold=0, handler=records.append),
+                      rules={'email': ['required', PatternRule(compile_regex('.+@.+'))]})
+
+        self.assert_true(len(records) == 1 and len(records[0]['schema']) == 16)
+
+    def test_profiled(self):
+        records = []
+        self.validate(SlowValidationLog(threshold=0, handler=records.append), profile=True)
+
+        self.assert_true([_entry['calls'] for _entry in records[0]['top_attributes']].count(3) == 2)
+
+    def test_fast(self):
+        records = []
+        slow_log = SlowValidationLog(threshold=60, handler=records.append)
+        self.validate(slow_log)
+
+        self.assert_true(records == [] and slow_log.get_emitted() == 0)
+
+    def test_shape(self):
+        self.assert_json(get_shape(self.data), {
+            'depth': 4,
+            'values': 13,
+            'dicts': 4,
+            'max_keys': 2,
+            'total_keys': 7,
+            'lists': 3,
+            'max_list_size': 3,
+            'total_list_size': 5,
+        })
+
+    def test_default_handler(self):
+        with self.assertLogs('portafilter', level='WARNING') as logs:
+            self.validate(SlowValidationLog(threshold=0))
+
+        self.assert_true('Slow validation' in logs.output[0])
@@ -0,0 +1,80 @@
+from portafilter.exceptions import ValidationError
+from portafilter.stats import ValidationStats
+from tests import BaseTest
+from portafilter import Validator
+
+
+class TestStats(BaseTest):
+
+    rules = {
+        'email': 'required|email',
+        'nickname': 'string|min:3',
+        'password': 'required|same:password_confirmation',
+        'products.*.name': 'required|string',
+        'products.*.released_at': 'required|after:2021-01-01',
+    }
+
+    data = {
+        'email': 'espresso@codewithcoffee.dev',
+        'password': 'ristretto',
+        'password_confirmation': 'ristretto',
+        'products': [
+            {'name': 'Espresso', 'released_at': '2021-03-01'},
+            {'name': 10, 'released_at': '2020-03-01'},
+            {'name': 'Latte', 'released_at': '2021-05-01'},
+        ],
+    }
+
+    def test_stats(self):
+        validator = Validator(self.data, self.rules)
+        self.assert_true(validator.get_stats() is None)
+
+        validator.fails()
+        self.assert_true(validator.get_stats() is None)
+
+        try:
+            validator.validate(stats=True)
+            assert False
+
+        except ValidationError as e:
+            pass
+
+        stats = validator.get_stats()
+
+        self.assert_true(stats.get_runs() == 1)
+        self.assert_true(stats.get_values_visited() == 9)
+        self.assert_true(stats.get_rules_evaluated() == 19)
+        self.assert_true(stats.get_rules_skipped() == 2)
+        self.assert_true(stats.get_wildcard_elements() == 3)
+        self.assert_true(stats.get_messages_rendered() == 2)
+        self.assert_true(stats.get_wall_time() > 0)
+
+    def test_same_errors(self):
+        validator = Validator(self.data, self.rules)
+        validator.fails()
+        errors = validator.errors()
+
+        try:
+            validator.validate(stats=True, profile=True)
+
+        except ValidationError as e:
+            pass
+
+        self.assert_json(validator.errors(), errors)
+        self.assert_true(validator.get_profile() is not None and validator.get_stats() is not None)
+
+    def test_merge(self):
+        plan = Validator.compile(self.rules)
+        endpoint_stats = ValidationStats()
+
+        for size in (1, 10, 100):
+            data = dict(self.data, products=[{'name': 'Espresso', 'released_at': '2021-03-01'}] * size)
+            validator = Validator(data, plan)
+            validator.validate(stats=True)
+            endpoint_stats.merge(validator.get_stats())
+
+        self.assert_true(endpoint_stats.get_runs() == 3)
+        self.assert_true(endpoint_stats.get_wildcard_elements() == 111)
+        self.assert_true(endpoint_stats.get_values_visited() == 3 * 3 + 111 * 2)
+        self.assert_true(endpoint_stats.get_messages_rendered() == 0)
+        self.assert_true(endpoint_stats.to_dict()['runs'] == 3)
@@ -0,0 +1,76 @@
+from typing import Any, Dict
+from portafilter.tracing import Tracer
+from tests import BaseTest
+from portafilter import Validator
+
+
+class RecordingTracer(Tracer):
+
+    def __init__(self):
+        self.spans = []
+        self.open_spans = []
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Any:
+        span = {'name': name, 'attributes': attributes, 'parent': self.open_spans[-1] if self.open_spans else None}
+        self.spans.append(span)
+        self.open_spans.append(span)
+
+        return span
+
+    def end_span(self, span: Any) -> None:
+        assert self.open_spans.pop() is span
+
+
+class TestTracing(BaseTest):
+
+    rules = {
+        'email': 'required|email',
+        'products.*.name': 'required|string',
+    }
+
+    data = {
+        'email': 'espresso@codewithcoffee.dev',
+        'products': [{'name': 'Espresso'}, {'name': 10}],
+    }
+
+    def trace(self, tracer: Tracer) -> Validator:
+        Validator.set_tracer(tracer)
+
+        try:
+            validator = Validator(self.data, Validator.compile(self.rules, name='products'))
+            validator.fails()
+
+        finally:
+            Validator.set_tracer(None)
+
+        return validator
+
+    def test_spans(self):
+        tracer = RecordingTracer()
+        self.trace(tracer)
+
+        names = [_span['name'] for _span in tracer.spans]
+
+        self.assert_true(tracer.open_spans == [])
+        self.assert_true(names.count(Tracer.COMPILE) == 1 and names.count(Tracer.VALIDATE) == 1)
+        self.assert_true(names.count(Tracer.EVALUATE) == 3)
+        self.assert_true(names.count(Tracer.RESOLVE) == 4)
+        self.assert_true(tracer.spans[0]['attributes'] == {'schema': 'products'})
+        self.assert_true(
+            [_span['attributes']['attribute'] for _span in tracer.spans if _span['name'] == Tracer.EVALUATE] ==
+            ['email', 'products.*.name', 'products.*.name']
+        )
+
+        render_spans = [_span for _span in tracer.spans if _span['name'] == Tracer.RENDER]
+
+        self.assert_true(len(render_spans) == 1)
+        self.assert_true(render_spans[0]['attributes'] == {'attribute': 'products.*.name', 'rule': 'string'})
+        self.assert_true(render_spans[0]['parent']['name'] == Tracer.EVALUATE)
+        self.assert_true(render_spans[0]['parent']['parent']['name'] == Tracer.VALIDATE)
+
+    def test_same_errors(self):
+        validator = Validator(self.data, self.rules)
+        validator.fails()
+
+        self.assert_json(self.trace(Tracer()).errors(), validator.errors())
+        self.assert_json(self.trace(RecordingTracer()).errors(), validator.errors())
@@ -0,0 +1,114 @@
+from portafilter.exceptions import ValidationError
+from portafilter.utils import trans
+from tests import BaseTest
+from portafilter import Validator, ValidationPlan
+
+
+class TestValidationPlan(BaseTest):
+
+    rules = {
+        'name': 'required|string|max:10',
+        'password': 'required|same:password_confirmation',
+        'start_date': 'after:2023-01-01',
+        'ingredients.*.name': 'required|string',
+    }
+
+    def test_compile_returns_plan(self):
+        self.assert_true(isinstance(Validator.compile(self.rules), ValidationPlan))
+
+    def test_plan_success(self):
+        plan = Validator.compile(self.rules)
+
+        self.assert_false(
+            plan.errors({
+                'name': 'Espresso',
+                'password': 'robusta',
+                'password_confirmation': 'robusta',
+                'start_date': '2023-01-02',
+                'ingredients': [{'name': 'Robusta'}],
+            })
+        )
+
+    def test_plan_fail(self):
+        plan = Validator.compile(self.rules)
+
+        try:
+            plan.validate({
+                'name': 'Espresso Macchiato',
+                'password': 'robusta',
+                'password_confirmation': 'arabica',
+                'ingredients': [{'name': 'Robusta'}, {}],
+            })
+
+            self.assert_true(False)
+
+        except ValidationError as e:
+            self.assert_json(
+                e.get_errors(),
+                {
+                    'name': [
+                        trans('en.max.string', attributes={'attribute': 'name', 'max': 10}),
+                    ],
+                    'password': [
+                        trans('en.same', attributes={'attribute': 'password', 'other': 'password_confirmation'}),
+                    ],
+                    'ingredients.1.name': [
+                        trans('en.required', attributes={'attribute': 'ingredients.1.name'}),
+                        trans('en.string', attributes={'attribute': 'ingredients.1.name'}),
+                    ],
+                }
+            )
+
+    def test_plan_errors_match_validator(self):
+        plan = Validator.compile(self.rules)
+
+        payloads = [
+            {'name': 'Espresso', 'password': 'robusta', 'password_confirmation': 'robusta'},
+            {'name': None, 'password': 'robusta', 'password_confirmation': 'arabica', 'start_date': '2022-01-01'},
+            {'password': 'arabica', 'password_confirmation': 'arabica', 'ingredients': [{}, {'name': 10}]},
+        ]
+
+        for payload in payloads:
+            validator = Validator(payload, self.rules)
+            validator.fails()
+
+            self.assert_true(plan.errors(payload) == validator.errors())
+
+    def test_plan_reuse_does_not_leak_between_payloads(self):
+        plan = Validator.compile(self.rules)
+
+        payload = {'name': 'Espresso', 'password': 'robusta', 'ingredients': []}
+
+        plan.errors({**payload, 'password_confirmation': 'arabica'})
+
+        self.assert_false(plan.errors({**payload, 'password_confirmation': 'robusta'}))
+
+    def test_validator_with_plan(self):
+        plan = Validator.compile(self.rules)
+
+        validator = Validator({'name': 10, 'password': 'robusta', 'password_confirmation': 'robusta'}, plan)
+
+        self.assert_true(validator.fails())
+
+        self.assert_json(
+            validator.errors(),
+            {
+                'name': [
+                    trans('en.string', attributes={'attribute': 'name'}),
+                ],
+            }
+        )
+
+    def test_validator_revalidation(self):
+        validator = Validator(
+            {
+                'password': 'espresso',
+                'password_confirmation': 'espresso',
+            },
+            {
+                'password': 'required|same:password_confirmation',
+            }
+        )
+
+        self.assert_false(validator.fails())
+        self.assert_false(validator.fails())